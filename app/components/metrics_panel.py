@@ -0,0 +1,68 @@
+# app/components/metrics_panel.py
+
+import pandas as pd
+import streamlit as st
+from src import instrumentation
+from src.pricing.cache import default_cache
+
+def timings_frame(snapshot):
+    """
+    Tabulates the timers of an instrumentation snapshot, slowest stage first.
+
+    Args:
+        snapshot (dict): Output of instrumentation.registry.snapshot().
+
+    Returns:
+        pandas.DataFrame: One row per timer with call counts and times in milliseconds.
+    """
+    rows = []
+    for name, histogram in snapshot['histograms'].items():
+        if histogram['unit'] != 'seconds':
+            continue
+        stage, _, function = name.partition('.')
+        rows.append({
+            'Stage': stage,
+            'Function': function,
+            'Calls': histogram['count'],
+            'Total (ms)': histogram['sum'] * 1e3,
+            'Last (ms)': histogram['last'] * 1e3,
+            'Mean (ms)': histogram['mean'] * 1e3,
+            'p50 (ms)': histogram['p50'] * 1e3,
+            'p99 (ms)': histogram['p99'] * 1e3,
+            'Max (ms)': histogram['max'] * 1e3,
+        })
+    columns = ['Stage', 'Function', 'Calls', 'Total (ms)', 'Last (ms)', 'Mean (ms)', 'p50 (ms)', 'p99 (ms)', 'Max (ms)']
+    return pd.DataFrame(rows, columns=columns).sort_values('Total (ms)', ascending=False, ignore_index=True)
+
+def display_metrics_panel():
+    """
+    Displays per-stage timings and counters collected by src.instrumentation.
+    """
+    with st.expander("⏱️ Performance"):
+        if not instrumentation.enabled():
+            st.info("Instrumentation is disabled; remove OPTIONS_METRICS=0 from the environment to collect timings.")
+            return
+
+        snapshot = instrumentation.registry.snapshot()
+        timings = timings_frame(snapshot)
+        if timings.empty:
+            st.write("No timings recorded yet.")
+        else:
+            st.write("### Time per Stage")
+            st.dataframe(timings.groupby('Stage', as_index=False)[['Calls', 'Total (ms)']].sum()
+                         .sort_values('Total (ms)', ascending=False), hide_index=True)
+            st.write("### Time per Function")
+            st.dataframe(timings, hide_index=True)
+
+        st.write("### Counters")
+        counters = pd.DataFrame(sorted(snapshot['counters'].items()), columns=['Counter', 'Value'])
+        st.dataframe(counters, hide_index=True)
+        cache = default_cache.stats()
+        st.write(f"**Pricing cache:** {cache['size']}/{cache['maxsize']} entries, hit rate {cache['hit_rate']:.1%}")
+
+        col1, col2, col3 = st.columns(3)
+        col1.download_button("Download JSON", instrumentation.registry.to_json(),
+                             file_name="metrics.json", mime="application/json")
+        col2.download_button("Download Prometheus", instrumentation.registry.to_prometheus(),
+                             file_name="metrics.prom", mime="text/plain")
+        col3.button("Reset", on_click=instrumentation.registry.reset)
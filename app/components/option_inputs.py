@@ -1,12 +1,10 @@
 # app/components/option_inputs.py
 
 import streamlit as st
-import yfinance as yf
+from app.market_data import get_market_data_store
 
 def get_stock_price(symbol):
-    stock = yf.Ticker(symbol)
-    data = stock.history(period='1d')
-    return data['Close'].iloc[-1] if not data.empty else None
+    return get_market_data_store().get_spot(symbol)
 
 def stock_symbol_input():
     symbol = st.sidebar.text_input("Symbol", value="TSLA").upper()
@@ -19,18 +17,36 @@ def stock_symbol_input():
     return symbol
 
 def option_chain_selection(symbol):
-    stock = yf.Ticker(symbol)
-    expiration_dates = stock.options  # List of expiration dates
+    store = get_market_data_store()
+    expiration_dates = store.get_expirations(symbol)  # List of expiration dates
     expiration = st.sidebar.selectbox("Select expiration date", expiration_dates)
 
     # Retrieve option chain for the selected expiration date
     if expiration:
-        option_chain = stock.option_chain(expiration)
-        calls = option_chain.calls
-        puts = option_chain.puts
-        return calls, puts
+        return store.get_option_chain(symbol, expiration)
     return None, None
 
+def pricing_engine_input(american=True, key="pricing_engine_select"):
+    """
+    Sidebar selector for the pricing engine (see src.pricing.engines).
+
+    Barone-Adesi-Whaley is the default: it is closed-form and keeps the
+    views interactive. Black-Scholes prices European options only, so it is
+    left out when the option is American.
+
+    Returns:
+        str: The selected engine name.
+    """
+    engines = ["baw", "binomial", "finite_difference"]
+    if not american:
+        engines.insert(1, "black_scholes")
+    return st.sidebar.selectbox(
+        "Pricing Engine",
+        engines,
+        help="Used for the P&L vs. stock price curve. Barone-Adesi-Whaley (American) and Black-Scholes (European) are fast closed-form approximations; Binomial is the slower reference model for final numbers. Finite difference prices the curve from one PDE solve. The P&L surface is always priced with Barone-Adesi-Whaley.",
+        key=key
+    )
+
 def get_option_parameters():
     """
     Collects option parameters from the user via Streamlit sidebar.
@@ -106,6 +122,7 @@ def get_option_parameters():
         help="Select the number of time steps for the Binomial Model (higher for more accuracy).",
         key="time_steps_slider"
     )
+    engine = pricing_engine_input(american)
 
     return {
         "S": S,
@@ -115,5 +132,6 @@ def get_option_parameters():
         "sigma": sigma,
         "option_type": option_type,
         "american": american,
-        "N": N
+        "N": N,
+        "engine": engine
     }
@@ -11,7 +11,6 @@ if project_root not in sys.path:
 
 # Now, proceed with other imports
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import plotly.express as px
 import numpy as np
@@ -26,29 +25,39 @@ def calculate_time_to_expiry(expiration_date):
     return max(T, 0.001)  # Prevent division by zero or negative values
 
 # Import custom modules
-from components.option_inputs import stock_symbol_input
-from src.calculations.pnl import long_call_calculator
-from app.plotting import plot_pnl_chart, price_profit_table
+from components.option_inputs import pricing_engine_input, stock_symbol_input
+from src.calculations.pnl import long_call_calculator, pnl_surface
+from app.plotting import plot_pnl_chart, pnl_vs_stock, price_profit_table
 
-from src.data.data_fetch import get_real_time_price, get_option_chain
+from app.market_data import get_market_data_store
+from src.data.chain import from_frames
+from src import instrumentation
+from components.metrics_panel import display_metrics_panel
 
+# Timings feed the performance panel; set OPTIONS_METRICS=0 to turn them off
+if os.environ.get('OPTIONS_METRICS', '1') != '0':
+    instrumentation.enable()
+
+@instrumentation.timed('app.display_option_chain_as_table')
 def display_option_chain_as_table(symbol, expiration_date):
     """
     Displays the option chain for the given symbol and expiration date.
     Allows users to select specific Call or Put options.
     """
     # Retrieve the option chain for the selected expiration date
-    calls, puts = get_option_chain(symbol, expiration_date)
+    calls, puts = get_market_data_store().get_option_chain(symbol, expiration_date)
 
     if calls is not None and puts is not None:
+        # Keep only the fields we use, as sorted arrays with O(log n) strike lookup
+        call_chain, put_chain = from_frames(calls, puts)
         st.subheader(f"Option Chain for {symbol} - Expiration: {expiration_date}")
         
         # Display calls and puts as non-clickable tables for reference
         st.write("### Calls")
-        st.dataframe(calls[['strike', 'bid', 'ask', 'lastPrice', 'volume', 'openInterest', 'impliedVolatility']], height=300)
+        st.dataframe(call_chain.to_frame(), height=300)
         
         st.write("### Puts")
-        st.dataframe(puts[['strike', 'bid', 'ask', 'lastPrice', 'volume', 'openInterest', 'impliedVolatility']], height=300)
+        st.dataframe(put_chain.to_frame(), height=300)
         
         # Interactive section to select option details
         st.sidebar.subheader("Select Option")
@@ -60,7 +69,7 @@ def display_option_chain_as_table(symbol, expiration_date):
             # Select strike and price for call options
             selected_call_strike = st.sidebar.selectbox(
                 "Call Strike Price", 
-                options=calls['strike'].tolist(), 
+                options=call_chain.strike.tolist(), 
                 key="selected_call_strike"
             )
             selected_call_price_type = st.sidebar.selectbox(
@@ -68,8 +77,9 @@ def display_option_chain_as_table(symbol, expiration_date):
                 options=['bid', 'ask', 'lastPrice'], 
                 key="selected_call_price_type"
             )
-            selected_call_price = calls.loc[calls['strike'] == selected_call_strike, selected_call_price_type].values[0]
-            selected_call_iv = calls.loc[calls['strike'] == selected_call_strike, 'impliedVolatility'].values[0]
+            selected_call = call_chain.row(selected_call_strike)
+            selected_call_price = selected_call[selected_call_price_type]
+            selected_call_iv = selected_call['impliedVolatility']
             
             # Callback function for updating session state
             def set_selected_call_option():
@@ -87,7 +97,7 @@ def display_option_chain_as_table(symbol, expiration_date):
             # Select strike and price for put options
             selected_put_strike = st.sidebar.selectbox(
                 "Put Strike Price", 
-                options=puts['strike'].tolist(), 
+                options=put_chain.strike.tolist(), 
                 key="selected_put_strike"
             )
             selected_put_price_type = st.sidebar.selectbox(
@@ -95,8 +105,9 @@ def display_option_chain_as_table(symbol, expiration_date):
                 options=['bid', 'ask', 'lastPrice'], 
                 key="selected_put_price_type"
             )
-            selected_put_price = puts.loc[puts['strike'] == selected_put_strike, selected_put_price_type].values[0]
-            selected_put_iv = puts.loc[puts['strike'] == selected_put_strike, 'impliedVolatility'].values[0]
+            selected_put = put_chain.row(selected_put_strike)
+            selected_put_price = selected_put[selected_put_price_type]
+            selected_put_iv = selected_put['impliedVolatility']
             
             # Callback function for updating session state
             def set_selected_put_option():
@@ -110,7 +121,8 @@ def display_option_chain_as_table(symbol, expiration_date):
             # Button to update session state with selected put option
             st.sidebar.button("Use Selected Put Option", key="use_put_option", on_click=set_selected_put_option)
 
-def display_chart_and_table(symbol, strike_price, price_per_option, contracts, implied_volatility, expiration_date):
+@instrumentation.timed('app.display_chart_and_table')
+def display_chart_and_table(symbol, strike_price, price_per_option, contracts, implied_volatility, expiration_date, engine='baw'):
     """
     Displays the P&L chart, day-by-day chart, and the price-profit table based on the input parameters.
     """
@@ -119,11 +131,8 @@ def display_chart_and_table(symbol, strike_price, price_per_option, contracts, i
     # Define a reasonable price range around the strike price
     price_range = np.linspace(strike_price * 0.7, strike_price * 1.3, 100)
     
-    # Calculate P&L for each price in the range
-    pnl = []
-    for price in price_range:
-        result = long_call_calculator(price_per_option, contracts, strike_price, price, implied_volatility, time_to_expiry=T)
-        pnl.append(result['pnl'])
+    # Calculate P&L at expiry for the whole range in one pass
+    pnl = pnl_surface(price_range, [0], strike_price, price_per_option, contracts)[0]
     
     # Create DataFrame for plotting
     df_pnl = pd.DataFrame({
@@ -137,12 +146,8 @@ def display_chart_and_table(symbol, strike_price, price_per_option, contracts, i
     
     # Day-by-Day P&L Simulation
     days = 30
-    daily_pnl = []
     daily_prices = np.linspace(strike_price * 0.7, strike_price * 1.3, days)
-    
-    for day, price in enumerate(daily_prices, start=1):
-        result = long_call_calculator(price_per_option, contracts, strike_price, price, implied_volatility, time_to_expiry=T)
-        daily_pnl.append(result['pnl'])
+    daily_pnl = pnl_surface(daily_prices, [0], strike_price, price_per_option, contracts)[0]
     
     df_daily_pnl = pd.DataFrame({
         'Day': range(1, days + 1),
@@ -154,10 +159,42 @@ def display_chart_and_table(symbol, strike_price, price_per_option, contracts, i
     fig_daily_pnl = px.line(df_daily_pnl, x='Day', y='P&L', title='Day-by-Day P&L Simulation')
     st.plotly_chart(fig_daily_pnl, use_container_width=True)
     
+    # P&L surface over underlying price and days remaining until expiry; its
+    # 60,000 points are always priced with the closed-form BAW approximation
+    # so the view stays interactive, and the selected engine is used for the
+    # single curve below
+    if implied_volatility > 0:
+        surface_prices = np.linspace(strike_price * 0.7, strike_price * 1.3, 1000)
+        surface_days = np.linspace(0, T * 365, 60)
+        surface = pnl_surface(surface_prices, surface_days, strike_price, price_per_option, contracts, implied_volatility, engine='baw')
+        
+        fig_surface = px.imshow(
+            surface,
+            x=surface_prices,
+            y=surface_days,
+            aspect='auto',
+            origin='lower',
+            color_continuous_scale='RdYlGn',
+            color_continuous_midpoint=0,
+            labels={'x': 'Stock Price', 'y': 'Days to Expiry', 'color': 'P&L'},
+            title='P&L Surface'
+        )
+        st.plotly_chart(fig_surface, use_container_width=True)
+        
+        # P&L today over a range of stock prices, priced with the selected engine
+        option_params = {'K': strike_price, 'T': T, 'r': 0.01, 'sigma': implied_volatility,
+                         'option_type': 'call', 'american': True, 'N': 100, 'engine': engine}
+        position_params = {'position': 'long', 'initial_premium': price_per_option, 'quantity': contracts}
+        S_range, pnl_today = pnl_vs_stock(option_params, position_params)
+        df_pnl_today = pd.DataFrame({'Stock Price': S_range, 'P&L': pnl_today})
+        fig_pnl_today = px.line(df_pnl_today, x='Stock Price', y='P&L', title=f'P&L vs. Stock Price Today ({engine})')
+        st.plotly_chart(fig_pnl_today, use_container_width=True)
+    
     # Display Price-Profit Table
     st.subheader("Price-Profit Table")
     st.write(df_pnl)
 
+@instrumentation.timed('app.display_calculator')
 def display_calculator(symbol, strike_price, price_per_option, contracts, current_price, implied_volatility, expiration_date):
     """
     Calculates and displays the estimated returns for a long call position.
@@ -176,6 +213,7 @@ def display_calculator(symbol, strike_price, price_per_option, contracts, curren
         st.write("**Probability of Profit:** Calculation not available")
 
 
+@instrumentation.timed('app.rerun')
 def main():
     # Configure the Streamlit page
     st.set_page_config(page_title="American Options Calculator", layout="wide")
@@ -210,15 +248,15 @@ def main():
 
     if symbol:
         # Fetch real-time stock price
-        current_price = get_real_time_price(symbol)
+        store = get_market_data_store()
+        current_price = store.get_spot(symbol)
         if current_price:
             st.sidebar.markdown(f"### Current Price of {symbol}: ${current_price:.2f}")
         else:
             st.sidebar.error("Failed to retrieve current stock price.")
 
         # Fetch expiration dates
-        stock = yf.Ticker(symbol)
-        expiration_dates = stock.options  # List of expiration dates
+        expiration_dates = store.get_expirations(symbol)  # List of expiration dates
 
         if expiration_dates:
             expiration_date = st.sidebar.selectbox("Select Expiration Date", expiration_dates, key="expiration_date_select")
@@ -291,6 +329,9 @@ def main():
         # Contracts input (common to both modes)
         contracts = st.sidebar.number_input("Number of Contracts", min_value=1, value=1, step=1)
 
+        # Engine used for option values before expiry (American options)
+        engine = pricing_engine_input(american=True)
+
         # Callback function to calculate and display results
         def calculate_long_call_callback():
             if input_mode == "Auto-fill":
@@ -314,7 +355,8 @@ def main():
                         st.session_state['price_per_option'], 
                         contracts,
                         st.session_state['implied_volatility'],
-                        expiration_date  # Pass expiration_date here
+                        expiration_date,  # Pass expiration_date here
+                        engine
                     )
             else:
                 if current_price:
@@ -339,7 +381,8 @@ def main():
                         price_per_option, 
                         contracts,
                         implied_volatility,
-                        expiration_date  # Pass expiration_date here
+                        expiration_date,  # Pass expiration_date here
+                        engine
                     )
                 else:
                     st.sidebar.error("Cannot perform calculations without current stock price.")
@@ -347,11 +390,8 @@ def main():
         # Button to calculate long call
         st.sidebar.button("Calculate Long Call", key="calculate_long_call_btn", on_click=calculate_long_call_callback)
 
-        # Optional: Display current session state for debugging
-        # Remove or comment out in production
-        with st.expander("🔍 Debugging Information"):
-            st.write("### Session State")
-            st.write(st.session_state)
+        # Timings and counters of the pricing, data and rendering stages
+        display_metrics_panel()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,23 @@
+# app/market_data.py
+
+import os
+import streamlit as st
+from src.data.store import MarketDataStore
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+@st.cache_resource
+def get_market_data_store():
+    """
+    Returns the market data store shared by every session of the app.
+
+    The snapshot directory defaults to data/store in the project root and can
+    be moved with OPTIONS_DATA_DIR; set OPTIONS_OFFLINE=1 to serve recorded
+    snapshots only. The app keeps the newest OPTIONS_KEEP_SNAPSHOTS (10 by
+    default) snapshots of each kind of data so the directory does not grow
+    without bound; set it to 0 to keep every snapshot for replay.
+    """
+    root = os.environ.get('OPTIONS_DATA_DIR', os.path.join(project_root, 'data', 'store'))
+    offline = os.environ.get('OPTIONS_OFFLINE', '') == '1'
+    keep = int(os.environ.get('OPTIONS_KEEP_SNAPSHOTS', '10')) or None
+    return MarketDataStore(root, offline=offline, keep=keep)
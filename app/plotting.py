@@ -4,21 +4,22 @@ import matplotlib.pyplot as plt
 import numpy as np
 import streamlit as st
 import pandas as pd
-from src.pricing.binomial_model import binomial_option_price
-from src.calculations.pnl import calculate_pnl
+from src.pricing.cache import default_cache
+from src.pricing.engines import option_price
+from src.calculations.pnl import calculate_pnl, pnl_surface
+from src import instrumentation
 
+@instrumentation.timed('plotting.price_profit_table')
 def price_profit_table(strike_price, price_per_option, contracts, price_range):
-    data = []
-    for price in price_range:
-        profit = max(0, price - strike_price) * contracts * 100 - (price_per_option * contracts * 100)
-        percent_change = (profit / (price_per_option * contracts * 100)) * 100
-        data.append([price, profit, percent_change])
+    profits = pnl_surface(price_range, [0], strike_price, price_per_option, contracts)[0]
+    percent_change = (profits / (price_per_option * contracts * 100)) * 100
 
-    df = pd.DataFrame(data, columns=["Stock Price", "Profit/Loss", "% Change"])
+    df = pd.DataFrame({"Stock Price": price_range, "Profit/Loss": profits, "% Change": percent_change})
     st.write(df)
     
+@instrumentation.timed('plotting.plot_pnl_chart')
 def plot_pnl_chart(strike_price, price_per_option, contracts, price_range):
-    profits = [(max(0, price - strike_price) * contracts * 100 - (price_per_option * contracts * 100)) for price in price_range]
+    profits = pnl_surface(price_range, [0], strike_price, price_per_option, contracts)[0]
     
     plt.figure(figsize=(10, 6))
     plt.plot(price_range, profits, label="P&L")
@@ -29,38 +30,48 @@ def plot_pnl_chart(strike_price, price_per_option, contracts, price_range):
     plt.legend()
     st.pyplot(plt)    
 
-def plot_pnl_vs_stock(option_params, position_params):
+@instrumentation.timed('plotting.pnl_vs_stock')
+def pnl_vs_stock(option_params, position_params, points=100):
     """
-    Plots the Profit and Loss (P&L) against a range of underlying stock prices.
+    Calculates the P&L of a position over a range of underlying stock prices.
 
     Args:
         option_params (dict): Parameters for option pricing.
         position_params (dict): Parameters for position P&L calculation.
-    """
-    st.subheader("📊 P&L vs. Underlying Stock Price")
+        points (int): Number of stock prices in the range.
 
+    Returns:
+        tuple: The stock prices (50% to 150% of the strike) and the P&L at each.
+    """
     # Define a range of stock prices (e.g., 50% to 150% of strike price)
     S_min = option_params['K'] * 0.5
     S_max = option_params['K'] * 1.5
-    S_range = np.linspace(S_min, S_max, 100)
+    S_range = np.linspace(S_min, S_max, points)
 
-    pnl_values = []
+    # Price the whole range in one call with the selected pricing engine;
+    # tree prices are reused across Streamlit reruns, and the
+    # finite-difference engine covers the range with a single solve
+    current_option_params = option_params.copy()
+    current_option_params['S'] = S_range
+    current_premium = option_price(**current_option_params, cache=default_cache)
 
-    for S in S_range:
-        # Update the stock price in option parameters
-        current_option_params = option_params.copy()
-        current_option_params['S'] = S
+    # Calculate P&L for every price at once
+    current_position_params = position_params.copy()
+    current_position_params['current_premium'] = current_premium
+    return S_range, calculate_pnl(**current_position_params)
 
-        # Calculate current premium using the binomial model
-        current_premium = binomial_option_price(**current_option_params)
+@instrumentation.timed('plotting.plot_pnl_vs_stock')
+def plot_pnl_vs_stock(option_params, position_params):
+    """
+    Plots the Profit and Loss (P&L) against a range of underlying stock prices.
 
-        # Update current premium in position parameters
-        current_position_params = position_params.copy()
-        current_position_params['current_premium'] = current_premium
+    Args:
+        option_params (dict): Parameters for option pricing.
+        position_params (dict): Parameters for position P&L calculation.
+    """
+    st.subheader("📊 P&L vs. Underlying Stock Price")
 
-        # Calculate P&L
-        pnl = calculate_pnl(**current_position_params)
-        pnl_values.append(pnl)
+    S_range, pnl_values = pnl_vs_stock(option_params, position_params)
 
     # Plotting
     plt.figure(figsize=(10, 6))
@@ -0,0 +1,167 @@
+# benchmarks/cases.py
+
+import numpy as np
+from benchmarks.fixtures import VALUATION_DATE, load_chains
+from benchmarks.harness import Case
+from src.calculations.pnl import long_call_calculator, pnl_surface
+from src.pricing.binomial_model import binomial_option_price
+from src.pricing.batch import price_option_chain
+from src.pricing.black_scholes import black_scholes_price
+from src.pricing.cache import default_cache
+from src.pricing.engines import PRICING_ENGINES
+from src.pricing.greeks import batch_greeks
+from src.pricing.implied_vol import chain_implied_volatility
+
+STEPS = (50, 100, 250, 500, 1000, 2500, 5000)
+QUICK_STEPS = (50, 500)
+CONVERGENCE_STEPS = (25, 50, 100, 200, 400, 800, 1600)
+CONVERGENCE_ENGINES = ('binomial', 'trinomial', 'adaptive_mesh', 'finite_difference')
+
+# Contract of the convergence cases; the strike sits between binomial nodes
+CONVERGENCE_CONTRACT = (100.0, 105.0, 0.5, 0.01, 0.25, 'put')
+# Steps of the smoothed, extrapolated binomial tree taken as the exact
+# American price
+REFERENCE_STEPS = 20000
+
+def _binomial_cases(steps):
+    cases = []
+    for N in steps:
+        for option_type in ('call', 'put'):
+            for american in (True, False):
+                style = 'american' if american else 'european'
+                setup = lambda N=N, option_type=option_type, american=american: (
+                    lambda: binomial_option_price(100.0, 105.0, 0.5, 0.01, 0.25, option_type, american, N)
+                )
+                params = {'N': N, 'option_type': option_type, 'american': american}
+                cases.append(Case(f"binomial/{option_type}/{style}/N={N}", 'binomial', setup, params))
+    return cases
+
+_reference_prices = {}
+
+def _reference_price(american):
+    if american not in _reference_prices:
+        if american:
+            price = binomial_option_price(*CONVERGENCE_CONTRACT, True, REFERENCE_STEPS, method='bbsr')
+        else:
+            price = black_scholes_price(*CONVERGENCE_CONTRACT)
+        _reference_prices[american] = float(price)
+    return _reference_prices[american]
+
+def _convergence_cases(steps):
+    """
+    Price one contract with each lattice engine over a range of N. Setting
+    up a case records its absolute pricing error in the case's params, so
+    the results trace error against time per engine.
+    """
+    cases = []
+    for engine in CONVERGENCE_ENGINES:
+        for american in (True, False):
+            style = 'american' if american else 'european'
+            for N in steps:
+                params = {'engine': engine, 'american': american, 'N': N}
+
+                def setup(engine=engine, american=american, N=N, params=params):
+                    pricer = PRICING_ENGINES[engine]
+                    price = float(pricer(*CONVERGENCE_CONTRACT, american, N))
+                    params['error'] = abs(price - _reference_price(american))
+                    return lambda: pricer(*CONVERGENCE_CONTRACT, american, N)
+                cases.append(Case(f"convergence/{engine}/{style}/N={N}", 'convergence', setup, params))
+    return cases
+
+def _chain_inputs(expiration):
+    S, chains = load_chains()
+    calls, puts = chains[expiration]
+    T = (np.datetime64(expiration) - np.datetime64(VALUATION_DATE)).astype(int) / 365
+    return S, T, calls, puts
+
+def _chain_cases():
+    cases = []
+    expiration = '2025-01-17'
+    for N in (100, 500):
+        def setup(N=N):
+            S, T, calls, puts = _chain_inputs(expiration)
+            return lambda: (price_option_chain(calls, S, T, 0.01, 'call', N=N),
+                            price_option_chain(puts, S, T, 0.01, 'put', N=N))
+        cases.append(Case(f"chain/price/N={N}", 'chain', setup, {'N': N, 'expiration': expiration}))
+
+    def iv_setup():
+        S, T, calls, puts = _chain_inputs(expiration)
+        return lambda: (chain_implied_volatility(calls, S, T, 0.01, 'call'),
+                        chain_implied_volatility(puts, S, T, 0.01, 'put'))
+    cases.append(Case('chain/implied_volatility/N=100', 'chain', iv_setup, {'N': 100, 'expiration': expiration}))
+
+    def greeks_setup():
+        S, T, calls, puts = _chain_inputs(expiration)
+        K = np.concatenate([calls['strike'], puts['strike']])
+        sigma = np.concatenate([calls['impliedVolatility'], puts['impliedVolatility']])
+        option_type = np.repeat(['call', 'put'], [len(calls), len(puts)])
+        return lambda: batch_greeks(S, K, T, 0.01, sigma, option_type)
+    cases.append(Case('chain/greeks/N=100', 'chain', greeks_setup, {'N': 100, 'expiration': expiration}))
+    return cases
+
+def _plotting_cases():
+    # Imported here so the other benchmarks run without Streamlit
+    from app.plotting import pnl_vs_stock
+
+    option_params = {'K': 100.0, 'T': 0.5, 'r': 0.01, 'sigma': 0.25, 'option_type': 'call', 'american': True, 'N': 100}
+    position_params = {'position': 'long', 'initial_premium': 7.5, 'quantity': 1}
+
+    def vs_stock_cold():
+        def run():
+            default_cache.clear()
+            pnl_vs_stock(option_params, position_params)
+        return run
+
+    def vs_stock_warm():
+        return lambda: pnl_vs_stock(option_params, position_params)
+
+    def vs_stock_finite_difference():
+        return lambda: pnl_vs_stock({**option_params, 'engine': 'finite_difference'}, position_params)
+
+    # The price-profit table and expiry chart in app/plotting.py, and the
+    # P&L surface drawn by the app (1000 prices x 60 days)
+    expiry_prices = np.linspace(70, 130, 100)
+    surface_prices = np.linspace(70, 130, 1000)
+    surface_days = np.linspace(0, 182, 60)
+    return [
+        Case('plotting/pnl_vs_stock/cold', 'plotting', vs_stock_cold, {'points': 100, 'N': 100}),
+        Case('plotting/pnl_vs_stock/warm', 'plotting', vs_stock_warm, {'points': 100, 'N': 100}),
+        Case('plotting/pnl_vs_stock/finite_difference', 'plotting', vs_stock_finite_difference,
+             {'points': 100, 'N': 100, 'engine': 'finite_difference'}),
+        Case('plotting/pnl_at_expiry', 'plotting',
+             lambda: (lambda: pnl_surface(expiry_prices, [0], 100.0, 7.5, 1)), {'points': 100}),
+        Case('plotting/pnl_surface', 'plotting',
+             lambda: (lambda: pnl_surface(surface_prices, surface_days, 100.0, 7.5, 1, 0.25)),
+             {'points': 1000, 'days': 60, 'engine': 'baw'}),
+    ]
+
+def _calculator_cases():
+    setup = lambda: (lambda: long_call_calculator(7.5, 1, 100.0, 102.0, 0.25, time_to_expiry=0.5))
+    return [Case('calculator/long_call', 'calculator', setup, {})]
+
+GROUPS = {
+    'binomial': lambda quick: _binomial_cases(QUICK_STEPS if quick else STEPS),
+    'convergence': lambda quick: _convergence_cases(QUICK_STEPS if quick else CONVERGENCE_STEPS),
+    'chain': lambda quick: _chain_cases(),
+    'plotting': lambda quick: _plotting_cases(),
+    'calculator': lambda quick: _calculator_cases(),
+}
+
+def build_cases(groups=None, quick=False, pattern=None):
+    """
+    Collect the benchmark cases of the selected groups.
+
+    Parameters:
+    groups : iterable of str, optional
+        Keys of GROUPS; defaults to all
+    quick : bool
+        Measure a reduced set of lattice sizes
+    pattern : str, optional
+        Keep only cases whose name contains this substring
+    """
+    groups = tuple(groups or GROUPS)
+    unknown = set(groups) - set(GROUPS)
+    if unknown:
+        raise ValueError(f"groups must be among {tuple(GROUPS)}")
+    cases = [case for group in groups for case in GROUPS[group](quick)]
+    return [case for case in cases if pattern is None or pattern in case.name]
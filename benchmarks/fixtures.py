@@ -0,0 +1,73 @@
+# benchmarks/fixtures.py
+
+import os
+from datetime import date, datetime, timezone
+import numpy as np
+import pandas as pd
+from src.data.store import MarketDataStore
+from src.pricing.black_scholes import black_scholes_price
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+# The recorded chains are valued as of this date, so times to expiry (and
+# therefore the work per benchmark) never drift
+VALUATION_DATE = date(2024, 10, 18)
+SYMBOL = 'BENCH'
+SPOT = 100.0
+EXPIRATIONS = ('2024-11-15', '2024-12-20', '2025-01-17', '2025-06-20')
+STRIKES = np.arange(50.0, 150.5, 1.0)
+
+_RECORDED_AT = datetime(2024, 10, 18, 15, 0, tzinfo=timezone.utc).timestamp()
+
+def _side(option_type, T, rng):
+    k = np.log(STRIKES / SPOT)
+    iv = 0.22 - 0.15 * k + 0.35 * k**2 + 0.02 / np.sqrt(T) * k**2
+    mid = black_scholes_price(SPOT, STRIKES, T, 0.01, iv, option_type)
+    half_spread = np.maximum(0.01, 0.02 * mid) * rng.uniform(0.5, 1.5, STRIKES.size)
+    prefix = 'C' if option_type == 'call' else 'P'
+    return pd.DataFrame({
+        'contractSymbol': [f"{SYMBOL}{prefix}{strike:08.0f}" for strike in STRIKES * 1000],
+        'strike': STRIKES,
+        'lastPrice': np.round(mid * rng.uniform(0.98, 1.02, STRIKES.size), 2),
+        'bid': np.round(np.maximum(mid - half_spread, 0.0), 2),
+        'ask': np.round(mid + half_spread, 2),
+        'volume': rng.integers(0, 500, STRIKES.size).astype(float),
+        'openInterest': rng.integers(0, 5000, STRIKES.size),
+        'impliedVolatility': iv,
+    })
+
+def record_fixtures(root=FIXTURE_DIR, seed=0):
+    """
+    Write the chain snapshots the benchmarks replay offline, in the
+    MarketDataStore layout. The chains are synthetic (a smile priced with
+    Black-Scholes plus noisy spreads) and deterministic for a given seed.
+    """
+    rng = np.random.default_rng(seed)
+    store = MarketDataStore(root, offline=True)
+    store.save('spot', SYMBOL, SPOT, fetched_at=_RECORDED_AT)
+    store.save('expirations', SYMBOL, EXPIRATIONS, fetched_at=_RECORDED_AT)
+    for expiration in EXPIRATIONS:
+        T = (date.fromisoformat(expiration) - VALUATION_DATE).days / 365
+        chain = (_side('call', T, rng), _side('put', T, rng))
+        store.save('chain', SYMBOL, chain, expiration, fetched_at=_RECORDED_AT)
+
+def load_chains(root=FIXTURE_DIR):
+    """
+    Replay the recorded chains.
+
+    Returns:
+    S : float
+        Recorded spot price
+    chains : dict
+        expiration -> (calls, puts) DataFrames
+    """
+    store = MarketDataStore(root, offline=True)
+    S = store.get_spot(SYMBOL)
+    if S is None:
+        raise LookupError(f"no recorded fixtures under {root}; run python -m benchmarks.fixtures")
+    chains = {expiration: store.get_option_chain(SYMBOL, expiration)
+              for expiration in store.get_expirations(SYMBOL)}
+    return S, chains
+
+if __name__ == '__main__':
+    record_fixtures()
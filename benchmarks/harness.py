@@ -0,0 +1,131 @@
+# benchmarks/harness.py
+
+import json
+import platform
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import numpy as np
+
+# A benchmark is a regression when it is this much slower than the baseline
+DEFAULT_THRESHOLD = 0.25
+
+@dataclass(frozen=True)
+class Case:
+    """
+    One benchmark.
+
+    Attributes:
+    name : str
+        Unique name, e.g. 'binomial/call/american/N=500'
+    group : str
+        Area of the code measured
+    setup : callable
+        Returns the zero-argument function to time; work done here (data
+        loading, warm-up) is not timed
+    params : dict
+        Parameters recorded with the result; setup may add to it, e.g. the
+        pricing error of a convergence case
+    """
+    name: str
+    group: str
+    setup: object
+    params: dict
+
+def measure(fn, repeat=5, min_time=0.05):
+    """
+    Time a function.
+
+    The number of calls per repeat is calibrated so one repeat takes at
+    least min_time seconds, then `repeat` repeats are timed.
+
+    Returns:
+    timing : dict
+        'best' and 'median' seconds per call, 'calls' per repeat and
+        'repeat'
+    """
+    fn()
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2 if elapsed == 0 else max(2, int(np.ceil(min_time / elapsed)))
+
+    samples = [elapsed / calls]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        samples.append((time.perf_counter() - start) / calls)
+    return {'best': min(samples), 'median': float(np.median(samples)), 'calls': calls, 'repeat': repeat}
+
+def run_cases(cases, repeat=5, min_time=0.05, log=None):
+    """
+    Set up and time each case.
+
+    Returns:
+    results : dict
+        name -> timing (see measure) plus the case's group and params
+    """
+    results = {}
+    for case in cases:
+        timing = measure(case.setup(), repeat, min_time)
+        results[case.name] = {'group': case.group, 'params': case.params, **timing}
+        if log is not None:
+            log(f"{case.name:<50} {timing['best'] * 1e3:12.3f} ms")
+    return results
+
+def environment():
+    """
+    Describe the machine the results were measured on.
+    """
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+    }
+
+def save_results(path, results):
+    with open(path, 'w') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=2, sort_keys=True)
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)['results']
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD, stat='best'):
+    """
+    Compare results with a baseline.
+
+    Parameters:
+    results, baseline : dict
+        name -> timing, as returned by run_cases or load_results
+    threshold : float
+        Relative slowdown beyond which a benchmark is a regression
+    stat : str
+        'best' or 'median'
+
+    Returns:
+    rows : list of dict
+        One per benchmark present in both, with 'name', 'baseline',
+        'current', 'ratio' (current / baseline) and 'status':
+        'regression', 'improvement' or 'ok'
+    """
+    rows = []
+    for name in sorted(set(results) & set(baseline)):
+        old, new = baseline[name][stat], results[name][stat]
+        ratio = new / old if old > 0 else np.inf
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({'name': name, 'baseline': old, 'current': new, 'ratio': ratio, 'status': status})
+    return rows
@@ -0,0 +1,183 @@
+# benchmarks/load_test.py
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+import numpy as np
+
+ENDPOINTS = ('price', 'greeks', 'iv', 'pnl')
+
+class Connection:
+    """
+    Minimal keep-alive HTTP/1.1 client for JSON requests.
+    """
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self._reader = self._writer = None
+
+    async def request(self, method, path, payload=None):
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        body = b'' if payload is None else json.dumps(payload).encode()
+        self._writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await self._writer.drain()
+        status = int((await self._reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self._reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        content = await self._reader.readexactly(length)
+        return status, content
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+
+def make_payload(endpoint, rng, contracts=1, N=100, engine='binomial'):
+    """
+    Build a random request body around S = 100.
+    """
+    K = np.round(rng.uniform(80, 120, contracts), 1).tolist()
+    T = np.round(rng.uniform(0.05, 1.0, contracts), 3).tolist()
+    payload = {'S': 100.0, 'K': K, 'T': T, 'r': 0.01, 'option_type': rng.choice(['call', 'put']), 'N': N}
+    if endpoint == 'iv':
+        payload['price'] = np.round(rng.uniform(2.0, 8.0, contracts), 2).tolist()
+    else:
+        payload['sigma'] = np.round(rng.uniform(0.15, 0.4, contracts), 3).tolist()
+    if endpoint in ('price', 'pnl'):
+        payload['engine'] = engine
+    if endpoint == 'pnl':
+        payload.update(position='long', entry_price=5.0, quantity=1)
+    return payload
+
+async def run_load(host, port, endpoint='price', concurrency=32, requests=2000, contracts=1, N=100,
+                   engine='binomial', seed=0):
+    """
+    Send `requests` requests from `concurrency` concurrent keep-alive clients.
+
+    Returns:
+    report : dict
+        Request count, errors, elapsed seconds, requests per second and
+        latency percentiles in milliseconds
+    """
+    rng = np.random.default_rng(seed)
+    payloads = [make_payload(endpoint, rng, contracts, N, engine) for _ in range(requests)]
+    latencies = []
+    errors = 0
+    queue = iter(payloads)
+
+    async def client():
+        nonlocal errors
+        connection = Connection(host, port)
+        try:
+            for payload in queue:
+                start = time.perf_counter()
+                status, _ = await connection.request('POST', f'/{endpoint}', payload)
+                latencies.append(time.perf_counter() - start)
+                errors += status != 200
+        finally:
+            await connection.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    connection = Connection(host, port)
+    _, health = await connection.request('GET', '/health')
+    await connection.close()
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e3
+    return {
+        'endpoint': endpoint,
+        'requests': len(latencies),
+        'errors': errors,
+        'concurrency': concurrency,
+        'contracts_per_request': contracts,
+        'elapsed': elapsed,
+        'requests_per_second': len(latencies) / elapsed,
+        'p50_ms': p50,
+        'p90_ms': p90,
+        'p99_ms': p99,
+        'max_ms': max(latencies) * 1e3,
+        'batches': json.loads(health)['batches'],
+    }
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def start_service(port, window):
+    """
+    Start the pricing service in a subprocess and wait until it answers.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'src.service', '--port', str(port), '--window', str(window)],
+        cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("pricing service did not start")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the pricing service.")
+    parser.add_argument('--url', help="service to test, e.g. http://127.0.0.1:8000 (default: start one locally)")
+    parser.add_argument('--endpoint', default='price', choices=ENDPOINTS)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--contracts', type=int, default=1, help="contracts per request")
+    parser.add_argument('--steps', type=int, default=100, help="Binomial time steps")
+    parser.add_argument('--engine', default='binomial')
+    parser.add_argument('--window', type=float, default=0.002, help="batching window of a locally started service")
+    parser.add_argument('--output', help="write the report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = '127.0.0.1', _free_port()
+        process = start_service(port, args.window)
+    try:
+        report = asyncio.run(run_load(host, port, args.endpoint, args.concurrency, args.requests,
+                                      args.contracts, args.steps, args.engine))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print(f"{report['requests']} requests to /{report['endpoint']} ({report['errors']} errors) "
+          f"in {report['elapsed']:.2f}s: {report['requests_per_second']:,.0f} req/s")
+    print(f"latency p50 {report['p50_ms']:.2f} ms, p90 {report['p90_ms']:.2f} ms, "
+          f"p99 {report['p99_ms']:.2f} ms, max {report['max_ms']:.2f} ms; {report['batches']} batches")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 1 if report['errors'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# benchmarks/run.py
+
+import argparse
+import os
+import sys
+from benchmarks.cases import GROUPS, build_cases
+from benchmarks.harness import DEFAULT_THRESHOLD, compare, load_results, run_cases, save_results
+
+def format_comparison(rows):
+    lines = [f"{'benchmark':<50} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}  status"]
+    for row in rows:
+        lines.append(
+            f"{row['name']:<50} {row['baseline'] * 1e3:12.3f} {row['current'] * 1e3:12.3f} "
+            f"{row['ratio']:7.2f}  {row['status']}"
+        )
+    return '\n'.join(lines)
+
+def format_convergence(results):
+    """
+    Tabulate pricing error against time for the convergence cases.
+    """
+    rows = [(result['params'], result['best']) for result in results.values() if result['group'] == 'convergence']
+    rows.sort(key=lambda row: (row[0]['american'], row[0]['engine'], row[0]['N']))
+    lines = [f"{'engine':<15} {'style':<9} {'N':>6} {'error':>10} {'time ms':>10}"]
+    for params, best in rows:
+        style = 'american' if params['american'] else 'european'
+        lines.append(f"{params['engine']:<15} {style:<9} {params['N']:>6} {params['error']:10.2e} {best * 1e3:10.3f}")
+    return '\n'.join(lines)
+
+def plot_convergence(results, path):
+    """
+    Plot pricing error against time on log-log axes, one line per engine
+    and one panel per exercise style, and save the figure to `path`.
+    """
+    from matplotlib.figure import Figure
+
+    series = {}
+    for result in results.values():
+        if result['group'] == 'convergence':
+            params = result['params']
+            series.setdefault((params['american'], params['engine']), []).append(
+                (result['best'] * 1e3, params['error'], params['N'])
+            )
+    figure = Figure(figsize=(11, 4.5))
+    axes = figure.subplots(1, 2, sharey=True)
+    for ax, american in zip(axes, (True, False)):
+        for (style, engine), points in sorted(series.items()):
+            if style != american:
+                continue
+            times, errors, _ = zip(*sorted(points, key=lambda point: point[2]))
+            ax.loglog(times, errors, marker='o', label=engine)
+        ax.set_title('American' if american else 'European')
+        ax.set_xlabel('time per price (ms)')
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend()
+    axes[0].set_ylabel('absolute pricing error')
+    figure.tight_layout()
+    figure.savefig(path, dpi=120)
+    return path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the pricing, P&L and data-path benchmarks.")
+    parser.add_argument('--group', action='append', choices=sorted(GROUPS),
+                        help="benchmark group to run (repeatable; default all)")
+    parser.add_argument('--filter', help="only run benchmarks whose name contains this text")
+    parser.add_argument('--quick', action='store_true', help="measure fewer lattice sizes")
+    parser.add_argument('--repeat', type=int, default=5, help="timed repeats per benchmark")
+    parser.add_argument('--min-time', type=float, default=0.05, help="minimum seconds per repeat")
+    parser.add_argument('--output', default='bench_output.json', help="where to write the results")
+    parser.add_argument('--baseline', help="results file to compare against")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown reported as a regression")
+    args = parser.parse_args(argv)
+
+    cases = build_cases(args.group, args.quick, args.filter)
+    results = run_cases(cases, args.repeat, args.min_time, log=print)
+    save_results(args.output, results)
+    print(f"Wrote {len(results)} results to {args.output}")
+    if any(result['group'] == 'convergence' for result in results.values()):
+        print(format_convergence(results))
+        plot = plot_convergence(results, os.path.splitext(args.output)[0] + '_convergence.png')
+        print(f"Wrote error-against-time plot to {plot}")
+
+    if args.baseline:
+        rows = compare(results, load_results(args.baseline), args.threshold)
+        print(format_comparison(rows))
+        regressions = [row['name'] for row in rows if row['status'] == 'regression']
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
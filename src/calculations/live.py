@@ -0,0 +1,297 @@
+# src/calculations/live.py
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import timezone
+from dateutil import parser
+import numpy as np
+from src.pricing.greeks import batch_greeks
+from src.pricing.payoff import payoff_sign
+from src import instrumentation
+
+GREEKS = ('delta', 'gamma', 'theta', 'vega', 'rho')
+
+_SECONDS_PER_YEAR = 365 * 24 * 3600
+
+# Shortest time to expiry priced, so contracts expiring today stay finite
+_MIN_T = 1e-6
+
+@dataclass(frozen=True)
+class LivePosition:
+    """
+    An option position held in a LiveBook.
+
+    Attributes:
+    contract : str
+        Contract identifier matching the quote ticks
+    symbol : str
+        Underlying symbol
+    option_type : str
+        'call' or 'put'
+    strike : float
+        Strike price
+    expiration : str
+        Expiration date
+    quantity : int
+        Number of contracts (1 contract = 100 options)
+    side : str
+        'long' or 'short'
+    entry_price : float
+        Premium paid (long) or received (short) per option
+    implied_volatility : float
+        Volatility used until a quote tick provides one
+    """
+    contract: str
+    symbol: str
+    option_type: str
+    strike: float
+    expiration: str
+    quantity: int = 1
+    side: str = 'long'
+    entry_price: float = 0.0
+    implied_volatility: float = 0.2
+
+    def __post_init__(self):
+        payoff_sign(self.option_type)
+        if self.side.lower() not in ('long', 'short'):
+            raise ValueError("side must be 'long' or 'short'")
+
+@dataclass(frozen=True)
+class BookUpdate:
+    """
+    Changes published after a batch of ticks.
+
+    Attributes:
+    time : float
+        Event time of the latest tick applied
+    changes : dict
+        contract -> {'value', 'pnl', 'pnl_change', 'delta', ...} for the
+        positions that were repriced; Greeks are position-level
+    totals : dict
+        Book-level 'pnl' and Greeks
+    ticks : int
+        Number of ticks coalesced into this update
+    latency : float
+        Seconds from receipt of the oldest tick to the update
+    """
+    time: float
+    changes: dict
+    totals: dict
+    ticks: int
+    latency: float
+
+class LatencyRecorder:
+    """
+    Keep the most recent latency samples and summarize them.
+    """
+
+    def __init__(self, maxlen=100_000):
+        self._samples = deque(maxlen=maxlen)
+
+    def record(self, seconds):
+        self._samples.append(seconds)
+
+    def summary(self):
+        """
+        Return count, mean, p50, p99 and max latency in seconds.
+        """
+        if not self._samples:
+            return {'count': 0, 'mean': 0.0, 'p50': 0.0, 'p99': 0.0, 'max': 0.0}
+        samples = np.fromiter(self._samples, dtype=float)
+        p50, p99 = np.percentile(samples, [50, 99])
+        return {'count': samples.size, 'mean': samples.mean(), 'p50': p50, 'p99': p99, 'max': samples.max()}
+
+class LiveBook:
+    """
+    Positions valued incrementally from a stream of ticks.
+
+    apply() records each tick's inputs; reprice() revalues, in one batched
+    Binomial call, only the positions whose spot moved by more than
+    spot_threshold (relative), whose volatility moved by more than
+    vol_threshold (absolute), or that were last priced more than
+    time_threshold seconds of event time ago.
+
+    Parameters:
+    positions : sequence of LivePosition
+        Positions in the book
+    risk_free_rate : float
+        Annual risk-free interest rate
+    american : bool
+        True for American options, False for European
+    N : int
+        Number of time steps of the Binomial lattice
+    spot_threshold : float
+        Relative spot move that triggers repricing
+    vol_threshold : float
+        Absolute volatility move that triggers repricing
+    time_threshold : float
+        Seconds of event time after which positions are repriced for decay
+    """
+
+    def __init__(self, positions, risk_free_rate=0.01, american=True, N=50,
+                 spot_threshold=1e-3, vol_threshold=5e-3, time_threshold=60.0):
+        self.positions = tuple(positions)
+        self.risk_free_rate = risk_free_rate
+        self.american = american
+        self.N = N
+        self.spot_threshold = spot_threshold
+        self.vol_threshold = vol_threshold
+        self.time_threshold = time_threshold
+        self.latency = LatencyRecorder()
+        self.time = -np.inf
+
+        self._index = {p.contract: i for i, p in enumerate(self.positions)}
+        self._by_symbol = {}
+        for i, p in enumerate(self.positions):
+            self._by_symbol.setdefault(p.symbol.upper(), []).append(i)
+        self._option_type = np.array([p.option_type.lower() for p in self.positions])
+        self._strike = np.array([p.strike for p in self.positions], dtype=float)
+        self._expiry = np.array([
+            parser.parse(p.expiration).replace(tzinfo=timezone.utc).timestamp() for p in self.positions
+        ])
+        self._weight = np.array([(1 if p.side.lower() == 'long' else -1) * p.quantity * 100 for p in self.positions], dtype=float)
+        self._entry = np.array([p.entry_price for p in self.positions], dtype=float)
+
+        # Current inputs, and the inputs each position was last priced with
+        size = len(self.positions)
+        self._spot = np.full(size, np.nan)
+        self._sigma = np.array([p.implied_volatility for p in self.positions], dtype=float)
+        self._priced_spot = np.full(size, np.nan)
+        self._priced_sigma = np.full(size, np.nan)
+        self._priced_time = np.full(size, np.nan)
+
+        self._value = np.full(size, np.nan)
+        self._pnl = np.zeros(size)
+        self._greeks = {name: np.zeros(size) for name in GREEKS}
+
+    def apply(self, tick):
+        """
+        Record the inputs carried by one tick.
+        """
+        self.time = max(self.time, tick.time)
+        if tick.kind == 'spot':
+            positions = self._by_symbol.get(tick.symbol.upper())
+            if positions:
+                self._spot[positions] = tick.price
+        else:
+            i = self._index.get(tick.contract)
+            if i is not None and tick.iv is not None and tick.iv > 0:
+                self._sigma[i] = tick.iv
+
+    def stale(self):
+        """
+        Return a mask of positions whose inputs moved beyond the thresholds.
+        """
+        with np.errstate(invalid='ignore'):
+            moved = (
+                np.isnan(self._priced_spot)
+                | (np.abs(self._spot / self._priced_spot - 1) > self.spot_threshold)
+                | (np.abs(self._sigma - self._priced_sigma) > self.vol_threshold)
+                | (self.time - self._priced_time > self.time_threshold)
+            )
+        return moved & ~np.isnan(self._spot)
+
+    @instrumentation.timed('calculations.live_reprice')
+    def reprice(self):
+        """
+        Revalue the stale positions.
+
+        Returns:
+        changes : dict
+            contract -> value, P&L, P&L change and position Greeks of each
+            repriced position
+        """
+        idx = np.flatnonzero(self.stale())
+        if not idx.size:
+            return {}
+
+        T = np.maximum((self._expiry[idx] - self.time) / _SECONDS_PER_YEAR, _MIN_T)
+        greeks = batch_greeks(
+            self._spot[idx], self._strike[idx], T, self.risk_free_rate, self._sigma[idx],
+            self._option_type[idx], self.american, self.N,
+        )
+        weight = self._weight[idx]
+        pnl = weight * (greeks['price'] - self._entry[idx])
+        pnl_change = pnl - self._pnl[idx]
+
+        self._value[idx] = greeks['price']
+        self._pnl[idx] = pnl
+        for name in GREEKS:
+            self._greeks[name][idx] = weight * greeks[name]
+        self._priced_spot[idx] = self._spot[idx]
+        self._priced_sigma[idx] = self._sigma[idx]
+        self._priced_time[idx] = self.time
+
+        changes = {}
+        for n, i in enumerate(idx):
+            change = {'value': float(greeks['price'][n]), 'pnl': float(pnl[n]), 'pnl_change': float(pnl_change[n])}
+            change.update({name: float(self._greeks[name][i]) for name in GREEKS})
+            changes[self.positions[i].contract] = change
+        return changes
+
+    def totals(self):
+        """
+        Return book-level P&L and Greeks over the priced positions.
+        """
+        totals = {'pnl': float(self._pnl.sum())}
+        totals.update({name: float(values.sum()) for name, values in self._greeks.items()})
+        return totals
+
+_END = object()
+
+async def stream_updates(book, ticks, queue_size=10_000):
+    """
+    Drive a LiveBook from an async tick stream and publish its changes.
+
+    Ticks are received into a bounded queue. Whenever the book is free, every
+    queued tick is applied at once and the book is repriced a single time,
+    so a burst of ticks costs one repricing and latency stays bounded by the
+    queue drain plus one batched repricing instead of growing with the
+    backlog. Each batch's latency is recorded in book.latency.
+
+    Parameters:
+    book : LiveBook
+        Book to update
+    ticks : async iterable of Tick
+        Tick source, e.g. src.data.ticks.replay_ticks
+    queue_size : int
+        Maximum number of received ticks awaiting processing
+
+    Yields:
+    update : BookUpdate
+        One per batch of ticks that changed at least one position
+    """
+    queue = asyncio.Queue(maxsize=queue_size)
+
+    async def receive():
+        try:
+            async for tick in ticks:
+                await queue.put((time.perf_counter(), tick))
+        finally:
+            await queue.put((None, _END))
+
+    receiver = asyncio.create_task(receive())
+    try:
+        finished = False
+        while not finished:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            finished = batch[-1][1] is _END
+            batch = [item for item in batch if item[1] is not _END]
+            if not batch:
+                continue
+
+            for _, tick in batch:
+                book.apply(tick)
+            changes = book.reprice()
+            latency = time.perf_counter() - batch[0][0]
+            book.latency.record(latency)
+            if changes:
+                yield BookUpdate(book.time, changes, book.totals(), len(batch), latency)
+        # Surface errors raised by the tick source
+        await receiver
+    finally:
+        receiver.cancel()
@@ -0,0 +1,284 @@
+# src/calculations/monte_carlo.py
+
+import numpy as np
+from src import instrumentation
+
+# Percentiles of the P&L distribution reported by simulate_pnl
+PERCENTILES = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+
+# Width of the price grid used to mark positions to market along a path,
+# in standard deviations of log price at the horizon
+_GRID_WIDTH = 8.0
+
+# Bins of the P&L histogram behind the percentiles, VaR and CVaR
+_HISTOGRAM_BINS = 1 << 14
+
+class _Moments:
+    """
+    Running sums for the control-variate regression of a sample mean.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.x = self.y = self.xx = self.xy = self.yy = 0.0
+
+    def add(self, x, y):
+        self.n += x.size
+        self.x += x.sum()
+        self.y += y.sum()
+        self.xx += x @ x
+        self.xy += x @ y
+        self.yy += y @ y
+
+    def estimate(self, control_mean=None):
+        """
+        Return (mean, standard error) of y, adjusted with the control x
+        when its true mean is given.
+        """
+        n = self.n
+        mean_x, mean_y = self.x / n, self.y / n
+        var_y = max(self.yy / n - mean_y**2, 0.0)
+        if control_mean is None:
+            return mean_y, np.sqrt(var_y / n)
+        var_x = self.xx / n - mean_x**2
+        cov = self.xy / n - mean_x * mean_y
+        beta = cov / var_x if var_x > 0 else 0.0
+        residual = max(var_y - beta * cov, 0.0)
+        return mean_y - beta * (mean_x - control_mean), np.sqrt(residual / n)
+
+class _Histogram:
+    """
+    Fixed-bin histogram of P&L values that also keeps the count, sum,
+    minimum and maximum of each bin, and how many values equal the minimum.
+
+    Quantiles are read off the cumulative counts and placed between the
+    smallest and largest value of their bin. Counting the values at the
+    minimum makes a P&L taken by many paths (such as the premium lost by an
+    option expiring worthless) come out exactly. Values outside [lo, hi]
+    fall into the end bins.
+    """
+
+    def __init__(self, lo, hi, bins=_HISTOGRAM_BINS):
+        self.lo = lo
+        self.width = (hi - lo) / bins if hi > lo else 1.0
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.sums = np.zeros(bins)
+        self.mins = np.full(bins, np.inf)
+        self.maxs = np.full(bins, -np.inf)
+        self.at_min = np.zeros(bins, dtype=np.int64)
+
+    def add(self, values):
+        bins = self.counts.size
+        index = np.clip(((values - self.lo) / self.width).astype(np.int64), 0, bins - 1)
+        self.counts += np.bincount(index, minlength=bins)
+        self.sums += np.bincount(index, weights=values, minlength=bins)
+        np.maximum.at(self.maxs, index, values)
+
+        mins = np.full(bins, np.inf)
+        np.minimum.at(mins, index, values)
+        at_min = np.bincount(index, weights=values == mins[index], minlength=bins).astype(np.int64)
+        lowest = np.minimum(self.mins, mins)
+        self.at_min = np.where(self.mins == lowest, self.at_min, 0) + np.where(mins == lowest, at_min, 0)
+        self.mins = lowest
+
+    def _order_statistic(self, cumulative, k):
+        """
+        Approximate the k-th smallest value (0-based).
+        """
+        b = int(np.searchsorted(cumulative, k, side='right'))
+        rank = k - (cumulative[b - 1] if b else 0) - self.at_min[b] + 1
+        if rank <= 0:
+            return self.mins[b]
+        return self.mins[b] + (self.maxs[b] - self.mins[b]) * rank / (self.counts[b] - self.at_min[b])
+
+    def quantile(self, q):
+        """
+        Quantile with the linear interpolation of np.quantile.
+        """
+        cumulative = np.cumsum(self.counts)
+        position = (cumulative[-1] - 1) * q
+        k = int(np.floor(position))
+        low = self._order_statistic(cumulative, k)
+        if position == k:
+            return low
+        return low + (position - k) * (self._order_statistic(cumulative, k + 1) - low)
+
+    def tail_mean(self, threshold):
+        """
+        Mean of the values at or below threshold; values in the bin holding
+        the threshold are taken as spread evenly between its extremes.
+        """
+        below = self.maxs <= threshold
+        count, total = self.counts[below].sum(), self.sums[below].sum()
+        straddling = np.flatnonzero((self.mins <= threshold) & ~below)
+        for b in straddling:
+            low, rest = self.mins[b], self.counts[b] - self.at_min[b]
+            fraction = (threshold - low) / (self.maxs[b] - low)
+            count += self.at_min[b] + fraction * rest
+            total += self.at_min[b] * low + fraction * rest * (low + threshold) / 2
+        return total / count
+
+def _normals(rng, size, antithetic):
+    """
+    Draw standard normals, pairing each draw with its negative when
+    antithetic; the pairs are the first and second halves of the result.
+    """
+    if not antithetic:
+        return rng.standard_normal(size)
+    half = rng.standard_normal(size // 2)
+    return np.concatenate([half, -half])
+
+def _price_grid(strategy, S, T, mu, sigma, grid_points):
+    """
+    Price grid covering all simulated prices, with the strikes inserted so
+    the kinks of the expiry P&L are interpolated exactly.
+    """
+    spread = _GRID_WIDTH * sigma * np.sqrt(T)
+    centre = np.log(S) + (mu - 0.5 * sigma**2) * T
+    grid = np.exp(np.linspace(centre - spread, centre + spread, grid_points))
+    inside = strategy.strike[(strategy.strike > grid[0]) & (strategy.strike < grid[-1])]
+    return np.union1d(grid, inside)
+
+@instrumentation.timed('calculations.simulate_pnl')
+def simulate_pnl(strategy, S, n_paths=100_000, horizon=None, sigma=None, mu=None, steps=None,
+                 profit_target=None, stop_loss=None, antithetic=True, control_variate=True,
+                 seed=None, chunk_size=65_536, percentiles=PERCENTILES, confidence=0.95, grid_points=2001):
+    """
+    Simulate the P&L distribution of a position with Monte Carlo.
+
+    The underlying follows geometric Brownian motion and paths are generated
+    chunk by chunk, so memory stays proportional to chunk_size however many
+    paths are run: each chunk is folded into running moments and a
+    fixed-size P&L histogram, from which the percentiles, VaR and CVaR are
+    read, and no per-path values are kept. Along a path the
+    position is marked to market by interpolating its P&L on a price grid,
+    which is priced once per monitoring date with a single batched call.
+
+    Parameters:
+    strategy : Strategy
+        Position to simulate (see src.calculations.strategy); a single
+        option is a one-leg Strategy
+    S : float
+        Current stock price
+    n_paths : int
+        Number of simulated paths (rounded up to even when antithetic)
+    horizon : float, optional
+        Holding period in years; defaults to the earliest expiry
+    sigma : float, optional
+        Volatility of the underlying; defaults to the mean leg volatility
+    mu : float, optional
+        Drift of the underlying; defaults to the risk-free rate
+    steps : int, optional
+        Monitoring dates for the exit rules; defaults to one per trading
+        day. Without exit rules only the horizon is simulated.
+    profit_target : float, optional
+        Close the position once its P&L reaches this many dollars
+    stop_loss : float, optional
+        Close the position once it has lost this many dollars
+    antithetic : bool
+        Pair each path with its mirror image
+    control_variate : bool
+        Use the terminal stock price, whose mean is known, to reduce the
+        variance of the expected P&L and probability of profit
+    seed : int, optional
+        Seed for reproducible results (given the same chunk_size)
+    chunk_size : int
+        Number of paths simulated at once
+    percentiles : iterable of float
+        Percentiles of the P&L distribution to report
+    confidence : float
+        Confidence level of VaR and CVaR
+    grid_points : int
+        Size of the price grid used for marking to market
+
+    Returns:
+    results : dict
+        'pop', 'expected_pnl', 'stderr' (of expected_pnl), 'var' and 'cvar'
+        (as positive loss amounts), 'percentiles' ({percentile: P&L}),
+        'target_hit_rate', 'stop_hit_rate' and 'n_paths'
+    """
+    if chunk_size < 2:
+        raise ValueError("chunk_size must be at least 2")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+
+    T = strategy.expiry.min() if horizon is None else horizon
+    if T <= 0:
+        raise ValueError("horizon must be positive")
+    sigma = float(strategy.sigma.mean()) if sigma is None else sigma
+    mu = strategy.risk_free_rate if mu is None else mu
+    exits = profit_target is not None or stop_loss is not None
+    steps = (steps or max(int(round(T * 252)), 1)) if exits else 1
+    if antithetic:
+        n_paths += n_paths % 2
+        chunk_size -= chunk_size % 2
+
+    dt = T / steps
+    drift = (mu - 0.5 * sigma**2) * dt
+    diffusion = sigma * np.sqrt(dt)
+
+    # P&L at the horizon is exact when every leg has expired; otherwise, and
+    # at the monitoring dates, it is interpolated on the grid
+    grid = _price_grid(strategy, S, T, mu, sigma, grid_points)
+    times = dt * np.arange(1, steps + 1) if exits else np.array([T])
+    surface = strategy.pnl_surface(grid, times)
+    terminal = (lambda S_T: strategy.pnl(S_T, T)) if strategy.expires_by(T) \
+        else (lambda S_T: np.interp(S_T, grid, surface[-1]))
+    target = np.inf if profit_target is None else profit_target
+    stop = -np.inf if stop_loss is None else -stop_loss
+
+    # Every P&L a path can take lies within the range of the priced grid,
+    # up to paths that leave it, which land in the end bins
+    reachable = np.concatenate([surface.ravel(), terminal(grid)])
+    histogram = _Histogram(reachable.min(), reachable.max())
+
+    rng = np.random.default_rng(seed)
+    mean_moments, pop_moments = _Moments(), _Moments()
+    target_hits = stop_hits = 0
+
+    for start in range(0, n_paths, chunk_size):
+        m = min(chunk_size, n_paths - start)
+        S_t = np.full(m, float(S))
+        closed = np.full(m, np.nan)
+        for step in range(steps):
+            S_t *= np.exp(drift + diffusion * _normals(rng, m, antithetic))
+            if exits and step < steps - 1:
+                value = np.interp(S_t, grid, surface[step])
+                open_ = np.isnan(closed)
+                hit_target = open_ & (value >= target)
+                hit_stop = open_ & (value <= stop)
+                target_hits += np.count_nonzero(hit_target)
+                stop_hits += np.count_nonzero(hit_stop)
+                closed = np.where(hit_target | hit_stop, value, closed)
+
+        final = terminal(S_t)
+        if exits:
+            target_hits += np.count_nonzero(np.isnan(closed) & (final >= target))
+            stop_hits += np.count_nonzero(np.isnan(closed) & (final <= stop))
+        chunk_pnl = np.where(np.isnan(closed), final, closed)
+        histogram.add(chunk_pnl)
+
+        # Antithetic pairs are averaged so the estimators see independent samples
+        x, y, w = S_t, chunk_pnl, (chunk_pnl > 0).astype(float)
+        if antithetic:
+            half = m // 2
+            x, y, w = ((a[:half] + a[half:]) / 2 for a in (x, y, w))
+        mean_moments.add(x, y)
+        pop_moments.add(x, w)
+
+    control_mean = S * np.exp(mu * T) if control_variate else None
+    expected_pnl, stderr = mean_moments.estimate(control_mean)
+    pop, _ = pop_moments.estimate(control_mean)
+
+    quantile = histogram.quantile(1 - confidence)
+    return {
+        'pop': float(np.clip(pop, 0.0, 1.0)),
+        'expected_pnl': float(expected_pnl),
+        'stderr': float(stderr),
+        'var': float(-quantile),
+        'cvar': float(-histogram.tail_mean(quantile)),
+        'percentiles': {p: float(histogram.quantile(p / 100)) for p in percentiles},
+        'target_hit_rate': target_hits / n_paths,
+        'stop_hit_rate': stop_hits / n_paths,
+        'n_paths': n_paths,
+    }
@@ -2,6 +2,9 @@
 
 from scipy.stats import norm
 import numpy as np
+from src.pricing.engines import option_price
+from src.pricing.payoff import payoff_sign
+from src import instrumentation
 
 def calculate_pnl(position, initial_premium, current_premium, quantity=1):
     """
@@ -31,6 +34,7 @@ def calculate_pnl(position, initial_premium, current_premium, quantity=1):
     return pnl
 
 
+@instrumentation.timed('calculations.long_call_calculator')
 def long_call_calculator(price_per_option, contracts, strike_price, current_price, implied_volatility, risk_free_rate=0.01, time_to_expiry=1):
     """
     Calculates the P&L for a long call option position.
@@ -78,4 +82,48 @@ def long_call_calculator(price_per_option, contracts, strike_price, current_pric
         'breakeven': breakeven,
         'pnl': pnl,
         'probability_of_profit': prob_profit
-    }
\ No newline at end of file
+    }
+
+@instrumentation.timed('calculations.pnl_surface')
+def pnl_surface(price_range, days_to_expiry, strike_price, price_per_option, contracts=1, implied_volatility=0.2, risk_free_rate=0.01, option_type='call', position='long', american=True, engine='baw', volatility_surface=None):
+    """
+    Calculates a P&L grid over underlying prices and days to expiry in one vectorized pass.
+
+    Parameters:
+    - price_range: Array of underlying stock prices
+    - days_to_expiry: Array of calendar days remaining until expiry (0 = at expiry)
+    - strike_price: Strike price of the option
+    - price_per_option: Premium paid (long) or received (short) per option
+    - contracts: Number of contracts (1 contract = 100 options)
+    - implied_volatility: Implied volatility (as a decimal, e.g., 0.2 for 20%)
+    - risk_free_rate: Annual risk-free interest rate (default 1%)
+    - option_type: 'call' or 'put'
+    - position: 'long' or 'short'
+    - american: True for American option, False for European
+    - engine: Pricing engine for dates before expiry (see src.pricing.engines)
+    - volatility_surface: Optional VolatilitySurface; when given, each row is priced at the surface's volatility for the strike and that row's time to expiry instead of implied_volatility
+
+    Returns:
+    A 2-D array of P&L with one row per entry of days_to_expiry and one column per underlying price.
+    """
+    if position.lower() == 'long':
+        side = 1
+    elif position.lower() == 'short':
+        side = -1
+    else:
+        raise ValueError("position must be 'long' or 'short'")
+
+    S = np.asarray(price_range, dtype=float)[np.newaxis, :]
+    T = np.asarray(days_to_expiry, dtype=float)[:, np.newaxis] / 365
+    phi = payoff_sign(option_type)
+
+    # Option value: intrinsic at expiry, model value before it
+    values = np.broadcast_to(np.maximum(phi * (S - strike_price), 0.0), (T.shape[0], S.shape[1])).copy()
+    live = T[:, 0] > 0
+    if np.any(live):
+        sigma = implied_volatility
+        if volatility_surface is not None:
+            sigma = volatility_surface.sigma(strike_price, T[live])
+        values[live] = option_price(S, strike_price, T[live], risk_free_rate, sigma, option_type, american, engine=engine)
+
+    return side * (values - price_per_option) * contracts * 100
@@ -0,0 +1,409 @@
+# src/calculations/revalue.py
+
+import argparse
+import json
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import date
+import numpy as np
+import pandas as pd
+from src import instrumentation
+from src.data.chain import OptionChain, from_frames
+from src.pricing.engines import PRICING_ENGINES, option_price
+from src.pricing.greeks import batch_greeks
+from src.pricing.payoff import payoff_signs
+
+GREEKS = ('delta', 'gamma', 'theta', 'vega', 'rho')
+
+# Position file columns; the optional ones take these defaults when absent
+REQUIRED_COLUMNS = ('symbol', 'option_type', 'strike', 'expiration', 'quantity')
+OPTIONAL_COLUMNS = {'side': 'long', 'entry_price': 0.0, 'implied_volatility': np.nan}
+
+FORMATS = ('csv', 'parquet')
+
+def file_format(path):
+    """
+    Infer 'csv' or 'parquet' from a file extension.
+    """
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    if extension in ('parquet', 'pq'):
+        return 'parquet'
+    if extension == 'csv':
+        return 'csv'
+    raise ValueError(f"file format must be one of {FORMATS}: {path}")
+
+def read_positions(path, chunk_size=10_000):
+    """
+    Yield a positions file as DataFrames of at most chunk_size rows, so
+    files of any size are read in constant memory.
+    """
+    if file_format(path) == 'csv':
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    else:
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+
+class ResultWriter:
+    """
+    Append DataFrames to a CSV or Parquet file chunk by chunk.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.format = file_format(path)
+        self._writer = None
+        self._header = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, frame):
+        if self.format == 'csv':
+            frame.to_csv(self.path, mode='w' if self._header else 'a', header=self._header, index=False)
+            self._header = False
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table.cast(self._writer.schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+class MarketSnapshot(ABC):
+    """
+    Spot prices and implied volatilities used to revalue positions.
+
+    Subclasses implement spot() and chain(); lookup() resolves a whole
+    chunk of positions with one binary search per chain.
+    """
+
+    @abstractmethod
+    def spot(self, symbol):
+        """
+        Return the spot price of a symbol, or None if unavailable.
+        """
+
+    @abstractmethod
+    def chain(self, symbol, expiration, option_type):
+        """
+        Return the OptionChain of one side of a chain, or None.
+        """
+
+    def lookup(self, symbol, expiration, option_type, strike):
+        """
+        Resolve spot and implied volatility for arrays of positions.
+
+        Returns:
+        spot, sigma : ndarray
+            NaN where the snapshot has no data
+        """
+        frame = pd.DataFrame({'symbol': symbol, 'expiration': expiration, 'option_type': option_type})
+        spot = np.full(len(frame), np.nan)
+        sigma = np.full(len(frame), np.nan)
+        for name, rows in frame.groupby('symbol', sort=False).indices.items():
+            value = self.spot(name)
+            spot[rows] = np.nan if value is None else value
+        for (name, expiration, option_type), rows in frame.groupby(list(frame), sort=False).indices.items():
+            chain = self.chain(name, expiration, option_type)
+            if chain is not None:
+                sigma[rows] = chain.values_at(strike[rows], 'iv')
+        return spot, sigma
+
+class StoreMarket(MarketSnapshot):
+    """
+    Market data served by a MarketDataStore (see src.data.store). Spots and
+    chains are read once per run and kept for the following chunks.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._spots = {}
+        self._chains = {}
+
+    def spot(self, symbol):
+        if symbol not in self._spots:
+            self._spots[symbol] = self.store.get_spot(symbol)
+        return self._spots[symbol]
+
+    def chain(self, symbol, expiration, option_type):
+        key = (symbol, expiration)
+        if key not in self._chains:
+            self._chains[key] = from_frames(*self.store.get_option_chain(symbol, expiration))
+        calls, puts = self._chains[key]
+        return calls if option_type == 'call' else puts
+
+class FileMarket(MarketSnapshot):
+    """
+    Market data from a snapshot file (CSV or Parquet) with columns symbol
+    and spot, and optionally expiration, option_type, strike and
+    implied_volatility for per-contract volatilities.
+    """
+
+    def __init__(self, path):
+        frame = pd.read_csv(path) if file_format(path) == 'csv' else pd.read_parquet(path)
+        missing = {'symbol', 'spot'} - set(frame.columns)
+        if missing:
+            raise ValueError(f"snapshot file must have columns {sorted(missing)}")
+        frame['symbol'] = frame['symbol'].str.upper()
+        spots = frame.dropna(subset=['spot']).drop_duplicates('symbol', keep='last')
+        self._spots = dict(zip(spots['symbol'], spots['spot'].astype(float)))
+
+        self._chains = {}
+        if {'expiration', 'option_type', 'strike', 'implied_volatility'} <= set(frame.columns):
+            quotes = frame.dropna(subset=['expiration', 'strike', 'implied_volatility'])
+            quotes = quotes.assign(
+                expiration=_expiration_strings(quotes['expiration']),
+                option_type=quotes['option_type'].str.lower(),
+            )
+            for key, side in quotes.groupby(['symbol', 'expiration', 'option_type']):
+                self._chains[key] = OptionChain.from_frame(side.rename(columns={'implied_volatility': 'impliedVolatility'}))
+
+    def spot(self, symbol):
+        return self._spots.get(symbol)
+
+    def chain(self, symbol, expiration, option_type):
+        return self._chains.get((symbol, expiration, option_type))
+
+@dataclass
+class RevaluationReport:
+    """
+    Summary of a revaluation run.
+
+    Attributes:
+    rows : int
+        Positions read
+    priced : int
+        Positions valued (with a model or at intrinsic value once expired)
+    missing_market : int
+        Positions left unvalued for lack of a spot price or volatility
+    chunks : int
+        Chunks processed
+    elapsed : float
+        Wall-clock seconds
+    market_value : float
+        Total value of the priced positions
+    pnl : float
+        Total P&L of the priced positions against their entry prices
+    """
+    rows: int = 0
+    priced: int = 0
+    missing_market: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    market_value: float = 0.0
+    pnl: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        return {**asdict(self), 'rows_per_second': self.rows_per_second}
+
+def _expiration_strings(values):
+    return pd.to_datetime(values).dt.strftime('%Y-%m-%d')
+
+def _prepare(frame):
+    """
+    Check the columns of a positions chunk and fill in the optional ones.
+    """
+    missing = set(REQUIRED_COLUMNS) - set(frame.columns)
+    if missing:
+        raise ValueError(f"positions are missing columns {sorted(missing)}")
+    frame = frame.assign(**{name: default for name, default in OPTIONAL_COLUMNS.items() if name not in frame})
+    side = frame['side'].str.lower()
+    if not side.isin(('long', 'short')).all():
+        raise ValueError("side must be 'long' or 'short'")
+    return frame.assign(
+        symbol=frame['symbol'].str.upper(),
+        option_type=frame['option_type'].str.lower(),
+        expiration=_expiration_strings(frame['expiration']),
+        side=side,
+    )
+
+@instrumentation.timed('calculations.revalue_chunk')
+def revalue_chunk(positions, market, valuation_date, r=0.01, american=True, N=100, engine='binomial',
+                  greeks=False, pricer=None):
+    """
+    Value one chunk of positions.
+
+    Live contracts are priced in one batched engine call at the snapshot's
+    spot and the chain's implied volatility for the contract (falling back
+    to the position's implied_volatility column); expired contracts are
+    worth their intrinsic value.
+
+    Parameters:
+    positions : pandas.DataFrame
+        Chunk of the positions file
+    market : MarketSnapshot
+        Source of spot prices and implied volatilities
+    valuation_date : datetime.date
+        Date the positions are valued at
+    r : float
+        Risk-free interest rate (annual)
+    american : bool
+        True for American options, False for European
+    N : int
+        Number of time steps for the Binomial engine
+    engine : str
+        One of PRICING_ENGINES
+    greeks : bool
+        Add position-level Greeks (Binomial engine only)
+    pricer : ParallelPricer, optional
+        Spread the Binomial pricing over worker processes
+
+    Returns:
+    results : pandas.DataFrame
+        The positions with spot, sigma, T, price (per option), market_value,
+        pnl and, if requested, the Greeks
+    """
+    frame = _prepare(positions)
+    strike = frame['strike'].to_numpy(dtype=float)
+    spot, sigma = market.lookup(frame['symbol'].to_numpy(), frame['expiration'].to_numpy(),
+                                frame['option_type'].to_numpy(), strike)
+    fallback = frame['implied_volatility'].to_numpy(dtype=float)
+    sigma = np.where(np.isfinite(sigma) & (sigma > 0), sigma, fallback)
+    T = (pd.to_datetime(frame['expiration']) - pd.Timestamp(valuation_date)).dt.days.to_numpy() / 365
+
+    phi = payoff_signs(frame['option_type'].to_numpy())
+    expired = (T <= 0) & np.isfinite(spot)
+    live = (T > 0) & np.isfinite(spot) & np.isfinite(sigma) & (sigma > 0)
+
+    price = np.full(len(frame), np.nan)
+    price[expired] = np.maximum(phi[expired] * (spot[expired] - strike[expired]), 0.0)
+    values = {name: np.full(len(frame), np.nan) for name in GREEKS} if greeks else {}
+    if np.any(live):
+        args = (spot[live], strike[live], T[live], r, sigma[live], frame['option_type'].to_numpy()[live], american)
+        if greeks and pricer is not None:
+            result = pricer.greeks(*args, N=N)
+        elif greeks:
+            result = batch_greeks(*args, N=N)
+        elif pricer is not None:
+            result = {'price': pricer.price(*args, N=N)}
+        else:
+            result = {'price': option_price(*args, N=N, engine=engine)}
+        price[live] = result['price']
+        for name in values:
+            values[name][live] = result[name]
+    for name in values:
+        values[name][expired] = 0.0
+
+    direction = np.where(frame['side'] == 'long', 1.0, -1.0)
+    weight = direction * frame['quantity'].to_numpy(dtype=float) * 100
+    return frame.assign(
+        spot=spot,
+        sigma=sigma,
+        T=T,
+        price=price,
+        market_value=weight * price,
+        pnl=weight * (price - frame['entry_price'].to_numpy(dtype=float)),
+        **{name: weight * value for name, value in values.items()},
+    )
+
+def revalue_file(positions_path, output_path, market, valuation_date=None, chunk_size=10_000, r=0.01,
+                 american=True, N=100, engine='binomial', greeks=False, max_workers=None):
+    """
+    Revalue a positions file chunk by chunk and stream the results to
+    output_path (CSV or Parquet, by extension). Memory use depends on the
+    chunk size, not the file size.
+
+    Parameters:
+    positions_path, output_path : str
+        Input and output files
+    market : MarketSnapshot
+        Source of spot prices and implied volatilities
+    valuation_date : datetime.date, optional
+        Defaults to today
+    chunk_size : int
+        Positions per chunk
+    r, american, N, engine, greeks : see revalue_chunk
+    max_workers : int, optional
+        Price each chunk over this many worker processes (Binomial engine)
+
+    Returns:
+    report : RevaluationReport
+    """
+    if engine not in PRICING_ENGINES:
+        raise ValueError(f"engine must be one of {sorted(PRICING_ENGINES)}")
+    if (greeks or max_workers) and engine != 'binomial':
+        raise ValueError("greeks and max_workers require the 'binomial' engine")
+    valuation_date = valuation_date or date.today()
+
+    pricer = None
+    if max_workers:
+        from src.pricing.parallel import ParallelPricer
+        pricer = ParallelPricer(max_workers)
+
+    report = RevaluationReport()
+    start = time.perf_counter()
+    try:
+        with ResultWriter(output_path) as writer:
+            for chunk in read_positions(positions_path, chunk_size):
+                results = revalue_chunk(chunk, market, valuation_date, r, american, N, engine, greeks, pricer)
+                writer.write(results)
+                priced = np.isfinite(results['price'].to_numpy())
+                report.rows += len(results)
+                report.priced += int(priced.sum())
+                report.missing_market += int((~priced).sum())
+                report.chunks += 1
+                report.market_value += float(results['market_value'].sum())
+                report.pnl += float(results['pnl'].sum())
+    finally:
+        if pricer is not None:
+            pricer.shutdown()
+    report.elapsed = time.perf_counter() - start
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Revalue a file of option positions without the app.")
+    parser.add_argument('positions', help="positions file (.csv or .parquet)")
+    parser.add_argument('output', help="results file (.csv or .parquet)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--store', default=os.environ.get('OPTIONS_DATA_DIR', 'data/store'),
+                        help="market data store directory (default: %(default)s)")
+    source.add_argument('--snapshot', help="market snapshot file with symbol, spot and optional contract volatilities")
+    parser.add_argument('--online', action='store_true', help="let the store fetch data it does not hold")
+    parser.add_argument('--date', type=date.fromisoformat, help="valuation date, YYYY-MM-DD (default: today)")
+    parser.add_argument('--rate', type=float, default=0.01, help="risk-free rate (default: %(default)s)")
+    parser.add_argument('--european', action='store_true', help="value European instead of American options")
+    parser.add_argument('--steps', type=int, default=100, help="Binomial time steps (default: %(default)s)")
+    parser.add_argument('--engine', default='binomial', choices=sorted(PRICING_ENGINES))
+    parser.add_argument('--greeks', action='store_true', help="add position-level Greeks")
+    parser.add_argument('--chunk-size', type=int, default=10_000, help="positions per chunk (default: %(default)s)")
+    parser.add_argument('--workers', type=int, help="worker processes for Binomial pricing")
+    parser.add_argument('--report', help="also write the throughput report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    if args.snapshot:
+        market = FileMarket(args.snapshot)
+    else:
+        from src.data.store import MarketDataStore
+        market = StoreMarket(MarketDataStore(args.store, offline=not args.online))
+
+    report = revalue_file(
+        args.positions, args.output, market, args.date, args.chunk_size, args.rate,
+        not args.european, args.steps, args.engine, args.greeks, args.workers,
+    )
+    print(f"Revalued {report.rows} positions in {report.chunks} chunks in {report.elapsed:.2f}s "
+          f"({report.rows_per_second:,.0f} positions/s)", file=sys.stderr)
+    print(f"Priced {report.priced}, missing market data {report.missing_market}; "
+          f"market value {report.market_value:,.2f}, P&L {report.pnl:,.2f}", file=sys.stderr)
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report.summary(), f, indent=2)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
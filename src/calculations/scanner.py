@@ -0,0 +1,385 @@
+# src/calculations/scanner.py
+
+from datetime import date
+import numpy as np
+import pandas as pd
+from scipy.special import ndtri
+from src.pricing.black_scholes import _black_scholes, _d1_d2, _norm_cdf
+from src.pricing.implied_vol import quote_prices
+from src.pricing.vol_surface import _years_to_expiry
+from src import instrumentation
+
+STRUCTURES = ('vertical', 'calendar', 'iron_condor')
+
+# Sorting keys accepted by scan_strategies
+SCORES = ('pop', 'expected_pnl', 'return_on_risk')
+
+# Probability-grid size for calendars, whose far leg is still alive at the
+# near expiry and has no closed-form P&L distribution
+_CALENDAR_POINTS = 512
+
+def _prob_above(x, S, T, r, sigma):
+    """
+    Lognormal probability that the stock finishes above x: norm.cdf(d2), as
+    in long_call_calculator.
+    """
+    with np.errstate(divide='ignore'):
+        _, d2 = _d1_d2(S, x, T, r, sigma)
+    return _norm_cdf(d2)
+
+def _expected_payoff(K, phi, S, T, r, sigma):
+    """
+    Expected expiry payoff of a call (phi = +1) or put (phi = -1) under the
+    same lognormal distribution, undiscounted.
+    """
+    d1, d2 = _d1_d2(S, K, T, r, sigma)
+    forward = S * np.exp(r * T)
+    return phi * (forward * _norm_cdf(phi * d1) - K * _norm_cdf(phi * d2))
+
+def _leg_pnl(x, K, phi, weight, premium):
+    """
+    Expiry P&L at prices x (n, P) of positions with legs (n, L).
+    """
+    payoff = np.maximum(phi[:, np.newaxis, :] * (x[..., np.newaxis] - K[:, np.newaxis, :]), 0.0)
+    return (weight[:, np.newaxis, :] * (payoff - premium[:, np.newaxis, :])).sum(axis=-1)
+
+def _risk_reward(K, phi, weight, premium):
+    """
+    Exact maximum profit and loss at expiry of same-expiry positions.
+
+    The expiry P&L is piecewise linear with kinks at the strikes, so its
+    extremes lie at zero, at a strike, or at infinity when the slope beyond
+    the highest strike is non-zero.
+    """
+    kinks = np.concatenate([np.zeros((K.shape[0], 1)), np.sort(K, axis=1)], axis=1)
+    values = _leg_pnl(kinks, K, phi, weight, premium)
+    tail_slope = np.where(phi > 0, weight, 0.0).sum(axis=1)
+    max_profit = np.where(tail_slope > 0, np.inf, values.max(axis=1))
+    max_loss = np.where(tail_slope < 0, -np.inf, values.min(axis=1))
+    return kinks, values, tail_slope, max_profit, max_loss
+
+def _score_same_expiry(S, T, r, sigma, K, phi, weight, premium):
+    """
+    Score positions whose legs all expire together.
+
+    The probability of profit integrates the lognormal distribution over
+    the intervals where the piecewise-linear expiry P&L is positive; the
+    expected P&L is the sum of the legs' expected payoffs less premiums.
+    """
+    kinks, values, tail_slope, max_profit, max_loss = _risk_reward(K, phi, weight, premium)
+
+    # Positive part of each finite segment between consecutive kinks
+    a, b = kinks[:, :-1], kinks[:, 1:]
+    fa, fb = values[:, :-1], values[:, 1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        root = a + fa * (b - a) / (fa - fb)
+    positive = (fa > 0) | (fb > 0)
+    lo = np.where(fa > 0, a, np.where(positive, root, a))
+    hi = np.where(fb > 0, b, np.where(positive, root, a))
+    pop = (_prob_above(lo, S, T, r, sigma) - _prob_above(hi, S, T, r, sigma)).sum(axis=1)
+
+    # Tail beyond the highest strike, where the P&L is f_last + slope * (x - b_last)
+    b_last, f_last = kinks[:, -1], values[:, -1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tail_root = b_last - f_last / tail_slope
+    tail_root = np.where(np.isfinite(tail_root) & (tail_root > b_last), tail_root, b_last)
+    rising = _prob_above(np.where(f_last > 0, b_last, tail_root), S, T, r, sigma)
+    falling = _prob_above(b_last, S, T, r, sigma) - _prob_above(tail_root, S, T, r, sigma)
+    flat = _prob_above(b_last, S, T, r, sigma)
+    pop += np.where(
+        tail_slope > 0, rising,
+        np.where(tail_slope < 0, np.where(f_last > 0, falling, 0.0), np.where(f_last > 0, flat, 0.0)),
+    )
+
+    expected = (weight * (_expected_payoff(K, phi, S, T, r, sigma) - premium)).sum(axis=1)
+    return {
+        'max_profit': max_profit,
+        'max_loss': max_loss,
+        'pop': pop,
+        'expected_pnl': expected,
+    }
+
+def _score_calendar(S, T_near, T_far, r, sigma, K, phi, sigma_far, premium_near, premium_far):
+    """
+    Score short-near / long-far calendars at the near expiry.
+
+    The near-expiry stock price is sampled at equal-probability lognormal
+    quantiles and the far leg is revalued there with Black-Scholes.
+    """
+    u = (np.arange(_CALENDAR_POINTS) + 0.5) / _CALENDAR_POINTS
+    drift = (r - 0.5 * sigma**2) * T_near
+    S_T = S * np.exp(drift + sigma * np.sqrt(T_near) * ndtri(u))[np.newaxis, :]
+
+    column = lambda x: np.asarray(x, dtype=float)[:, np.newaxis]
+    K, phi = column(K), column(phi)
+    far_value = _black_scholes(S_T, K, T_far - T_near, r, column(sigma_far), phi)
+    near_value = np.maximum(phi * (S_T - K), 0.0)
+    pnl = 100 * ((far_value - column(premium_far)) - (near_value - column(premium_near)))
+
+    # Far from the strike both legs converge to intrinsic, losing the debit
+    debit = 100 * (np.asarray(premium_far) - np.asarray(premium_near))
+    return {
+        'max_profit': pnl.max(axis=1),
+        'max_loss': np.minimum(pnl.min(axis=1), -debit),
+        'pop': (pnl > 0).mean(axis=1),
+        'expected_pnl': pnl.mean(axis=1),
+    }
+
+def _in_blocks(score, arrays, block_size):
+    """
+    Apply a scoring function to row blocks of the candidate arrays.
+    """
+    size = len(arrays[0])
+    blocks = [
+        score(*(a[start:start + block_size] for a in arrays))
+        for start in range(0, size, block_size)
+    ]
+    return {name: np.concatenate([b[name] for b in blocks]) for name in blocks[0]}
+
+def _pareto_mask(pop, return_on_risk):
+    """
+    Mark candidates that no other candidate beats on both probability of
+    profit and return on risk.
+    """
+    order = np.lexsort((-return_on_risk, -pop))
+    sorted_return = return_on_risk[order]
+    best_before = np.maximum.accumulate(np.concatenate([[-np.inf], sorted_return[:-1]]))
+    keep = np.zeros(pop.shape, dtype=bool)
+    keep[order] = sorted_return > best_before
+    return keep
+
+def _prepare_side(chain, option_type, price, min_open_interest):
+    """
+    Extract sorted strikes, prices and implied volatilities of one side of a
+    chain, dropping rows that cannot be traded.
+    """
+    strikes = np.asarray(chain['strike'], dtype=float)
+    prices = quote_prices(chain, price)
+    iv = np.asarray(chain['impliedVolatility'], dtype=float)
+    usable = (prices > 0) & np.isfinite(prices)
+    if min_open_interest and 'openInterest' in chain:
+        usable &= np.nan_to_num(np.asarray(chain['openInterest'], dtype=float)) >= min_open_interest
+    order = np.argsort(strikes[usable])
+    return {
+        'type': option_type,
+        'phi': 1.0 if option_type == 'call' else -1.0,
+        'strike': strikes[usable][order],
+        'price': prices[usable][order],
+        'iv': iv[usable][order],
+    }
+
+def _atm_volatility(sides, S):
+    """
+    Implied volatility at the strike nearest the stock price, averaged over
+    calls and puts; used as the volatility of the expiry distribution.
+    """
+    vols = []
+    for side in sides:
+        valid = np.isfinite(side['iv']) & (side['iv'] > 0)
+        if valid.any():
+            strikes, iv = side['strike'][valid], side['iv'][valid]
+            vols.append(iv[np.argmin(np.abs(strikes - S))])
+    return float(np.mean(vols)) if vols else np.nan
+
+def _vertical_candidates(side):
+    """
+    Every pair of strikes, bought low / sold high (bull) and the reverse
+    (bear).
+
+    Returns:
+    candidates : list of (name, K, phi, weight, premium)
+    """
+    i, j = np.triu_indices(len(side['strike']), 1)
+    candidates = []
+    for name, long_idx, short_idx in (('bull_', i, j), ('bear_', j, i)):
+        K = np.column_stack([side['strike'][long_idx], side['strike'][short_idx]])
+        premium = np.column_stack([side['price'][long_idx], side['price'][short_idx]])
+        phi = np.full(K.shape, side['phi'])
+        weight = np.broadcast_to([100.0, -100.0], K.shape)
+        candidates.append((name + side['type'], K, phi, weight, premium))
+    return candidates
+
+def _undominated_verticals(name, K, weight, premium):
+    """
+    Mark vertical spreads that no spread of the same kind and width beats
+    at every expiry price, using quotes only.
+
+    Shifting a bull spread to lower strikes, or a bear spread to higher
+    ones, raises its expiry payoff everywhere. So a spread that costs no
+    less than another of the same width on its better side has a P&L at
+    least as high everywhere. Its probability of profit is no higher, and
+    its return on risk (expected payoff over cost, or expected kept width
+    over risk, for credits) is strictly lower. It would be dropped by
+    _pareto_mask after scoring, so it can be dropped before.
+    """
+    width = np.abs(K[:, 1] - K[:, 0])
+    lower = K.min(axis=1)
+    cost = (weight * premium).sum(axis=1)
+    # Walk each width from the better side
+    order = np.lexsort((lower if name.startswith('bull') else -lower, width))
+    keep = np.zeros(len(K), dtype=bool)
+    for group in np.split(order, np.flatnonzero(np.diff(width[order])) + 1):
+        cheapest_before = np.minimum.accumulate(np.concatenate([[np.inf], cost[group][:-1]]))
+        keep[group] = cost[group] < cheapest_before
+    return keep
+
+def _condor_candidates(puts, calls, S, wing_steps):
+    """
+    Short put below the stock price and short call above it, each protected
+    by a long wing the given number of listed strikes further out.
+    """
+    candidates = []
+    for steps in wing_steps:
+        i = np.flatnonzero((puts['strike'] < S) & (np.arange(len(puts['strike'])) >= steps))
+        j = np.flatnonzero((calls['strike'] > S) & (np.arange(len(calls['strike'])) + steps < len(calls['strike'])))
+        i, j = (grid.ravel() for grid in np.meshgrid(i, j, indexing='ij'))
+        K = np.column_stack([puts['strike'][i - steps], puts['strike'][i], calls['strike'][j], calls['strike'][j + steps]])
+        premium = np.column_stack([puts['price'][i - steps], puts['price'][i], calls['price'][j], calls['price'][j + steps]])
+        phi = np.broadcast_to([-1.0, -1.0, 1.0, 1.0], K.shape)
+        weight = np.broadcast_to([100.0, -100.0, -100.0, 100.0], K.shape)
+        candidates.append(('iron_condor', K, phi, weight, premium))
+    return candidates
+
+def _frame(name, expiration, far_expiration, K, premium, weight, scores, prune):
+    """
+    Collect one group of scored candidates into a DataFrame, dropping the
+    dominated ones first when prune is set.
+    """
+    scores['return_on_risk'] = scores['expected_pnl'] / -scores['max_loss']
+    net_premium = (weight * premium).sum(axis=1)
+    if prune:
+        keep = _pareto_mask(scores['pop'], scores['return_on_risk'])
+        K, net_premium = K[keep], net_premium[keep]
+        scores = {name: values[keep] for name, values in scores.items()}
+    return pd.DataFrame({
+        'strategy': name,
+        'expiration': expiration,
+        'far_expiration': far_expiration,
+        'strikes': list(map(tuple, K)),
+        'net_premium': net_premium,
+        **scores,
+    })
+
+@instrumentation.timed('calculations.scan_strategies')
+def scan_strategies(chains, S, r=0.01, structures=STRUCTURES, price='mid', today=None, min_open_interest=0,
+                    wing_steps=(1,), prune=True, block_size=4096, sort_by='return_on_risk', top=None):
+    """
+    Enumerate and score vertical spreads, calendars and iron condors across
+    every strike and expiration of a symbol.
+
+    Candidates of one structure and expiry are generated as arrays and
+    scored in vectorized blocks. Candidates that cannot make money, or
+    cannot lose it (stale quotes such as a debit wider than the spread), are
+    dropped before scoring. With prune=True, candidates that another
+    candidate of the same structure and expiry beats on both probability of
+    profit and return on risk are dropped from the result. Vertical spreads
+    that a cheaper spread of the same kind and width beats at every price
+    are dropped before scoring (see _undominated_verticals); the rest of
+    the pruning needs the scores, so it happens after scoring.
+
+    Scores assume the lognormal distribution of long_call_calculator, with
+    the at-the-money implied volatility of each expiry:
+    pop is the probability of a profit at (near) expiry, expected_pnl the
+    mean P&L per one-lot position, and return_on_risk expected_pnl divided
+    by the maximum loss.
+
+    Parameters:
+    chains : dict
+        Maps an expiration date (string as listed by yfinance, or years to
+        expiry as a float) to the (calls, puts) pair from get_option_chain,
+        as DataFrames or OptionChains
+    S : float
+        Current stock price
+    r : float
+        Risk-free interest rate (annual)
+    structures : iterable of str
+        Any of 'vertical', 'calendar' and 'iron_condor'
+    price : str
+        Quote used as the premium: 'mid', 'bid', 'ask' or 'lastPrice'
+    today : datetime.date, optional
+        Valuation date for string expirations; defaults to today
+    min_open_interest : int
+        Drop contracts with less open interest
+    wing_steps : iterable of int
+        Iron condor wing widths, in listed strikes
+    prune : bool
+        Return only candidates not dominated on pop and return_on_risk
+    block_size : int
+        Number of candidates scored per block
+    sort_by : str
+        'pop', 'expected_pnl' or 'return_on_risk' (descending)
+    top : int, optional
+        Return only the best candidates
+
+    Returns:
+    candidates : pandas.DataFrame
+        One row per candidate with strategy, expiration, far_expiration,
+        strikes, net_premium (positive for a debit), max_profit, max_loss,
+        pop, expected_pnl and return_on_risk
+    """
+    unknown = set(structures) - set(STRUCTURES)
+    if unknown:
+        raise ValueError(f"structures must be among {STRUCTURES}")
+    if sort_by not in SCORES:
+        raise ValueError(f"sort_by must be one of {SCORES}")
+    today = today or date.today()
+
+    expiries = []
+    for expiration, (calls, puts) in chains.items():
+        T = _years_to_expiry(expiration, today)
+        if T <= 0 or calls is None or puts is None:
+            continue
+        sides = {
+            'call': _prepare_side(calls, 'call', price, min_open_interest),
+            'put': _prepare_side(puts, 'put', price, min_open_interest),
+        }
+        sigma = _atm_volatility(sides.values(), S)
+        if np.isfinite(sigma):
+            expiries.append((T, expiration, sides, sigma))
+    expiries.sort(key=lambda expiry: expiry[0])
+
+    frames = []
+    for T, expiration, sides, sigma in expiries:
+        candidates = []
+        if 'vertical' in structures:
+            candidates += _vertical_candidates(sides['call']) + _vertical_candidates(sides['put'])
+        if 'iron_condor' in structures:
+            candidates += _condor_candidates(sides['put'], sides['call'], S, wing_steps)
+
+        score = lambda K, phi, weight, premium: _score_same_expiry(S, T, r, sigma, K, phi, weight, premium)
+        for name, K, phi, weight, premium in candidates:
+            _, _, _, max_profit, max_loss = _risk_reward(K, phi, weight, premium)
+            keep = (max_profit > 0) & (max_loss < 0)
+            if prune and name != 'iron_condor':
+                keep &= _undominated_verticals(name, K, weight, premium)
+            K, phi, weight, premium = K[keep], phi[keep], weight[keep], premium[keep]
+            if len(K):
+                scores = _in_blocks(score, (K, phi, weight, premium), block_size)
+                frames.append(_frame(name, expiration, None, K, premium, weight, scores, prune))
+
+    if 'calendar' in structures:
+        for n, (T_near, near, near_sides, sigma) in enumerate(expiries):
+            for T_far, far, far_sides, _ in expiries[n + 1:]:
+                for option_type in ('call', 'put'):
+                    near_side, far_side = near_sides[option_type], far_sides[option_type]
+                    K, i, j = np.intersect1d(near_side['strike'], far_side['strike'], return_indices=True)
+                    premium = np.column_stack([near_side['price'][i], far_side['price'][j]])
+                    sigma_far = far_side['iv'][j]
+                    keep = np.isfinite(sigma_far) & (sigma_far > 0) & (premium[:, 1] > premium[:, 0])
+                    K, premium, sigma_far = K[keep], premium[keep], sigma_far[keep]
+                    if not len(K):
+                        continue
+                    phi = np.full(K.shape, near_side['phi'])
+                    score = lambda K, phi, sigma_far, premium: _score_calendar(
+                        S, T_near, T_far, r, sigma, K, phi, sigma_far, premium[:, 0], premium[:, 1])
+                    scores = _in_blocks(score, (K, phi, sigma_far, premium), block_size)
+                    weight = np.broadcast_to([-100.0, 100.0], premium.shape)
+                    frames.append(_frame(f'{option_type}_calendar', near, far, np.column_stack([K, K]), premium, weight, scores, prune))
+
+    columns = ['strategy', 'expiration', 'far_expiration', 'strikes', 'net_premium',
+               'max_profit', 'max_loss', 'pop', 'expected_pnl', 'return_on_risk']
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    result = pd.concat(frames, ignore_index=True)[columns]
+    result = result.sort_values(sort_by, ascending=False, kind='stable', ignore_index=True)
+    return result if top is None else result.head(top)
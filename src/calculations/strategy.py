@@ -0,0 +1,338 @@
+# src/calculations/strategy.py
+
+from dataclasses import dataclass
+import numpy as np
+from src.pricing.engines import option_price
+from src.pricing.greeks import batch_greeks
+from src.pricing.payoff import payoff_sign
+from src import instrumentation
+
+@dataclass(frozen=True)
+class OptionLeg:
+    """
+    One leg of a multi-leg option position.
+
+    Attributes:
+    option_type : str
+        'call' or 'put'
+    strike : float
+        Strike price
+    expiry : float
+        Time to expiration in years, measured from today
+    quantity : int
+        Number of contracts (1 contract = 100 options)
+    side : str
+        'long' or 'short'
+    premium : float
+        Premium paid (long) or received (short) per option
+    implied_volatility : float
+        Volatility used to value the leg before expiry
+    """
+    option_type: str
+    strike: float
+    expiry: float
+    quantity: int = 1
+    side: str = 'long'
+    premium: float = 0.0
+    implied_volatility: float = 0.2
+
+    def __post_init__(self):
+        payoff_sign(self.option_type)
+        if self.side.lower() not in ('long', 'short'):
+            raise ValueError("side must be 'long' or 'short'")
+
+    @property
+    def direction(self):
+        return 1 if self.side.lower() == 'long' else -1
+
+class Strategy:
+    """
+    A portfolio of option legs on one underlying, evaluated leg-vectorized.
+
+    Every evaluation prices all legs over the shared price grid in a single
+    batched pricing call, so the cost of a four-leg condor is close to that
+    of a single option.
+
+    Parameters:
+    legs : sequence of OptionLeg
+        The legs of the position
+    risk_free_rate : float
+        Annual risk-free interest rate
+    american : bool
+        True for American options, False for European
+    engine : str
+        Pricing engine for legs that have not expired (see src.pricing.engines)
+    """
+
+    def __init__(self, legs, risk_free_rate=0.01, american=True, engine='baw'):
+        if not legs:
+            raise ValueError("a strategy needs at least one leg")
+        self.legs = tuple(legs)
+        self.risk_free_rate = risk_free_rate
+        self.american = american
+        self.engine = engine
+
+        self.option_type = np.array([leg.option_type.lower() for leg in self.legs])
+        self.phi = np.array([payoff_sign(leg.option_type) for leg in self.legs])
+        self.strike = np.array([leg.strike for leg in self.legs], dtype=float)
+        self.expiry = np.array([leg.expiry for leg in self.legs], dtype=float)
+        self.premium = np.array([leg.premium for leg in self.legs], dtype=float)
+        self.sigma = np.array([leg.implied_volatility for leg in self.legs], dtype=float)
+        # Signed number of options per leg
+        self.weight = np.array([leg.direction * leg.quantity * 100 for leg in self.legs], dtype=float)
+
+    @property
+    def entry_cost(self):
+        """
+        Net premium paid to open the position (negative for a net credit).
+        """
+        return float(self.weight @ self.premium)
+
+    def _leg_values(self, price_range, horizons):
+        """
+        Value every leg at every (horizon, price) point.
+
+        Returns an array of shape (legs, horizons, prices).
+        """
+        S = np.asarray(price_range, dtype=float)[np.newaxis, np.newaxis, :]
+        remaining = self.expiry[:, np.newaxis, np.newaxis] - np.asarray(horizons, dtype=float)[np.newaxis, :, np.newaxis]
+        shape = np.broadcast_shapes(S.shape, remaining.shape)
+
+        leg = lambda x: np.broadcast_to(x[:, np.newaxis, np.newaxis], shape)
+        S = np.broadcast_to(S, shape)
+        remaining = np.broadcast_to(remaining, shape)
+
+        values = np.maximum(leg(self.phi) * (S - leg(self.strike)), 0.0)
+        live = remaining > 0
+        if np.any(live):
+            # S = 0 is a valid grid point; log(0) in the closed forms is harmless
+            with np.errstate(divide='ignore'):
+                values[live] = option_price(
+                    S[live], leg(self.strike)[live], remaining[live], self.risk_free_rate,
+                    leg(self.sigma)[live], leg(self.option_type)[live], self.american,
+                    engine=self.engine,
+                )
+        return values
+
+    @instrumentation.timed('calculations.strategy_pnl_surface')
+    def pnl_surface(self, price_range, horizons):
+        """
+        Calculate position P&L over underlying prices and horizons.
+
+        Parameters:
+        price_range : array_like
+            Underlying prices
+        horizons : array_like
+            Times from today in years at which to value the position
+
+        Returns:
+        pnl : ndarray
+            P&L of shape (len(horizons), len(price_range))
+        """
+        values = self._leg_values(price_range, np.atleast_1d(horizons))
+        weighted = self.weight[:, np.newaxis, np.newaxis] * (values - self.premium[:, np.newaxis, np.newaxis])
+        return weighted.sum(axis=0)
+
+    def pnl(self, price_range, horizon=None):
+        """
+        Calculate position P&L over underlying prices at one horizon.
+
+        Parameters:
+        price_range : array_like
+            Underlying prices
+        horizon : float, optional
+            Time from today in years; defaults to the earliest expiry
+
+        Returns:
+        pnl : ndarray
+            P&L per underlying price
+        """
+        horizon = self.expiry.min() if horizon is None else horizon
+        return self.pnl_surface(price_range, [horizon])[0]
+
+    def expires_by(self, horizon):
+        return bool(np.all(self.expiry <= horizon))
+
+    def _bracket_points(self, lower, upper):
+        inner = np.unique(self.strike[(self.strike > lower) & (self.strike < upper)])
+        return np.concatenate([[lower], inner, [upper]])
+
+    def breakevens(self, lower=None, upper=None, horizon=None, tol=1e-8, pnl_tol=1e-8, max_iter=100):
+        """
+        Find the underlying prices at which the position breaks even.
+
+        The strikes split [lower, upper] into brackets on which the P&L is
+        linear at expiry (and smooth before it). Brackets with a sign change
+        are solved together with a vectorized Illinois false-position
+        iteration, so each iteration is one batched evaluation of the P&L.
+
+        Parameters:
+        lower, upper : float, optional
+            Search interval; defaults to [0, 3 * highest strike]
+        horizon : float, optional
+            Time from today in years; defaults to the earliest expiry
+        tol : float
+            Tolerance on the breakeven price: width of the bracket
+        pnl_tol : float
+            Tolerance on the P&L at the breakeven, in dollars
+        max_iter : int
+            Maximum number of iterations
+
+        Returns:
+        breakevens : ndarray
+            Sorted breakeven prices
+        """
+        horizon = self.expiry.min() if horizon is None else horizon
+        lower = 0.0 if lower is None else lower
+        upper = 3 * self.strike.max() if upper is None else upper
+
+        points = self._bracket_points(lower, upper)
+        values = self.pnl(points, horizon)
+        exact = points[values == 0]
+
+        a, b = points[:-1], points[1:]
+        fa, fb = values[:-1], values[1:]
+        crossing = fa * fb < 0
+        a, b, fa, fb = a[crossing], b[crossing], fa[crossing], fb[crossing]
+        side = np.zeros(a.shape, dtype=int)
+
+        roots = a.copy()
+        for _ in range(max_iter):
+            if not a.size:
+                break
+            roots = b - fb * (b - a) / (fb - fa)
+            fr = self.pnl(roots, horizon)
+            if np.all((np.abs(fr) < pnl_tol) | (b - a < tol)):
+                break
+            # Illinois modification: halve the retained end's value when the
+            # same end is kept twice in a row
+            left = fa * fr < 0
+            fa = np.where(left & (side == 1), fa / 2, fa)
+            fb = np.where(~left & (side == -1), fb / 2, fb)
+            b, fb = np.where(left, roots, b), np.where(left, fr, fb)
+            a, fa = np.where(left, a, roots), np.where(left, fa, fr)
+            side = np.where(left, 1, -1)
+
+        return np.unique(np.concatenate([exact, roots if crossing.any() else []]))
+
+    def extremes(self, price_range=None, horizon=None):
+        """
+        Calculate maximum profit and maximum loss at a horizon.
+
+        When every leg has expired by the horizon the P&L is piecewise linear
+        in the underlying price, so the extremes are exact: they sit at a
+        strike, at zero, or are unbounded when the slope beyond the highest
+        strike is non-zero. Otherwise the P&L is evaluated on price_range.
+
+        Parameters:
+        price_range : array_like, optional
+            Grid for positions with legs still alive at the horizon; defaults
+            to 2001 points between 0 and 3 * highest strike
+        horizon : float, optional
+            Time from today in years; defaults to the earliest expiry
+
+        Returns:
+        extremes : dict
+            'max_profit' and 'max_loss' (negative for a loss); either may be
+            infinite
+        """
+        horizon = self.expiry.min() if horizon is None else horizon
+        if self.expires_by(horizon):
+            points = np.concatenate([[0.0], np.unique(self.strike)])
+            values = self.pnl(points, horizon)
+            tail_slope = float(self.weight[self.phi > 0].sum())
+            max_profit = np.inf if tail_slope > 0 else values.max()
+            max_loss = -np.inf if tail_slope < 0 else values.min()
+        else:
+            if price_range is None:
+                price_range = np.linspace(0, 3 * self.strike.max(), 2001)
+            values = self.pnl(price_range, horizon)
+            max_profit, max_loss = values.max(), values.min()
+        return {'max_profit': float(max_profit), 'max_loss': float(max_loss)}
+
+    def greeks(self, S, N=100):
+        """
+        Calculate position-level Greeks with one batched Binomial pass.
+
+        Parameters:
+        S : float
+            Current stock price
+        N : int
+            Number of time steps
+
+        Returns:
+        greeks : dict
+            'value', 'delta', 'gamma', 'theta', 'vega' and 'rho' of the whole
+            position, in dollars per unit change (theta per year)
+        """
+        leg_greeks = batch_greeks(
+            S, self.strike, self.expiry, self.risk_free_rate, self.sigma,
+            self.option_type, self.american, N,
+        )
+        totals = {name: float(self.weight @ values) for name, values in leg_greeks.items()}
+        totals['value'] = totals.pop('price')
+        return totals
+
+def _per_leg(value, count):
+    """
+    Expand a scalar to one value per leg.
+    """
+    values = np.broadcast_to(np.asarray(value, dtype=float), (count,))
+    return [float(v) for v in values]
+
+def vertical_spread(option_type, long_strike, short_strike, expiry, premiums=(0.0, 0.0), quantity=1, implied_volatility=0.2, **kwargs):
+    """
+    Build a vertical spread: long one strike, short another, same expiry.
+    premiums and implied_volatility are given in (long, short) order.
+    """
+    premiums, sigma = _per_leg(premiums, 2), _per_leg(implied_volatility, 2)
+    return Strategy([
+        OptionLeg(option_type, long_strike, expiry, quantity, 'long', premiums[0], sigma[0]),
+        OptionLeg(option_type, short_strike, expiry, quantity, 'short', premiums[1], sigma[1]),
+    ], **kwargs)
+
+def straddle(strike, expiry, premiums=(0.0, 0.0), quantity=1, side='long', implied_volatility=0.2, **kwargs):
+    """
+    Build a straddle: a call and a put at the same strike and expiry.
+    premiums and implied_volatility are given in (call, put) order.
+    """
+    premiums, sigma = _per_leg(premiums, 2), _per_leg(implied_volatility, 2)
+    return Strategy([
+        OptionLeg('call', strike, expiry, quantity, side, premiums[0], sigma[0]),
+        OptionLeg('put', strike, expiry, quantity, side, premiums[1], sigma[1]),
+    ], **kwargs)
+
+def strangle(put_strike, call_strike, expiry, premiums=(0.0, 0.0), quantity=1, side='long', implied_volatility=0.2, **kwargs):
+    """
+    Build a strangle: an out-of-the-money put and call with the same expiry.
+    premiums and implied_volatility are given in (put, call) order.
+    """
+    premiums, sigma = _per_leg(premiums, 2), _per_leg(implied_volatility, 2)
+    return Strategy([
+        OptionLeg('put', put_strike, expiry, quantity, side, premiums[0], sigma[0]),
+        OptionLeg('call', call_strike, expiry, quantity, side, premiums[1], sigma[1]),
+    ], **kwargs)
+
+def iron_condor(long_put, short_put, short_call, long_call, expiry, premiums=(0.0, 0.0, 0.0, 0.0), quantity=1, implied_volatility=0.2, **kwargs):
+    """
+    Build a short iron condor: a bull put spread plus a bear call spread.
+    premiums and implied_volatility follow the strike order of the arguments.
+    """
+    premiums, sigma = _per_leg(premiums, 4), _per_leg(implied_volatility, 4)
+    return Strategy([
+        OptionLeg('put', long_put, expiry, quantity, 'long', premiums[0], sigma[0]),
+        OptionLeg('put', short_put, expiry, quantity, 'short', premiums[1], sigma[1]),
+        OptionLeg('call', short_call, expiry, quantity, 'short', premiums[2], sigma[2]),
+        OptionLeg('call', long_call, expiry, quantity, 'long', premiums[3], sigma[3]),
+    ], **kwargs)
+
+def calendar_spread(option_type, strike, near_expiry, far_expiry, premiums=(0.0, 0.0), quantity=1, implied_volatility=0.2, **kwargs):
+    """
+    Build a calendar spread: short the near expiry, long the far expiry.
+    premiums and implied_volatility are given in (near, far) order.
+    """
+    premiums, sigma = _per_leg(premiums, 2), _per_leg(implied_volatility, 2)
+    return Strategy([
+        OptionLeg(option_type, strike, near_expiry, quantity, 'short', premiums[0], sigma[0]),
+        OptionLeg(option_type, strike, far_expiry, quantity, 'long', premiums[1], sigma[1]),
+    ], **kwargs)
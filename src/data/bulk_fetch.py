@@ -0,0 +1,256 @@
+# src/data/bulk_fetch.py
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Optional
+
+@dataclass(frozen=True)
+class ChainResult:
+    """
+    Outcome of fetching one option chain.
+
+    expiration is None when the symbol's expiration dates could not be
+    fetched, in which case error explains why and no chains were requested.
+    """
+    symbol: str
+    expiration: Optional[str]
+    calls: Any = None
+    puts: Any = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+@dataclass
+class BulkFetchReport:
+    """
+    Collected results of a bulk fetch.
+
+    Attributes:
+    chains : dict
+        (symbol, expiration) -> (calls, puts) for every successful fetch
+    failures : list of ChainResult
+        Failed fetches, with the last error of each. A failed expiration
+        lookup carries its own attempts here.
+    attempts : int
+        Chain requests made, including retries. Expiration lookups are not
+        counted.
+    elapsed : float
+        Wall-clock seconds for the whole fetch
+    """
+    chains: dict
+    failures: list
+    attempts: int
+    elapsed: float
+
+    def summary(self):
+        return {
+            'succeeded': len(self.chains),
+            'failed': len(self.failures),
+            'attempts': self.attempts,
+            'elapsed': self.elapsed,
+            'chains_per_second': len(self.chains) / self.elapsed if self.elapsed else 0.0,
+        }
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing `rate` requests per second on average,
+    with bursts of up to `burst` requests.
+    """
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a request may be made.
+        """
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            self.sleep(wait_time)
+
+class BulkFetcher:
+    """
+    Fetch option chains for many symbols concurrently.
+
+    Requests run on a bounded thread pool against one provider, so an
+    HttpProvider or YFinanceProvider created with a session shares its
+    connections across threads. Every request passes through an optional
+    rate limiter and is retried with exponential backoff; LookupError
+    (data that does not exist) is not retried. Results are yielded as they
+    arrive, and at most two requests per worker are queued at any time, so
+    a large universe never builds a backlog of futures.
+
+    Parameters:
+    provider : MarketDataProvider
+        Source of expirations and chains (see src.data.providers)
+    max_workers : int
+        Number of concurrent requests
+    rate_limit : float, optional
+        Maximum requests per second across all workers
+    burst : int
+        Requests allowed back to back under the rate limit
+    retries : int
+        Retries after the first attempt of each request
+    backoff : float
+        Delay before the first retry, in seconds; doubled on each retry
+    max_backoff : float
+        Upper bound of the retry delay
+    jitter : bool
+        Randomize each delay between half and all of its value so workers
+        that failed together do not retry together
+    sleep : callable
+        Used for backoff and rate limiting; replaceable in tests
+    """
+
+    def __init__(self, provider, max_workers=8, rate_limit=None, burst=1, retries=3,
+                 backoff=0.5, max_backoff=8.0, jitter=True, sleep=time.sleep):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.provider = provider
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(rate_limit, burst, sleep=sleep) if rate_limit else None
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.sleep = sleep
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self):
+        self._executor.shutdown(cancel_futures=True)
+
+    def _call(self, fetch, *args):
+        """
+        Run one request with rate limiting and retries.
+
+        Returns:
+        (value, error, attempts, elapsed)
+        """
+        start = time.perf_counter()
+        for attempt in range(self.retries + 1):
+            if self.limiter is not None:
+                self.limiter.acquire()
+            try:
+                return fetch(*args), None, attempt + 1, time.perf_counter() - start
+            except LookupError as e:
+                return None, e, attempt + 1, time.perf_counter() - start
+            except Exception as e:
+                error = e
+                if attempt < self.retries:
+                    delay = min(self.max_backoff, self.backoff * 2**attempt)
+                    self.sleep(delay * random.uniform(0.5, 1.0) if self.jitter else delay)
+        return None, error, self.retries + 1, time.perf_counter() - start
+
+    def _stream(self, symbols, pairs, select):
+        """
+        Run expiration lookups for `symbols` and chain fetches for `pairs`,
+        plus the chains each lookup produces, yielding ChainResults.
+        """
+        symbols, pairs = iter(symbols), iter(pairs)
+        follow_ups = deque()
+        pending = {}
+
+        def next_task():
+            if follow_ups:
+                return follow_ups.popleft()
+            for source, kind in ((pairs, 'chain'), (symbols, 'expirations')):
+                item = next(source, None)
+                if item is not None:
+                    return (kind, item)
+            return None
+
+        try:
+            while True:
+                while len(pending) < 2 * self.max_workers:
+                    task = next_task()
+                    if task is None:
+                        break
+                    kind, item = task
+                    if kind == 'chain':
+                        future = self._executor.submit(self._call, self.provider.get_option_chain, *item)
+                    else:
+                        future = self._executor.submit(self._call, self.provider.get_expirations, item)
+                    pending[future] = task
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, item = pending.pop(future)
+                    value, error, attempts, elapsed = future.result()
+                    if kind == 'chain':
+                        calls, puts = value if error is None else (None, None)
+                        yield ChainResult(item[0], item[1], calls, puts, error, attempts, elapsed)
+                    elif error is not None:
+                        yield ChainResult(item, None, error=error, attempts=attempts, elapsed=elapsed)
+                    else:
+                        follow_ups.extend(('chain', (item, expiration)) for expiration in select(item, value))
+        finally:
+            # Stop outstanding requests if the caller abandons the stream
+            for future in pending:
+                future.cancel()
+
+    def stream_chains(self, pairs):
+        """
+        Fetch chains for (symbol, expiration) pairs, yielding ChainResults
+        in completion order.
+        """
+        return self._stream((), pairs, None)
+
+    def stream_universe(self, symbols, max_expirations=None):
+        """
+        Look up the expirations of every symbol and fetch each chain,
+        yielding ChainResults in completion order.
+
+        Parameters:
+        symbols : iterable of str
+            Stock symbols
+        max_expirations : int, optional
+            Fetch only the nearest expirations of each symbol
+        """
+        select = lambda symbol, expirations: sorted(expirations)[:max_expirations]
+        return self._stream(symbols, (), select)
+
+    def fetch_universe(self, symbols, max_expirations=None):
+        """
+        Collect stream_universe into a BulkFetchReport.
+        """
+        start = time.perf_counter()
+        chains, failures, attempts = {}, [], 0
+        for result in self.stream_universe(symbols, max_expirations):
+            if result.expiration is not None:
+                attempts += result.attempts
+            if result.ok:
+                chains[(result.symbol, result.expiration)] = (result.calls, result.puts)
+            else:
+                failures.append(result)
+        return BulkFetchReport(chains, failures, attempts, time.perf_counter() - start)
@@ -0,0 +1,123 @@
+# src/data/chain.py
+
+import numpy as np
+import pandas as pd
+
+# Attribute name -> column name in the yfinance chain DataFrames
+COLUMNS = {
+    'strike': 'strike',
+    'bid': 'bid',
+    'ask': 'ask',
+    'last': 'lastPrice',
+    'volume': 'volume',
+    'open_interest': 'openInterest',
+    'iv': 'impliedVolatility',
+}
+_INT_FIELDS = ('volume', 'open_interest')
+_BY_COLUMN = {column: field for field, column in COLUMNS.items()}
+
+class OptionChain:
+    """
+    One side (calls or puts) of an option chain held in contiguous arrays.
+
+    Only the seven fields used for pricing and display are kept: float64
+    arrays for strike, bid, ask, last, iv and int64 arrays for volume and
+    open_interest, all sorted by strike. Strike lookups are binary searches,
+    and the arrays are handed out as-is, so passing them to the batch
+    pricing functions copies nothing.
+
+    Fields can be read as attributes (chain.bid) or by their DataFrame column
+    names (chain['lastPrice']), so an OptionChain can stand in for the calls
+    or puts DataFrame in price_option_chain, chain_implied_volatility and
+    scan_strategies.
+    """
+
+    __slots__ = tuple(COLUMNS)
+
+    def __init__(self, strike, bid, ask, last, volume, open_interest, iv):
+        order = np.argsort(strike, kind='stable')
+        values = dict(zip(COLUMNS, (strike, bid, ask, last, volume, open_interest, iv)))
+        for field, value in values.items():
+            value = np.asarray(value, dtype=float)[order]
+            if field in _INT_FIELDS:
+                value = np.nan_to_num(value).astype(np.int64)
+            setattr(self, field, np.ascontiguousarray(value))
+
+    @classmethod
+    def from_frame(cls, frame):
+        """
+        Build a chain from a calls or puts DataFrame; missing columns are
+        filled with NaN (or 0 for volume and open interest).
+        """
+        missing = np.full(len(frame), np.nan)
+        return cls(*(
+            frame[column].to_numpy(dtype=float, na_value=np.nan) if column in frame else missing
+            for column in COLUMNS.values()
+        ))
+
+    def to_frame(self):
+        """
+        Return a DataFrame with the original column names, e.g. for display.
+        """
+        return pd.DataFrame({column: getattr(self, field) for field, column in COLUMNS.items()})
+
+    def __len__(self):
+        return self.strike.size
+
+    def __contains__(self, key):
+        return key in COLUMNS or key in _BY_COLUMN
+
+    def __getitem__(self, key):
+        field = _BY_COLUMN.get(key, key)
+        if field not in COLUMNS:
+            raise KeyError(key)
+        return getattr(self, field)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, field).nbytes for field in COLUMNS)
+
+    def index_of(self, strike):
+        """
+        Return the row of a strike by binary search, raising KeyError if the
+        strike is not listed.
+        """
+        i = int(np.searchsorted(self.strike, strike))
+        for row in (i, i - 1):
+            if 0 <= row < self.strike.size and np.isclose(self.strike[row], strike, rtol=0, atol=1e-9):
+                return row
+        raise KeyError(f"strike {strike} not in chain")
+
+    def values_at(self, strikes, field):
+        """
+        Look up one field for an array of strikes at once; strikes that are
+        not listed get NaN.
+        """
+        strikes = np.asarray(strikes, dtype=float)
+        values = np.full(strikes.shape, np.nan)
+        if not self.strike.size:
+            return values
+        i = np.clip(np.searchsorted(self.strike, strikes), 0, self.strike.size - 1)
+        for rows in (i, np.maximum(i - 1, 0)):
+            found = np.isclose(self.strike[rows], strikes, rtol=0, atol=1e-9) & np.isnan(values)
+            values[found] = self[field][rows[found]]
+        return values
+
+    def get(self, strike, field):
+        """
+        Return one field (attribute or column name) for a strike.
+        """
+        return self[field][self.index_of(strike)].item()
+
+    def row(self, strike):
+        """
+        Return every field of a strike as a dict keyed by column name.
+        """
+        i = self.index_of(strike)
+        return {column: getattr(self, field)[i].item() for field, column in COLUMNS.items()}
+
+def from_frames(calls, puts):
+    """
+    Convert the (calls, puts) pair from get_option_chain; None stays None.
+    """
+    return tuple(None if side is None else OptionChain.from_frame(side) for side in (calls, puts))
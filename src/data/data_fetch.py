@@ -1,35 +1,60 @@
 # src/data/data_fetch.py
 
+import logging
 import yfinance as yf
-import streamlit as st
-import pandas as pd
+from src import instrumentation
+
+logger = logging.getLogger(__name__)
+
+@instrumentation.timed('data.fetch_real_time_price')
+def fetch_real_time_price(symbol, session=None):
+    """
+    Fetches the latest close for the given symbol, raising on failure.
+    An HTTP session may be passed to share connections between calls.
+    """
+    stock = yf.Ticker(symbol, session=session)
+    data = stock.history(period='1d')
+    return data['Close'].iloc[-1]
+
+@instrumentation.timed('data.fetch_expirations')
+def fetch_expirations(symbol, session=None):
+    """
+    Fetches the listed option expiration dates for the given symbol.
+    """
+    stock = yf.Ticker(symbol, session=session)
+    return tuple(stock.options)
+
+@instrumentation.timed('data.fetch_option_chain')
+def fetch_option_chain(symbol, expiration_date, session=None):
+    """
+    Fetches the calls and puts DataFrames for the given symbol and
+    expiration date, raising on failure.
+    """
+    stock = yf.Ticker(symbol, session=session)
+    opt_chain = stock.option_chain(expiration_date)
+    return opt_chain.calls, opt_chain.puts
 
-@st.cache_data
 def get_real_time_price(symbol):
     """
     Fetches the real-time stock price for the given symbol.
+    Returns None and logs the error on failure.
     """
     try:
-        stock = yf.Ticker(symbol)
-        data = stock.history(period='1d')
-        current_price = data['Close'].iloc[-1]
-        return current_price
+        return fetch_real_time_price(symbol)
     except Exception as e:
-        st.error(f"Error fetching real-time price: {e}")
+        instrumentation.increment('data.fetch_errors')
+        logger.error("Error fetching real-time price: %s", e)
         return None
 
-@st.cache_data
 def get_option_chain(symbol, expiration_date):
     """
     Fetches the option chain for the given symbol and expiration date.
-    Returns separate DataFrames for calls and puts, including implied volatility.
+    Returns separate DataFrames for calls and puts, including implied volatility,
+    or (None, None) and logs the error on failure.
     """
     try:
-        stock = yf.Ticker(symbol)
-        opt_chain = stock.option_chain(expiration_date)
-        calls = opt_chain.calls
-        puts = opt_chain.puts
-        return calls, puts
+        return fetch_option_chain(symbol, expiration_date)
     except Exception as e:
-        st.error(f"Error fetching option chain: {e}")
-        return None, None
\ No newline at end of file
+        instrumentation.increment('data.fetch_errors')
+        logger.error("Error fetching option chain: %s", e)
+        return None, None
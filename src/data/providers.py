@@ -0,0 +1,204 @@
+# src/data/providers.py
+
+import os
+import time
+from abc import ABC, abstractmethod
+from urllib.parse import quote
+import pandas as pd
+from src.data.store import MarketDataStore, _snapshot_time
+
+class MarketDataProvider(ABC):
+    """
+    Common interface of market data sources.
+
+    Every method raises on failure (LookupError when the data does not
+    exist); callers such as MarketDataStore decide how to degrade.
+    """
+
+    @abstractmethod
+    def get_spot(self, symbol):
+        """
+        Return the current stock price.
+        """
+
+    @abstractmethod
+    def get_expirations(self, symbol):
+        """
+        Return the listed option expiration dates as a tuple of strings.
+        """
+
+    @abstractmethod
+    def get_option_chain(self, symbol, expiration):
+        """
+        Return the (calls, puts) DataFrames for one expiration.
+        """
+
+class YFinanceProvider(MarketDataProvider):
+    """
+    Live data from Yahoo Finance through the fetch functions of data_fetch.
+
+    Parameters:
+    session : optional
+        HTTP session handed to yfinance so concurrent requests share
+        connections; yfinance creates its own when omitted
+    """
+
+    def __init__(self, session=None):
+        # Imported here so replay-only jobs never pay for importing yfinance
+        from src.data import data_fetch
+        self._fetch = data_fetch
+        self.session = session
+
+    def get_spot(self, symbol):
+        return self._fetch.fetch_real_time_price(symbol, session=self.session)
+
+    def get_expirations(self, symbol):
+        return self._fetch.fetch_expirations(symbol, session=self.session)
+
+    def get_option_chain(self, symbol, expiration):
+        return self._fetch.fetch_option_chain(symbol, expiration, session=self.session)
+
+class HttpProvider(MarketDataProvider):
+    """
+    JSON-over-HTTP feed, such as an internal market data service.
+
+    Endpoints, relative to base_url:
+        GET spot/<symbol>                  {"price": float}
+        GET expirations/<symbol>           {"expirations": [str, ...]}
+        GET chain/<symbol>/<expiration>    {"calls": [row, ...], "puts": [row, ...]}
+
+    A 404 raises LookupError; other HTTP errors raise requests.HTTPError.
+    One requests.Session is shared by all calls, and threads, so
+    connections are pooled.
+
+    Parameters:
+    base_url : str
+        Root URL of the feed
+    session : requests.Session, optional
+        Session to use; a new one sized for pool_size connections is
+        created when omitted
+    timeout : float
+        Seconds to wait for each response
+    pool_size : int
+        Connections kept open per host
+    """
+
+    def __init__(self, base_url, session=None, timeout=10.0, pool_size=16):
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.base_url = base_url.rstrip('/') + '/'
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        self.timeout = timeout
+
+    def _get(self, *parts):
+        url = self.base_url + '/'.join(quote(str(part), safe='') for part in parts)
+        response = self.session.get(url, timeout=self.timeout)
+        if response.status_code == 404:
+            raise LookupError(f"{url} not found")
+        response.raise_for_status()
+        return response.json()
+
+    def get_spot(self, symbol):
+        return float(self._get('spot', symbol)['price'])
+
+    def get_expirations(self, symbol):
+        return tuple(self._get('expirations', symbol)['expirations'])
+
+    def get_option_chain(self, symbol, expiration):
+        data = self._get('chain', symbol, expiration)
+        return pd.DataFrame(data['calls']), pd.DataFrame(data['puts'])
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Serve snapshots recorded by MarketDataStore as if they were live.
+
+    The provider keeps a replay clock that starts at `start` and advances
+    `speed` times as fast as wall-clock time; each request returns the
+    latest snapshot taken at or before the replay time. speed=0 freezes the
+    clock, which makes batch jobs and benchmarks fully deterministic; seek()
+    and advance() move it explicitly.
+
+    Parameters:
+    root : str
+        Snapshot directory of a MarketDataStore
+    speed : float
+        Replay seconds per wall-clock second
+    start : float, optional
+        Replay start time in seconds since the epoch; defaults to the
+        earliest recorded snapshot
+    clock : callable
+        Wall-clock source, in seconds
+    """
+
+    def __init__(self, root, speed=1.0, start=None, clock=time.monotonic):
+        if speed < 0:
+            raise ValueError("speed must be non-negative")
+        self._store = MarketDataStore(root, offline=True)
+        self.speed = speed
+        self.clock = clock
+        self.seek(self.first_snapshot() if start is None else start)
+
+    def first_snapshot(self):
+        """
+        Return the time of the earliest recorded snapshot (0 if none).
+        """
+        times = [
+            _snapshot_time(name)
+            for _, _, names in os.walk(self._store.root)
+            for name in names if name.endswith('.parquet')
+        ]
+        return min(times, default=0.0)
+
+    def seek(self, timestamp):
+        """
+        Move the replay clock to a point in time.
+        """
+        self._start = timestamp
+        self._wall_start = self.clock()
+
+    def advance(self, seconds):
+        """
+        Move the replay clock forward.
+        """
+        self.seek(self.now() + seconds)
+
+    def now(self):
+        """
+        Return the current replay time.
+        """
+        return self._start + (self.clock() - self._wall_start) * self.speed
+
+    def _load(self, kind, symbol, expiration=None):
+        snapshot = self._store.load(kind, symbol, expiration, at=self.now())
+        if snapshot is None:
+            raise LookupError(f"no {kind} recorded for {symbol} by the replay time")
+        return snapshot[1]
+
+    def get_spot(self, symbol):
+        return self._load('spot', symbol)
+
+    def get_expirations(self, symbol):
+        return self._load('expirations', symbol)
+
+    def get_option_chain(self, symbol, expiration):
+        return self._load('chain', symbol, expiration)
+
+# Providers selectable by name, e.g. from configuration or the command line
+PROVIDERS = {
+    'yfinance': YFinanceProvider,
+    'http': HttpProvider,
+    'replay': ReplayProvider,
+}
+
+def get_provider(name, **kwargs):
+    """
+    Build a provider by name; keyword arguments go to its constructor.
+    """
+    if name not in PROVIDERS:
+        raise ValueError(f"provider must be one of {tuple(PROVIDERS)}")
+    return PROVIDERS[name](**kwargs)
@@ -0,0 +1,235 @@
+# src/data/store.py
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+import pandas as pd
+from src import instrumentation
+
+logger = logging.getLogger(__name__)
+
+# Seconds a snapshot stays fresh, per kind of data
+DEFAULT_TTL = {'spot': 60, 'expirations': 3600, 'chain': 300}
+
+# Snapshot files are named by their UTC fetch time, so sorting the names
+# sorts the snapshots
+_TIMESTAMP_FORMAT = '%Y%m%dT%H%M%S%fZ'
+
+def _snapshot_name(fetched_at):
+    return datetime.fromtimestamp(fetched_at, timezone.utc).strftime(_TIMESTAMP_FORMAT) + '.parquet'
+
+def _snapshot_time(name):
+    stamp = datetime.strptime(name[:-len('.parquet')], _TIMESTAMP_FORMAT)
+    return stamp.replace(tzinfo=timezone.utc).timestamp()
+
+def _to_frame(kind, value):
+    """
+    Convert fetched data to the DataFrame written to disk.
+    """
+    if kind == 'spot':
+        return pd.DataFrame({'price': [float(value)]})
+    if kind == 'expirations':
+        return pd.DataFrame({'expiration': list(value)}, dtype=str)
+    calls, puts = value
+    return pd.concat([calls.assign(optionType='call'), puts.assign(optionType='put')], ignore_index=True)
+
+def _from_frame(kind, frame):
+    """
+    Inverse of _to_frame.
+    """
+    if kind == 'spot':
+        return float(frame['price'].iloc[0])
+    if kind == 'expirations':
+        return tuple(frame['expiration'])
+    sides = [
+        frame[frame['optionType'] == option_type].drop(columns='optionType').reset_index(drop=True)
+        for option_type in ('call', 'put')
+    ]
+    return tuple(sides)
+
+class MarketDataStore:
+    """
+    Read-through store of spot prices, expirations and option chains.
+
+    Every fetch is written as a timestamped Parquet snapshot under
+    root/<SYMBOL>/<kind>/ and kept in memory. Snapshots are history that
+    the store and ReplayProvider can replay, so they are all kept unless
+    `keep` is given. Reads are served from memory,
+    then from the latest snapshot on disk, and only go to the network when
+    both are older than the TTL of that kind of data. If a fetch fails, the
+    latest snapshot is served however old it is. In offline mode the network
+    is never used, so the store replays recorded snapshots.
+
+    Parameters:
+    root : str
+        Directory holding the snapshots
+    ttl : dict, optional
+        Seconds each kind ('spot', 'expirations', 'chain') stays fresh;
+        merged over DEFAULT_TTL
+    offline : bool
+        Serve recorded snapshots only
+    provider : MarketDataProvider, optional
+        Source of fresh data (see src.data.providers); defaults to
+        YFinanceProvider
+    clock : callable
+        Returns the current time in seconds since the epoch
+    keep : int, optional
+        Keep only this many of the newest snapshots on disk per symbol, kind
+        and expiration, deleting older ones; None (default) keeps them all
+    """
+
+    def __init__(self, root, ttl=None, offline=False, provider=None, clock=time.time, keep=None):
+        if provider is None and not offline:
+            from src.data.providers import YFinanceProvider
+            provider = YFinanceProvider()
+        self.root = root
+        self.ttl = {**DEFAULT_TTL, **(ttl or {})}
+        unknown = set(self.ttl) - set(DEFAULT_TTL)
+        if unknown:
+            raise ValueError(f"ttl keys must be among {tuple(DEFAULT_TTL)}")
+        if keep is not None and keep < 1:
+            raise ValueError("keep must be at least 1")
+        self.offline = offline
+        self.keep = keep
+        self.provider = provider
+        self.clock = clock
+        self._memory = {}
+        self._lock = threading.Lock()
+        self.reads = {'memory': 0, 'disk': 0, 'fetch': 0}
+
+    def _directory(self, kind, symbol, expiration=None):
+        parts = [self.root, symbol.upper(), kind]
+        if expiration is not None:
+            parts.append(str(expiration))
+        return os.path.join(*parts)
+
+    def snapshots(self, kind, symbol, expiration=None):
+        """
+        List the fetch times of the recorded snapshots, oldest first.
+        """
+        directory = self._directory(kind, symbol, expiration)
+        if not os.path.isdir(directory):
+            return []
+        names = sorted(name for name in os.listdir(directory) if name.endswith('.parquet'))
+        return [_snapshot_time(name) for name in names]
+
+    def load(self, kind, symbol, expiration=None, at=None):
+        """
+        Load a recorded snapshot.
+
+        Parameters:
+        kind : str
+            'spot', 'expirations' or 'chain'
+        symbol : str
+            Stock symbol
+        expiration : str, optional
+            Expiration date, for chains
+        at : float, optional
+            Return the latest snapshot taken at or before this time;
+            defaults to the latest snapshot
+
+        Returns:
+        snapshot : tuple or None
+            (fetched_at, value), or None if nothing was recorded
+        """
+        times = [t for t in self.snapshots(kind, symbol, expiration) if at is None or t <= at]
+        if not times:
+            return None
+        path = os.path.join(self._directory(kind, symbol, expiration), _snapshot_name(times[-1]))
+        return times[-1], _from_frame(kind, pd.read_parquet(path))
+
+    def save(self, kind, symbol, value, expiration=None, fetched_at=None):
+        """
+        Record a snapshot on disk and in memory.
+        """
+        fetched_at = self.clock() if fetched_at is None else fetched_at
+        directory = self._directory(kind, symbol, expiration)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, _snapshot_name(fetched_at))
+        # Write to a temporary file first so readers never see a partial snapshot
+        _to_frame(kind, value).to_parquet(path + '.tmp', index=False)
+        os.replace(path + '.tmp', path)
+        with self._lock:
+            self._memory[(kind, symbol.upper(), expiration)] = (fetched_at, value)
+            if self.keep is not None:
+                self._prune(directory)
+
+    def _prune(self, directory):
+        """
+        Delete all but the newest `keep` snapshots in a directory.
+        """
+        names = sorted(name for name in os.listdir(directory) if name.endswith('.parquet'))
+        for name in names[:-self.keep]:
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass
+
+    def _count_read(self, layer):
+        with self._lock:
+            self.reads[layer] += 1
+        instrumentation.increment(f'data.store_reads.{layer}')
+
+    def _read(self, kind, symbol, expiration, fetch, missing):
+        key = (kind, symbol.upper(), expiration)
+        now = self.clock()
+        with self._lock:
+            cached = self._memory.get(key)
+        if cached is not None and (self.offline or now - cached[0] < self.ttl[kind]):
+            self._count_read('memory')
+            return cached[1]
+
+        recorded = self.load(kind, symbol, expiration)
+        if recorded is not None and (self.offline or now - recorded[0] < self.ttl[kind]):
+            with self._lock:
+                self._memory[key] = recorded
+            self._count_read('disk')
+            return recorded[1]
+        if self.offline:
+            return missing
+
+        try:
+            value = fetch()
+        except Exception:
+            instrumentation.increment('data.fetch_errors')
+            logger.warning("Error fetching %s for %s%s; serving %s", kind, symbol.upper(),
+                           '' if expiration is None else f" {expiration}",
+                           "nothing" if recorded is None else "the last snapshot", exc_info=True)
+            # Serve stale data rather than nothing when the source is down
+            if recorded is not None:
+                self._count_read('disk')
+                return recorded[1]
+            return missing
+        self.save(kind, symbol, value, expiration, now)
+        self._count_read('fetch')
+        return value
+
+    def get_spot(self, symbol):
+        """
+        Return the current stock price, or None if unavailable.
+        """
+        return self._read('spot', symbol, None,
+                          lambda: self.provider.get_spot(symbol), None)
+
+    def get_expirations(self, symbol):
+        """
+        Return the listed expiration dates (empty if unavailable).
+        """
+        return self._read('expirations', symbol, None,
+                          lambda: self.provider.get_expirations(symbol), ())
+
+    def get_option_chain(self, symbol, expiration):
+        """
+        Return the (calls, puts) DataFrames, or (None, None) if unavailable.
+        """
+        return self._read('chain', symbol, expiration,
+                          lambda: self.provider.get_option_chain(symbol, expiration), (None, None))
+
+    def clear_memory(self):
+        """
+        Drop the in-memory layer; snapshots on disk are kept.
+        """
+        with self._lock:
+            self._memory.clear()
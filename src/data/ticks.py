@@ -0,0 +1,83 @@
+# src/data/ticks.py
+
+import asyncio
+import json
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+TICK_KINDS = ('spot', 'quote')
+
+@dataclass(frozen=True)
+class Tick:
+    """
+    One market data update.
+
+    A 'spot' tick carries the underlying price; a 'quote' tick carries the
+    bid, ask and (optionally) implied volatility of one option contract.
+
+    Attributes:
+    time : float
+        Event time in seconds since the epoch
+    kind : str
+        'spot' or 'quote'
+    symbol : str
+        Underlying symbol
+    price : float, optional
+        Underlying price, for spot ticks
+    contract : str, optional
+        Contract identifier (e.g. the contractSymbol of a yfinance chain),
+        for quote ticks
+    bid, ask, iv : float, optional
+        Quote fields
+    """
+    time: float
+    kind: str
+    symbol: str
+    price: Optional[float] = None
+    contract: Optional[str] = None
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    iv: Optional[float] = None
+
+    def __post_init__(self):
+        if self.kind not in TICK_KINDS:
+            raise ValueError(f"kind must be one of {TICK_KINDS}")
+
+def write_ticks(path, ticks):
+    """
+    Record ticks as JSON lines, omitting empty fields.
+    """
+    with open(path, 'w') as f:
+        for tick in ticks:
+            record = {name: value for name, value in asdict(tick).items() if value is not None}
+            f.write(json.dumps(record) + '\n')
+
+def read_ticks(path):
+    """
+    Yield the ticks of a JSON-lines replay file in file order.
+    """
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield Tick(**json.loads(line))
+
+async def replay_ticks(path, speed=None):
+    """
+    Replay a tick file as an async stream.
+
+    Parameters:
+    path : str
+        JSON-lines file written by write_ticks
+    speed : float, optional
+        Replay speed relative to the recorded event times (2.0 plays twice
+        as fast); None replays as fast as the consumer reads
+    """
+    previous = None
+    for tick in read_ticks(path):
+        if speed and previous is not None and tick.time > previous:
+            await asyncio.sleep((tick.time - previous) / speed)
+        else:
+            # Yield control so consumers and producers interleave
+            await asyncio.sleep(0)
+        previous = tick.time
+        yield tick
@@ -0,0 +1,225 @@
+# src/instrumentation.py
+
+import bisect
+import functools
+import json
+import math
+import os
+import re
+import threading
+import time
+
+# Upper bounds of the histogram buckets, in seconds for timers and in
+# contracts for batch sizes
+TIME_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+# Stages metric names start with, e.g. 'pricing.batch_option_price'
+STAGES = ('data', 'pricing', 'calculations', 'plotting', 'app')
+
+# Checked before any work is done, so disabled instrumentation costs one
+# global lookup per call
+_enabled = os.environ.get('OPTIONS_METRICS') == '1'
+
+class Histogram:
+    """
+    Fixed-bucket histogram with count, sum, min, max and the last value.
+    """
+
+    __slots__ = ('bounds', 'unit', 'counts', 'count', 'sum', 'min', 'max', 'last')
+
+    def __init__(self, bounds=TIME_BUCKETS, unit='seconds'):
+        self.bounds = tuple(bounds)
+        self.unit = unit
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.last = math.nan
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.last = value
+
+    def quantile(self, q):
+        """
+        Estimate a quantile by linear interpolation within its bucket.
+        """
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.bounds[i - 1] if i > 0 else self.min
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.max
+
+    def to_dict(self):
+        return {
+            'unit': self.unit,
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else math.nan,
+            'min': self.min if self.count else math.nan,
+            'max': self.max if self.count else math.nan,
+            'last': self.last,
+            'p50': self.quantile(0.5),
+            'p99': self.quantile(0.99),
+            'buckets': dict(zip([*map(str, self.bounds), '+Inf'], self.counts)),
+        }
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of counters and histograms.
+
+    Names are dotted and start with their stage, e.g. 'data.fetches' or
+    'pricing.batch_option_price'. Timers are histograms in seconds.
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, value, buckets=TIME_BUCKETS, unit='seconds'):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(buckets, unit)
+            histogram.observe(value)
+
+    def snapshot(self):
+        """
+        Return every metric as plain data.
+
+        Returns:
+        snapshot : dict
+            'counters': name -> value, 'histograms': name -> summary (see
+            Histogram.to_dict)
+        """
+        with self._lock:
+            return {
+                'counters': dict(self.counters),
+                'histograms': {name: h.to_dict() for name, h in self.histograms.items()},
+            }
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_json(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent, sort_keys=True, default=str)
+
+    def to_prometheus(self, prefix='options'):
+        """
+        Render the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            for name, value in sorted(self.counters.items()):
+                metric = _metric_name(prefix, name) + '_total'
+                lines += [f"# TYPE {metric} counter", f"{metric} {_number(value)}"]
+            for name, histogram in sorted(self.histograms.items()):
+                metric = _metric_name(prefix, name) + (f"_{histogram.unit}" if histogram.unit else '')
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, n in zip([*map(_number, histogram.bounds), '+Inf'], histogram.counts):
+                    cumulative += n
+                    lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+                lines += [f"{metric}_sum {_number(histogram.sum)}", f"{metric}_count {histogram.count}"]
+        return '\n'.join(lines) + '\n'
+
+def _metric_name(prefix, name):
+    return re.sub(r'[^a-zA-Z0-9_]', '_', f"{prefix}_{name}" if prefix else name)
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+# Process-wide registry used by the module functions below
+registry = MetricsRegistry()
+
+def enable():
+    global _enabled
+    _enabled = True
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def enabled():
+    return _enabled
+
+def increment(name, value=1):
+    """
+    Add to a counter when instrumentation is enabled.
+    """
+    if _enabled:
+        registry.increment(name, value)
+
+def observe(name, value, buckets=TIME_BUCKETS, unit='seconds'):
+    """
+    Record a histogram observation when instrumentation is enabled.
+    """
+    if _enabled:
+        registry.observe(name, value, buckets, unit)
+
+class _Timer:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        registry.observe(self.name, time.perf_counter() - self.start)
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+_NULL_TIMER = _NullTimer()
+
+def timer(name):
+    """
+    Context manager recording the duration of its block under `name`.
+    """
+    return _Timer(name) if _enabled else _NULL_TIMER
+
+def timed(name):
+    """
+    Decorator recording the duration of every call under `name`.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                registry.observe(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
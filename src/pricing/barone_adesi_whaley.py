@@ -0,0 +1,85 @@
+# src/pricing/barone_adesi_whaley.py
+
+import numpy as np
+from src.pricing.payoff import payoff_signs
+from src.pricing.black_scholes import _black_scholes, _d1_d2, _norm_cdf, _norm_pdf
+
+def _critical_put_price(K, T, r, sigma, q1, tol=1e-6, max_iter=100):
+    """
+    Solve for the critical stock price below which an American put is
+    exercised, using Newton iterations on every contract at once.
+    """
+    sigma_sqrt_T = sigma * np.sqrt(T)
+    M = 2 * r / sigma**2
+
+    # Seed from the perpetual put boundary (Barone-Adesi and Whaley, 1987)
+    q1_inf = (-(M - 1) - np.sqrt((M - 1)**2 + 4 * M)) / 2
+    S_inf = K / (1 - 1 / q1_inf)
+    h1 = (r * T - 2 * sigma_sqrt_T) * K / (K - S_inf)
+    S_star = S_inf + (K - S_inf) * np.exp(h1)
+
+    active = np.ones(np.shape(S_star), dtype=bool)
+    for _ in range(max_iter):
+        d1, _ = _d1_d2(S_star, K, T, r, sigma)
+        put = _black_scholes(S_star, K, T, r, sigma, -1.0)
+        rhs = put - (1 - _norm_cdf(-d1)) * S_star / q1
+        slope = -_norm_cdf(-d1) * (1 - 1 / q1) - (1 + _norm_pdf(-d1) / sigma_sqrt_T) / q1
+
+        active = np.abs(K - S_star - rhs) / K > tol
+        if not np.any(active):
+            break
+        S_star = np.where(active, (K - rhs + slope * S_star) / (1 + slope), S_star)
+
+    return S_star
+
+def barone_adesi_whaley_price(S, K, T, r, sigma, option_type='call'):
+    """
+    Approximate the price of an American option with the quadratic
+    approximation of Barone-Adesi and Whaley (1987).
+
+    The underlying pays no dividends, so early exercise of a call is never
+    optimal and calls are priced with Black-Scholes. All numeric inputs
+    broadcast against each other.
+
+    Parameters:
+    S : float or array_like
+        Current stock price
+    K : float or array_like
+        Strike price
+    T : float or array_like
+        Time to expiration in years
+    r : float or array_like
+        Risk-free interest rate (annual)
+    sigma : float or array_like
+        Volatility of the underlying stock (annual)
+    option_type : str or array_like of str
+        'call' or 'put'
+
+    Returns:
+    price : ndarray
+        Option price
+    """
+    S, K, T, r, sigma, phi = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, T, r, sigma)),
+        payoff_signs(option_type),
+    )
+    european = _black_scholes(S, K, T, r, sigma, phi)
+
+    # Only puts with a positive rate carry an early-exercise premium
+    puts = (phi < 0) & (r > 0)
+    if not np.any(puts):
+        return european
+    S_p, K_p, T_p, r_p, sigma_p = (x[puts] for x in (S, K, T, r, sigma))
+
+    M = 2 * r_p / sigma_p**2
+    q1 = (-(M - 1) - np.sqrt((M - 1)**2 + 4 * M / (1 - np.exp(-r_p * T_p)))) / 2
+    S_star = _critical_put_price(K_p, T_p, r_p, sigma_p, q1)
+
+    d1, _ = _d1_d2(S_star, K_p, T_p, r_p, sigma_p)
+    A1 = -(S_star / q1) * (1 - _norm_cdf(-d1))
+    premium = european[puts] + A1 * (S_p / S_star)**q1
+    american = np.where(S_p > S_star, premium, K_p - S_p)
+
+    price = np.array(european, dtype=float)
+    price[puts] = american
+    return price
@@ -0,0 +1,126 @@
+# src/pricing/batch.py
+
+import numpy as np
+from src.pricing.binomial_model import _lattice_price
+from src.pricing.payoff import payoff_signs
+from src import instrumentation
+
+# Number of lattice nodes (rows x (N + 1)) processed per block. Small blocks
+# keep the working arrays in cache at large N.
+_BLOCK_NODES = 1 << 16
+
+def _contract_columns(S, K, T, r, sigma, option_type, american):
+    """
+    Broadcast contract inputs together and lay each out as an (m, 1) column.
+
+    Returns the broadcast shape and the columns for S, K, T, r, sigma, the
+    payoff sign and the exercise style.
+    """
+    columns = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S, K, T, r, sigma)),
+        payoff_signs(option_type),
+        np.asarray(american, dtype=bool),
+    )
+    shape = columns[0].shape
+    return shape, [x.reshape(-1, 1) for x in columns]
+
+def _default_block_size(N):
+    """
+    Number of contracts per block for an N-step lattice.
+    """
+    return max(1, _BLOCK_NODES // (N + 1))
+
+def _price_columns(S, K, T, r, sigma, phi, american, N, block_size=None, method='crr', backend='numpy'):
+    """
+    Price contracts already laid out as (m, 1) columns by _contract_columns.
+    """
+    block_size = block_size or _default_block_size(N)
+    instrumentation.increment('pricing.lattice_prices', S.shape[0])
+
+    prices = np.empty(S.shape[0])
+    for start in range(0, prices.size, block_size):
+        rows = slice(start, start + block_size)
+        prices[rows] = _lattice_price(
+            S[rows], K[rows], T[rows], r[rows], sigma[rows], phi[rows],
+            american[rows], N, method, backend,
+        )
+    return prices
+
+@instrumentation.timed('pricing.batch_option_price')
+def batch_option_price(S, K, T, r, sigma, option_type='call', american=True, N=100, block_size=None, method='crr', backend='numpy'):
+    """
+    Price many American or European options with the Binomial model at once.
+
+    All inputs broadcast against each other, so a chain of strikes can be priced
+    with scalar S, T, r and an array of K and sigma. Every contract goes through
+    one vectorized backward induction instead of a Python call per contract.
+
+    Parameters:
+    S : float or array_like
+        Current stock price
+    K : float or array_like
+        Strike price
+    T : float or array_like
+        Time to expiration in years
+    r : float or array_like
+        Risk-free interest rate (annual)
+    sigma : float or array_like
+        Volatility of the underlying stock (annual)
+    option_type : str or array_like of str
+        'call' or 'put'
+    american : bool or array_like of bool
+        True for American option, False for European
+    N : int
+        Number of time steps
+    block_size : int, optional
+        Number of contracts rolled back together. Defaults to a size that
+        keeps the working lattice small enough to stay in cache.
+    method : str
+        Lattice variant, see binomial_option_price
+    backend : str
+        'numpy', 'numba' or 'auto', see binomial_option_price
+
+    Returns:
+    prices : ndarray
+        Option prices in input order
+    """
+    shape, (S, K, T, r, sigma, phi, american) = _contract_columns(
+        S, K, T, r, sigma, option_type, american
+    )
+    prices = _price_columns(S, K, T, r, sigma, phi, american, N, block_size, method, backend)
+    return prices.reshape(shape)
+
+@instrumentation.timed('pricing.price_option_chain')
+def price_option_chain(chain, S, T, r, option_type, american=True, N=100, sigma='impliedVolatility', method='crr'):
+    """
+    Price every contract in a calls or puts DataFrame from get_option_chain.
+
+    Parameters:
+    chain : pandas.DataFrame or OptionChain
+        Option chain with a 'strike' column
+    S : float
+        Current stock price
+    T : float or array_like
+        Time to expiration in years, either one value for the whole chain or
+        one per row when the frame mixes several expirations
+    r : float
+        Risk-free interest rate (annual)
+    option_type : str
+        'call' or 'put'
+    american : bool
+        True for American option, False for European
+    N : int
+        Number of time steps
+    sigma : str or float or array_like
+        Name of the volatility column, or the volatility values themselves
+    method : str
+        Lattice variant, see binomial_option_price
+
+    Returns:
+    prices : ndarray
+        Model price for each row of the chain
+    """
+    if isinstance(sigma, str):
+        sigma = np.asarray(chain[sigma], dtype=float)
+    strikes = np.asarray(chain['strike'], dtype=float)
+    return batch_option_price(S, strikes, T, r, sigma, option_type, american, N, method=method)
@@ -1,8 +1,192 @@
 # src/pricing/binomial_model.py
 
 import numpy as np
+from src.pricing.black_scholes import _black_scholes
+from src.pricing.kernels import resolve_backend, rollback_compiled
+from src.pricing.payoff import payoff_sign
+from src import instrumentation
 
-def binomial_option_price(S, K, T, r, sigma, option_type='call', american=True, N=100):
+# Lattice variants accepted through the `method` argument:
+#   'crr'           Cox-Ross-Rubinstein tree
+#   'bbs'           CRR with Black-Scholes values one step before expiry
+#   'bbsr'          two-point Richardson extrapolation of BBS (N and N / 2)
+#   'leisen_reimer' Leisen-Reimer tree (Peizer-Pratt inversion, odd N)
+METHODS = ('crr', 'bbs', 'bbsr', 'leisen_reimer')
+
+def lattice_parameters(T, r, sigma, N):
+    """
+    Compute CRR lattice parameters for each unique (T, r, sigma) combination.
+
+    Parameters:
+    T, r, sigma : ndarray
+        Time to expiration, risk-free rate and volatility per contract
+    N : int
+        Number of time steps
+
+    Returns:
+    u, p, disc : ndarray
+        Up factor, risk-neutral up probability and one-step discount factor
+        per contract. Contracts sharing T, r and sigma share one lattice and
+        receive identical parameters.
+    """
+    T, r, sigma = np.broadcast_arrays(T, r, sigma)
+    keys = np.column_stack([np.ravel(T), np.ravel(r), np.ravel(sigma)])
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(np.shape(T))
+    T_u, r_u, sigma_u = unique_keys.T
+
+    dt = T_u / N
+    u = np.exp(sigma_u * np.sqrt(dt))
+    d = 1 / u
+    growth = np.exp(r_u * dt)
+    p = (growth - d) / (u - d)
+    disc = 1 / growth
+
+    return u[inverse], p[inverse], disc[inverse]
+
+def _peizer_pratt(z, N):
+    """
+    Peizer-Pratt method 2 inversion of the normal distribution onto an
+    N-step binomial distribution.
+    """
+    spread = (z / (N + 1 / 3 + 0.1 / (N + 1)))**2 * (N + 1 / 6)
+    return 0.5 + np.sign(z) * 0.5 * np.sqrt(1 - np.exp(-spread))
+
+def _leisen_reimer_parameters(S, K, T, r, sigma, N):
+    """
+    Compute Leisen-Reimer lattice parameters, which centre the tree on the
+    strike so the price converges smoothly in N.
+
+    Returns:
+    u, d, p, disc : ndarray
+        Up and down factors, risk-neutral up probability and one-step
+        discount factor
+    """
+    dt = T / N
+    sigma_sqrt_T = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+
+    growth = np.exp(r * dt)
+    p = _peizer_pratt(d2, N)
+    u = growth * _peizer_pratt(d1, N) / p
+    d = (growth - p * u) / (1 - p)
+
+    return u, d, p, 1 / growth
+
+def _rollback_layers(S, K, phi, u, p, disc, N, american, keep=0, d=None, smoothing=None):
+    """
+    Run backward induction through an N-step recombining lattice.
+
+    Every argument broadcasts against the others, so a single contract can be
+    priced with scalars and a whole batch with column vectors of shape (m, 1).
+    Each time step is one array operation over the full layer of nodes.
+
+    Parameters:
+    S, K : float or ndarray
+        Spot and strike prices
+    phi : float or ndarray
+        Payoff sign, +1 for calls and -1 for puts
+    u : float or ndarray
+        Up factor
+    p : float or ndarray
+        Risk-neutral probability of an up move
+    disc : float or ndarray
+        One-step discount factor
+    N : int
+        Number of time steps
+    american : bool or ndarray
+        Whether early exercise is checked at each layer
+    keep : int
+        Index of the last time step whose layer of option values is kept
+    d : float or ndarray, optional
+        Down factor; defaults to 1 / u
+    smoothing : tuple, optional
+        (r, sigma, dt). When given, the layer one step before expiry is
+        valued with Black-Scholes instead of rolling back the payoff.
+
+    Returns:
+    layers : list of ndarray
+        Option values at time steps 0 through keep; layers[step] has
+        step + 1 nodes along its last axis
+    """
+    if d is None:
+        d = 1 / u
+        step_up = u
+    else:
+        step_up = 1 / d
+
+    early_exercise = np.any(american)
+    partial_exercise = early_exercise and not np.all(american)
+    strike_term = phi * K
+
+    def exercise_value(asset_prices):
+        exercise = phi * asset_prices - strike_term
+        if partial_exercise:
+            exercise = np.where(american, exercise, 0.0)
+        return exercise
+
+    last = N if smoothing is None else N - 1
+    j = np.arange(last + 1)
+    asset_prices = S * u**j * d**(last - j)
+    if smoothing is None:
+        option_values = np.maximum(phi * (asset_prices - K), 0.0)
+    else:
+        r, sigma, dt = smoothing
+        option_values = _black_scholes(asset_prices, K, dt, r, sigma, phi)
+        if early_exercise:
+            np.maximum(option_values, exercise_value(asset_prices), out=option_values)
+
+    layers = [None] * (keep + 1)
+    if keep >= last:
+        layers[last] = option_values
+
+    # Fold the discount into the branch probabilities once, outside the loop
+    p_up = disc * p
+    p_down = disc * (1 - p)
+    for step in range(last - 1, -1, -1):
+        option_values = p_up * option_values[..., 1:] + p_down * option_values[..., :-1]
+        if early_exercise:
+            # Node i at this step is S * u**i * d**(step - i), i.e. node i of
+            # the following layer divided by d.
+            asset_prices = asset_prices[..., :-1] * step_up
+            np.maximum(option_values, exercise_value(asset_prices), out=option_values)
+        if step <= keep:
+            layers[step] = option_values
+
+    return layers
+
+def _rollback(S, K, phi, u, p, disc, N, american, d=None, smoothing=None):
+    """
+    Return the option values at the root of the lattice; see _rollback_layers.
+    """
+    layers = _rollback_layers(S, K, phi, u, p, disc, N, american, d=d, smoothing=smoothing)
+    return layers[0][..., 0]
+
+def _lattice_price(S, K, T, r, sigma, phi, american, N, method='crr', backend='numpy'):
+    """
+    Price contracts with the requested lattice variant and backend.
+    Arguments broadcast as in _rollback_layers.
+    """
+    rollback = rollback_compiled if resolve_backend(backend) == 'numba' else _rollback
+    if method == 'crr':
+        u, p, disc = lattice_parameters(T, r, sigma, N)
+        return rollback(S, K, phi, u, p, disc, N, american)
+    elif method == 'bbs':
+        u, p, disc = lattice_parameters(T, r, sigma, N)
+        return rollback(S, K, phi, u, p, disc, N, american, smoothing=(r, sigma, T / N))
+    elif method == 'bbsr':
+        fine = _lattice_price(S, K, T, r, sigma, phi, american, N, 'bbs', backend)
+        coarse = _lattice_price(S, K, T, r, sigma, phi, american, max(N // 2, 1), 'bbs', backend)
+        return 2 * fine - coarse
+    elif method == 'leisen_reimer':
+        N += 1 - N % 2
+        u, d, p, disc = _leisen_reimer_parameters(S, K, T, r, sigma, N)
+        return rollback(S, K, phi, u, p, disc, N, american, d=d)
+    raise ValueError(f"method must be one of {METHODS}")
+
+@instrumentation.timed('pricing.binomial_option_price')
+def binomial_option_price(S, K, T, r, sigma, option_type='call', american=True, N=100, method='crr', backend='numpy'):
     """
     Calculate American or European option price using the Binomial model.
 
@@ -23,43 +207,18 @@ def binomial_option_price(S, K, T, r, sigma, option_type='call', american=True,
         True for American option, False for European
     N : int
         Number of time steps
+    method : str
+        Lattice variant: 'crr' (default), 'bbs', 'bbsr' or 'leisen_reimer'.
+        The last three reach penny accuracy at N of roughly 50-100; an even
+        N is rounded up to the next odd number for 'leisen_reimer'.
+    backend : str
+        'numpy' (default), 'numba' for the compiled kernel in
+        src/pricing/kernels.py, or 'auto' to use numba when it is installed
 
     Returns:
     price : float
         Option price
     """
-    # Calculate parameters
-    dt = T / N
-    u = np.exp(sigma * np.sqrt(dt))  # Up factor
-    d = 1 / u                        # Down factor
-    p = (np.exp(r * dt) - d) / (u - d)  # Risk-neutral probability
-
-    # Initialize asset prices at maturity
-    asset_prices = np.zeros(N + 1)
-    asset_prices[0] = S * d**N
-    for i in range(1, N + 1):
-        asset_prices[i] = asset_prices[i-1] * (u/d)
-
-    # Initialize option values at maturity
-    option_values = np.zeros(N + 1)
-    if option_type.lower() == 'call':
-        option_values = np.maximum(asset_prices - K, 0)
-    elif option_type.lower() == 'put':
-        option_values = np.maximum(K - asset_prices, 0)
-    else:
-        raise ValueError("option_type must be 'call' or 'put'")
-
-    # Backward induction
-    for step in range(N-1, -1, -1):
-        for i in range(step+1):
-            # Expected option value
-            option_values[i] = (p * option_values[i+1] + (1 - p) * option_values[i]) * np.exp(-r * dt)
-            if american:
-                # Calculate the asset price at this node
-                asset_price = S * (u**i) * (d**(step - i))
-                if option_type.lower() == 'call':
-                    option_values[i] = max(option_values[i], asset_price - K)
-                elif option_type.lower() == 'put':
-                    option_values[i] = max(option_values[i], K - asset_price)
-
-    return option_values[0]
+    phi = payoff_sign(option_type)
+    instrumentation.increment('pricing.lattice_prices')
+    return float(_lattice_price(S, K, T, r, sigma, phi, american, N, method, backend))
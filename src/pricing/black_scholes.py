@@ -0,0 +1,64 @@
+# src/pricing/black_scholes.py
+
+import numpy as np
+from scipy.special import ndtr
+from src.pricing.payoff import payoff_signs
+
+# scipy.stats.norm adds tens of microseconds of argument checking per call,
+# which dominates closed-form pricing; use the bare ufunc instead.
+_norm_cdf = ndtr
+
+def _norm_pdf(x):
+    """
+    Standard normal density.
+    """
+    return np.exp(-0.5 * x**2) / np.sqrt(2 * np.pi)
+
+def _d1_d2(S, K, T, r, sigma):
+    """
+    Compute the Black-Scholes d1 and d2 terms.
+    """
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    return d1, d1 - sigma * sqrt_T
+
+def _black_scholes(S, K, T, r, sigma, phi):
+    """
+    Black-Scholes price given the payoff sign (+1 call, -1 put).
+    """
+    d1, d2 = _d1_d2(S, K, T, r, sigma)
+    return phi * (S * _norm_cdf(phi * d1) - K * np.exp(-r * T) * _norm_cdf(phi * d2))
+
+def black_scholes_price(S, K, T, r, sigma, option_type='call'):
+    """
+    Calculate the Black-Scholes-Merton price of a European option.
+
+    All numeric inputs broadcast against each other.
+
+    Parameters:
+    S : float or array_like
+        Current stock price
+    K : float or array_like
+        Strike price
+    T : float or array_like
+        Time to expiration in years
+    r : float or array_like
+        Risk-free interest rate (annual)
+    sigma : float or array_like
+        Volatility of the underlying stock (annual)
+    option_type : str or array_like of str
+        'call' or 'put'
+
+    Returns:
+    price : ndarray
+        Option price
+    """
+    return _black_scholes(S, K, T, r, sigma, payoff_signs(option_type))
+
+def black_scholes_vega(S, K, T, r, sigma):
+    """
+    Calculate the Black-Scholes vega (per 1.00 change in sigma), which is the
+    same for calls and puts.
+    """
+    d1, _ = _d1_d2(S, K, T, r, sigma)
+    return S * _norm_pdf(d1) * np.sqrt(T)
@@ -0,0 +1,163 @@
+# src/pricing/cache.py
+
+import threading
+from collections import OrderedDict
+import numpy as np
+from src import instrumentation
+from src.pricing.batch import batch_option_price
+
+_FLOAT_PARAMS = ('S', 'K', 'T', 'r', 'sigma')
+
+class PricingCache:
+    """
+    Least-recently-used cache of option prices keyed on contract parameters.
+
+    The cache is plain Python and can be shared by the app, batch jobs and
+    services alike. Prices are computed with batch_option_price, so misses
+    from a whole chain are filled by a single vectorized call.
+
+    Parameters:
+    maxsize : int
+        Maximum number of cached prices; the least recently used entry is
+        evicted first
+    tolerance : float or dict, optional
+        Quantization step for S, K, T, r and sigma. A float applies to all
+        five; a dict such as {'S': 0.01, 'sigma': 1e-4} sets steps per
+        parameter. Inputs are snapped to the grid before pricing, so every
+        caller that maps to the same key sees the same price.
+    """
+
+    def __init__(self, maxsize=4096, tolerance=None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if tolerance is None or isinstance(tolerance, dict):
+            steps = dict(tolerance or {})
+        else:
+            steps = dict.fromkeys(_FLOAT_PARAMS, tolerance)
+        unknown = set(steps) - set(_FLOAT_PARAMS)
+        if unknown:
+            raise ValueError(f"tolerance keys must be among {_FLOAT_PARAMS}")
+
+        self.maxsize = maxsize
+        self._steps = [steps.get(name) for name in _FLOAT_PARAMS]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _quantize(self, values):
+        """
+        Snap (S, K, T, r, sigma) onto the quantization grid.
+        """
+        return tuple(
+            float(value) if not step else round(float(value) / step) * step
+            for value, step in zip(values, self._steps)
+        )
+
+    def _lookup(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def _store(self, key, price):
+        with self._lock:
+            self._entries[key] = price
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def price(self, S, K, T, r, sigma, option_type='call', american=True, N=100, method='crr'):
+        """
+        Return the Binomial price of one contract, computing it on a miss.
+        Arguments are those of binomial_option_price.
+        """
+        quantized = self._quantize((S, K, T, r, sigma))
+        key = quantized + (option_type.lower(), bool(american), int(N), method)
+        price = self._lookup(key)
+        if price is None:
+            instrumentation.increment('pricing.cache_misses')
+            price = float(batch_option_price(*quantized, option_type, american, N, method=method))
+            self._store(key, price)
+        else:
+            instrumentation.increment('pricing.cache_hits')
+        return price
+
+    def price_many(self, S, K, T, r, sigma, option_type='call', american=True, N=100, method='crr'):
+        """
+        Return prices for arrays of contracts. Only the misses are priced,
+        together in one batch call. Arguments broadcast as in
+        batch_option_price.
+
+        Returns:
+        prices : ndarray
+            Option prices in input order
+        """
+        S, K, T, r, sigma, option_type, american = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (S, K, T, r, sigma)),
+            np.char.lower(np.asarray(option_type, dtype=str)),
+            np.asarray(american, dtype=bool),
+        )
+        shape = S.shape
+        prices = np.empty(S.size)
+        keys = []
+        missing = []
+        for i, contract in enumerate(zip(S.flat, K.flat, T.flat, r.flat, sigma.flat)):
+            key = self._quantize(contract) + (str(option_type.flat[i]), bool(american.flat[i]), int(N), method)
+            price = self._lookup(key)
+            keys.append(key)
+            if price is None:
+                missing.append(i)
+            else:
+                prices[i] = price
+
+        instrumentation.increment('pricing.cache_hits', S.size - len(missing))
+        instrumentation.increment('pricing.cache_misses', len(missing))
+        if missing:
+            columns = np.array([keys[i][:5] for i in missing]).T
+            computed = batch_option_price(
+                *columns,
+                [keys[i][5] for i in missing],
+                [keys[i][6] for i in missing],
+                N, method=method,
+            )
+            prices[missing] = computed
+            for i, price in zip(missing, computed):
+                self._store(keys[i], float(price))
+
+        return prices.reshape(shape)
+
+    def stats(self):
+        """
+        Return hit/miss counters and the current size of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    def clear(self):
+        """
+        Drop all cached prices and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+# Process-wide cache used by cached_option_price
+default_cache = PricingCache()
+
+def cached_option_price(S, K, T, r, sigma, option_type='call', american=True, N=100, method='crr'):
+    """
+    Drop-in replacement for binomial_option_price backed by default_cache.
+    """
+    return default_cache.price(S, K, T, r, sigma, option_type, american, N, method)
@@ -0,0 +1,98 @@
+# src/pricing/engines.py
+
+import numpy as np
+from src.pricing.barone_adesi_whaley import barone_adesi_whaley_price
+from src.pricing.batch import batch_option_price
+from src.pricing.black_scholes import black_scholes_price
+from src.pricing.finite_difference import finite_difference_option_price
+from src.pricing.payoff import payoff_signs
+from src.pricing.trinomial import adaptive_mesh_option_price, trinomial_option_price
+from src import instrumentation
+
+def black_scholes_engine(S, K, T, r, sigma, option_type='call', american=True, N=100):
+    """
+    Black-Scholes-Merton pricing behind the common engine signature.
+
+    Without dividends an American call is worth the same as a European one,
+    so only American puts are rejected. N is ignored.
+    """
+    if np.any(np.asarray(american) & (np.asarray(payoff_signs(option_type)) < 0)):
+        raise ValueError("black_scholes prices European options only; use 'baw' or 'binomial' for American puts")
+    return black_scholes_price(S, K, T, r, sigma, option_type)
+
+def barone_adesi_whaley_engine(S, K, T, r, sigma, option_type='call', american=True, N=100):
+    """
+    Barone-Adesi-Whaley approximation behind the common engine signature.
+
+    European contracts fall back to Black-Scholes. N is ignored.
+    """
+    american_price = barone_adesi_whaley_price(S, K, T, r, sigma, option_type)
+    if np.all(american):
+        return american_price
+    return np.where(american, american_price, black_scholes_price(S, K, T, r, sigma, option_type))
+
+# Pricing engines sharing the signature
+# (S, K, T, r, sigma, option_type='call', american=True, N=100)
+PRICING_ENGINES = {
+    'binomial': batch_option_price,
+    'black_scholes': black_scholes_engine,
+    'baw': barone_adesi_whaley_engine,
+    'trinomial': trinomial_option_price,
+    'adaptive_mesh': adaptive_mesh_option_price,
+    'finite_difference': finite_difference_option_price,
+}
+
+# Engines that take N time steps through a lattice or grid; the others are
+# closed-form
+LATTICE_ENGINES = ('binomial', 'trinomial', 'adaptive_mesh', 'finite_difference')
+
+@instrumentation.timed('pricing.option_price')
+def option_price(S, K, T, r, sigma, option_type='call', american=True, N=100, engine='binomial', cache=None):
+    """
+    Calculate option prices with the selected pricing engine.
+
+    'black_scholes' and 'baw' are closed-form and cost microseconds, which
+    suits interactive views; 'binomial' is the reference lattice used for
+    final numbers. 'trinomial' and 'adaptive_mesh' are lattices with the
+    strike on a node, whose error falls steadily as N grows instead of
+    oscillating like the binomial tree's; the Richardson-extrapolated
+    trinomial lattice is the most accurate lattice for its time (see
+    src/pricing/trinomial.py).
+    'finite_difference' solves the pricing PDE once per distinct (T, r,
+    sigma, type, style) and reads every spot and strike off that grid,
+    which suits price curves over many spot prices or strikes sharing one
+    volatility. It does not suit batches with per-contract volatilities
+    or expiries: a batch needing more than MAX_SOLVES solves (see
+    src/pricing/finite_difference.py) is priced on the binomial lattice at
+    the same N instead.
+
+    Parameters:
+    S, K, T, r, sigma : float or array_like
+        Stock price, strike, time to expiration in years, risk-free rate and
+        volatility; all broadcast against each other
+    option_type : str or array_like of str
+        'call' or 'put'
+    american : bool or array_like of bool
+        True for American option, False for European
+    N : int
+        Number of time steps (lattice engines only)
+    engine : str
+        One of PRICING_ENGINES
+    cache : PricingCache, optional
+        Serve 'binomial' prices from this cache; closed-form engines are
+        cheaper to recompute than to look up and ignore it
+
+    Returns:
+    price : ndarray
+        Option price
+    """
+    try:
+        pricer = PRICING_ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"engine must be one of {sorted(PRICING_ENGINES)}") from None
+    if cache is not None and engine == 'binomial':
+        return cache.price_many(S, K, T, r, sigma, option_type, american, N)
+    prices = pricer(S, K, T, r, sigma, option_type, american, N)
+    if engine not in LATTICE_ENGINES:
+        instrumentation.increment('pricing.closed_form_prices', np.size(prices))
+    return prices
@@ -0,0 +1,271 @@
+# src/pricing/finite_difference.py
+
+import numpy as np
+from scipy.linalg.lapack import dgtsv
+from src import instrumentation
+from src.pricing.batch import batch_option_price
+from src.pricing.payoff import payoff_signs
+
+# Half-width of the grid in log moneyness, in standard deviations of the
+# log price at expiry
+WIDTH = 5.0
+
+# Fully implicit half steps that start the Crank-Nicolson scheme, which damp
+# the oscillations the payoff kink would otherwise leave in gamma
+_SMOOTHING_STEPS = 4
+
+# Early exercise is enforced with a penalty this large on nodes where the
+# option is worth less than exercising it
+_PENALTY = 1e8
+_PENALTY_TOLERANCE = 1e-8
+_MAX_PENALTY_ITERATIONS = 20
+
+# Most PDE solves one batch may need. Each solve costs about as much as
+# pricing a few hundred contracts on the binomial lattice, so batches with
+# many distinct (T, r, sigma, type, style), e.g. per-contract volatilities,
+# are priced on the lattice instead
+MAX_SOLVES = 8
+
+def _boundaries(x, tau, r, phi, american):
+    """
+    Option values per unit of strike at the lowest and highest grid nodes.
+    """
+    growth = np.exp(-r * tau)
+    if phi > 0:
+        return 0.0, np.exp(x[-1]) - growth
+    return (1.0 if american else growth) - np.exp(x[0]), 0.0
+
+def _solve(T, r, sigma, phi, american, N, M, half_width):
+    """
+    Solve the Black-Scholes PDE in log moneyness x = log(S / K) for an
+    option with unit strike.
+
+    The grid has M + 1 nodes in x (the strike is the middle one) and N
+    Crank-Nicolson steps in time to expiry. Each step is one tridiagonal
+    solve; for American options the penalty iteration adds a few more
+    until the set of exercised nodes stops changing.
+
+    Returns:
+    x, values : ndarray
+        Grid nodes and option values at the valuation date
+    """
+    x = np.linspace(-half_width, half_width, M + 1)
+    dx = x[1] - x[0]
+    payoff = np.maximum(phi * (np.exp(x) - 1.0), 0.0)
+    values = payoff.copy()
+
+    # L v_i = lower v_{i-1} + diagonal v_i + upper v_{i+1}
+    nu = r - 0.5 * sigma**2
+    lower = 0.5 * sigma**2 / dx**2 - 0.5 * nu / dx
+    upper = 0.5 * sigma**2 / dx**2 + 0.5 * nu / dx
+    diagonal = -sigma**2 / dx**2 - r
+
+    dt = T / N
+    smoothing = min(_SMOOTHING_STEPS, 2 * N)
+    steps = [(dt / 2, 1.0)] * smoothing + [(dt, 0.5)] * (N - smoothing // 2)
+    # Diagonals of the implicit operator (I - theta k L) per kind of step,
+    # with Dirichlet rows at either end
+    systems = {}
+    for k, theta in set(steps):
+        sub = np.full(M, -theta * k * lower)
+        main = np.full(M + 1, 1 - theta * k * diagonal)
+        sup = np.full(M, -theta * k * upper)
+        main[0] = main[-1] = 1.0
+        sup[0] = sub[-1] = 0.0
+        systems[k, theta] = sub, main, sup
+
+    tau = 0.0
+    for k, theta in steps:
+        tau += k
+        # Explicit part of the step on the interior nodes
+        rhs = values.copy()
+        explicit = (1 - theta) * k
+        if explicit:
+            rhs[1:-1] += explicit * (lower * values[:-2] + diagonal * values[1:-1] + upper * values[2:])
+        rhs[0], rhs[-1] = _boundaries(x, tau, r, phi, american)
+
+        sub, main, sup = systems[k, theta]
+        if not american:
+            values = dgtsv(sub, main, sup, rhs)[3]
+            continue
+
+        for _ in range(_MAX_PENALTY_ITERATIONS):
+            penalty = np.where(values < payoff, _PENALTY, 0.0)
+            previous = values
+            values = dgtsv(sub, main + penalty, sup, rhs + penalty * payoff)[3]
+            if np.max(np.abs(values - previous) / np.maximum(1.0, np.abs(values))) < _PENALTY_TOLERANCE:
+                break
+    return x, values
+
+def _derivatives(x, values):
+    """
+    First and second derivatives in x of the grid values (central
+    differences, one-sided at the ends).
+    """
+    dx = x[1] - x[0]
+    first = np.gradient(values, dx)
+    second = np.empty_like(values)
+    second[1:-1] = (values[2:] - 2 * values[1:-1] + values[:-2]) / dx**2
+    second[0], second[-1] = second[1], second[-2]
+    return first, second
+
+def _half_width(T, sigma, moneyness=()):
+    """
+    Grid half-width in log moneyness: WIDTH standard deviations, widened to
+    keep every requested spot at least one standard deviation inside.
+    """
+    spread = sigma * np.sqrt(T)
+    extent = np.max(np.abs(np.log(moneyness)), initial=0.0)
+    return max(WIDTH * spread, extent + spread)
+
+def _space_steps(N, M):
+    M = 2 * N if M is None else int(M)
+    if M < 4:
+        raise ValueError("M must be at least 4")
+    # An even M puts the strike on the middle node
+    return M + M % 2
+
+@instrumentation.timed('pricing.finite_difference_grid')
+def finite_difference_grid(K, T, r, sigma, option_type='call', american=True, N=100, M=None):
+    """
+    Solve for American or European option values over a whole grid of spot
+    prices at once.
+
+    The Black-Scholes PDE is solved in log price with Crank-Nicolson steps
+    (the first step split into fully implicit half steps) and a penalty
+    method for early exercise, one tridiagonal solve per step. Delta and
+    gamma come from the same grid, so one solve gives a price curve and
+    its Greeks, e.g. for the P&L against the stock price.
+
+    Parameters:
+    K, T, r, sigma : float
+        Strike, time to expiration in years, risk-free rate and volatility
+    option_type : str
+        'call' or 'put'
+    american : bool
+        True for American option, False for European
+    N : int
+        Number of time steps
+    M : int, optional
+        Number of price steps; defaults to 2 * N, rounded up to even
+
+    Returns:
+    grid : dict of ndarray
+        'S' (spot prices, log-spaced around the strike), 'price', 'delta'
+        and 'gamma'
+    """
+    phi = float(payoff_signs(option_type))
+    if N < 1:
+        raise ValueError("N must be at least 1")
+    M = _space_steps(N, M)
+    instrumentation.increment('pricing.finite_difference_solves')
+    x, values = _solve(T, r, sigma, phi, bool(american), N, M, _half_width(T, sigma))
+    first, second = _derivatives(x, values)
+    S = K * np.exp(x)
+    return {
+        'S': S,
+        'price': K * values,
+        'delta': first / np.exp(x),
+        'gamma': (second - first) / (K * np.exp(2 * x)),
+    }
+
+def _solve_groups(S, K, T, r, sigma, option_type, american, N):
+    """
+    Broadcast a batch and group its contracts by the PDE solve that serves
+    them, i.e. by (T, r, sigma, payoff sign, exercise style).
+
+    Returns:
+    shape : tuple
+        Broadcast shape of the batch
+    moneyness, K : ndarray
+        Flat S / K and strikes
+    unique_keys : ndarray
+        One row (T, r, sigma, phi, american) per solve
+    inverse : ndarray
+        Solve index of each contract
+    """
+    phi = payoff_signs(option_type)
+    if N < 1:
+        raise ValueError("N must be at least 1")
+    S, K, T, r, sigma, phi, american = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (S, K, T, r, sigma, phi)), np.asarray(american, dtype=bool)
+    )
+    keys = np.column_stack([np.ravel(a) for a in (T, r, sigma, phi, american)])
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    return S.shape, np.ravel(S / K), np.ravel(K), unique_keys, inverse.ravel()
+
+def _greeks(shape, moneyness, K, unique_keys, inverse, N, M):
+    """
+    Run one solve per group from _solve_groups and read each contract's
+    price, delta and gamma off its grid.
+    """
+    M = _space_steps(N, M)
+    price, delta, gamma = (np.empty(moneyness.size) for _ in range(3))
+    instrumentation.increment('pricing.finite_difference_solves', len(unique_keys))
+    for group, (T_g, r_g, sigma_g, phi_g, american_g) in enumerate(unique_keys):
+        rows = np.flatnonzero(inverse == group)
+        y = np.log(moneyness[rows])
+        half_width = _half_width(T_g, sigma_g, moneyness[rows])
+        x, values = _solve(T_g, r_g, sigma_g, phi_g, bool(american_g), N, M, half_width)
+        first, second = _derivatives(x, values)
+        dx = x[1] - x[0]
+        third = np.gradient(second, dx)
+
+        node = np.clip(np.rint((y - x[0]) / dx).astype(int), 1, x.size - 2)
+        h = y - x[node]
+        v = values[node] + h * first[node] + 0.5 * h**2 * second[node]
+        v_x = first[node] + h * second[node]
+        v_xx = second[node] + h * third[node]
+        m = np.exp(y)
+        if american_g:
+            v = np.maximum(v, phi_g * (m - 1.0))
+        price[rows], delta[rows], gamma[rows] = v, v_x / m, (v_xx - v_x) / m**2
+
+    greeks = {'price': price * K, 'delta': delta, 'gamma': gamma / K}
+    return {name: values.reshape(shape) for name, values in greeks.items()}
+
+@instrumentation.timed('pricing.finite_difference_greeks')
+def finite_difference_greeks(S, K, T, r, sigma, option_type='call', american=True, N=100, M=None):
+    """
+    Price, delta and gamma of a batch of contracts from finite-difference
+    solves.
+
+    The grid is in moneyness, so all contracts sharing T, r, sigma, type and
+    exercise style (e.g. a strip of strikes, or one contract across a range
+    of spot prices) are served by a single solve. Values between grid nodes
+    come from the second-order Taylor expansion at the nearest node. Every
+    distinct (T, r, sigma, type, style) costs a solve of its own, so at most
+    MAX_SOLVES of them are accepted per batch.
+
+    Parameters:
+    S, K, T, r, sigma, option_type, american : see batch_option_price
+    N, M : int
+        Time and price steps of each solve; see finite_difference_grid
+
+    Returns:
+    greeks : dict of ndarray
+        'price', 'delta' and 'gamma'
+    """
+    groups = _solve_groups(S, K, T, r, sigma, option_type, american, N)
+    if len(groups[3]) > MAX_SOLVES:
+        raise ValueError(
+            f"finite_difference_greeks serves at most {MAX_SOLVES} distinct (T, r, sigma, type, style) "
+            f"per batch, got {len(groups[3])}; use batch_greeks"
+        )
+    return _greeks(*groups, N, M)
+
+@instrumentation.timed('pricing.finite_difference_option_price')
+def finite_difference_option_price(S, K, T, r, sigma, option_type='call', american=True, N=100, M=None):
+    """
+    Calculate option prices with the finite-difference solver; see
+    finite_difference_greeks.
+
+    A batch that needs more than MAX_SOLVES solves (e.g. contracts with
+    per-contract volatilities) is priced with batch_option_price at the same
+    N instead, which is far cheaper than one solve per contract.
+    """
+    groups = _solve_groups(S, K, T, r, sigma, option_type, american, N)
+    if len(groups[3]) > MAX_SOLVES:
+        instrumentation.increment('pricing.finite_difference_fallbacks', groups[1].size)
+        return batch_option_price(S, K, T, r, sigma, option_type, american, N)
+    return _greeks(*groups, N, M)['price']
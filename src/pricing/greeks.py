@@ -0,0 +1,113 @@
+# src/pricing/greeks.py
+
+import numpy as np
+from src.pricing.batch import _contract_columns, _default_block_size
+from src.pricing.binomial_model import _rollback_layers, lattice_parameters
+from src import instrumentation
+
+# Absolute bump sizes for the finite-difference Greeks
+VOL_BUMP = 0.01
+RATE_BUMP = 0.0001
+
+@instrumentation.timed('pricing.batch_greeks')
+def batch_greeks(S, K, T, r, sigma, option_type='call', american=True, N=100, block_size=None):
+    """
+    Calculate price and Greeks for many options with the Binomial model at once.
+
+    Delta, gamma and theta are read off the first two time steps of the same
+    lattice that produces the price. Vega and rho come from central bumps of
+    sigma and r that are stacked onto the base contracts and rolled back in the
+    same pass; the rho bumps leave the up factor unchanged, so they share the
+    base lattice nodes.
+
+    Parameters:
+    S, K, T, r, sigma, option_type, american, N : see batch_option_price
+    block_size : int, optional
+        Number of contracts rolled back together
+
+    Returns:
+    greeks : dict of ndarray
+        'price', 'delta', 'gamma', 'theta' (per year), 'vega' (per 1.00 change
+        in sigma) and 'rho' (per 1.00 change in r), each in input order
+    """
+    if N < 2:
+        raise ValueError("N must be at least 2 to compute gamma and theta")
+
+    shape, (S, K, T, r, sigma, phi, american) = _contract_columns(
+        S, K, T, r, sigma, option_type, american
+    )
+    vol_bump = np.minimum(VOL_BUMP, 0.5 * sigma)
+
+    # Rows: base, sigma up, sigma down, r up, r down
+    sigma_rows = np.concatenate([sigma, sigma + vol_bump, sigma - vol_bump, sigma, sigma])
+    r_rows = np.concatenate([r, r, r, r + RATE_BUMP, r - RATE_BUMP])
+    u, p, disc = lattice_parameters(np.tile(T, (5, 1)), r_rows, sigma_rows, N)
+    u, p, disc = (x.reshape(5, -1, 1) for x in (u, p, disc))
+
+    size = S.shape[0]
+    instrumentation.increment('pricing.greeks', size)
+    block_size = block_size or max(1, _default_block_size(N) // 5)
+    results = {name: np.empty(size) for name in ('price', 'delta', 'gamma', 'theta', 'vega', 'rho')}
+
+    for start in range(0, size, block_size):
+        block = slice(start, start + block_size)
+        # Shape (5, n, 1): the bumped copies of the block broadcast against
+        # the unbumped spot, strike and payoff columns.
+        layers = _rollback_layers(
+            S[block], K[block], phi[block],
+            u[:, block], p[:, block], disc[:, block],
+            N, american[block], keep=2,
+        )
+        root = layers[0][..., 0]
+        f1 = layers[1][0]
+        f2 = layers[2][0]
+
+        s = S[block, 0]
+        up = u[0, block, 0]
+        dt = T[block, 0] / N
+
+        # Step 1 nodes sit at S*d and S*u; step 2 nodes at S*d**2, S and S*u**2
+        delta = (f1[:, 1] - f1[:, 0]) / (s * up - s / up)
+        upper = (f2[:, 2] - f2[:, 1]) / (s * up**2 - s)
+        lower = (f2[:, 1] - f2[:, 0]) / (s - s / up**2)
+        gamma = (upper - lower) / (0.5 * (s * up**2 - s / up**2))
+        theta = (f2[:, 1] - root[0]) / (2 * dt)
+
+        results['price'][block] = root[0]
+        results['delta'][block] = delta
+        results['gamma'][block] = gamma
+        results['theta'][block] = theta
+        results['vega'][block] = (root[1] - root[2]) / (2 * vol_bump[block, 0])
+        results['rho'][block] = (root[3] - root[4]) / (2 * RATE_BUMP)
+
+    return {name: values.reshape(shape) for name, values in results.items()}
+
+def binomial_greeks(S, K, T, r, sigma, option_type='call', american=True, N=100):
+    """
+    Calculate price, delta, gamma, theta, vega and rho for a single option.
+
+    Parameters:
+    S : float
+        Current stock price
+    K : float
+        Strike price
+    T : float
+        Time to expiration in years
+    r : float
+        Risk-free interest rate (annual)
+    sigma : float
+        Volatility of the underlying stock (annual)
+    option_type : str
+        'call' or 'put'
+    american : bool
+        True for American option, False for European
+    N : int
+        Number of time steps
+
+    Returns:
+    greeks : dict
+        'price', 'delta', 'gamma', 'theta' (per year), 'vega' (per 1.00 change
+        in sigma) and 'rho' (per 1.00 change in r)
+    """
+    greeks = batch_greeks(S, K, T, r, sigma, option_type, american, N)
+    return {name: float(value) for name, value in greeks.items()}
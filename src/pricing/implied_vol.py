@@ -0,0 +1,193 @@
+# src/pricing/implied_vol.py
+
+import numpy as np
+from src.pricing.batch import _contract_columns, _price_columns
+from src.pricing.black_scholes import black_scholes_price, black_scholes_vega
+from src import instrumentation
+
+# Volatility search interval; the upper end matches the input limit in the app
+SIGMA_MIN = 1e-4
+SIGMA_MAX = 5.0
+
+def _safeguarded_newton(model_price, target, sigma, vega, tol, max_iter):
+    """
+    Solve model_price(sigma) == target for every contract at once.
+
+    Each iteration takes a Newton step using the supplied vega and falls back
+    to bisection of the bracket whenever the step leaves it, so the solver
+    converges even where vega vanishes (deep in or out of the money).
+
+    Parameters:
+    model_price : callable
+        model_price(sigma, idx) returns model prices for the contracts at idx
+    target : ndarray
+        Prices to match
+    sigma : ndarray
+        Initial volatility guesses; contracts set to NaN are skipped
+    vega : callable
+        vega(sigma, idx) returns the derivative used for the Newton step
+    tol : float
+        Price tolerance
+    max_iter : int
+        Maximum number of model evaluations per contract
+
+    Returns:
+    sigma : ndarray
+        Solved volatilities (the last iterate where not converged)
+    converged : ndarray of bool
+        Whether each contract met the tolerance
+    """
+    sigma = sigma.copy()
+    converged = np.zeros(sigma.shape, dtype=bool)
+    lower = np.full_like(sigma, SIGMA_MIN)
+    upper = np.full_like(sigma, SIGMA_MAX)
+    active = np.flatnonzero(~np.isnan(sigma))
+
+    for _ in range(max_iter):
+        if not active.size:
+            break
+        s = sigma[active]
+        diff = model_price(s, active) - target[active]
+
+        # A collapsed bracket away from the interval ends also counts: the
+        # lattice price is only piecewise smooth in sigma.
+        collapsed = (upper[active] - lower[active] < 1e-10) & (s > SIGMA_MIN) & (s < SIGMA_MAX)
+        done = (np.abs(diff) < tol) | collapsed
+        converged[active[done]] = True
+
+        too_high = diff > 0
+        upper[active] = np.where(too_high, s, upper[active])
+        lower[active] = np.where(too_high, lower[active], s)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = s - diff / vega(s, active)
+        lo, hi = lower[active], upper[active]
+        outside = ~((step > lo) & (step < hi))
+        step = np.where(outside, 0.5 * (lo + hi), step)
+
+        sigma[active] = np.where(done, s, step)
+        active = active[~done]
+
+    return sigma, converged
+
+@instrumentation.timed('pricing.implied_volatility')
+def implied_volatility(price, S, K, T, r, option_type='call', american=True, N=100, tol=1e-6, max_iter=50):
+    """
+    Solve for the volatility that reproduces observed option prices.
+
+    A closed-form European (Black-Scholes) inversion supplies the starting
+    point, after which the Binomial model is inverted with a safeguarded
+    Newton iteration that falls back to bisection. Every iteration prices all
+    unconverged contracts in one batch call, so a whole chain typically needs
+    only a handful of lattice evaluations.
+
+    Parameters:
+    price : float or array_like
+        Observed option price
+    S, K, T, r, option_type, american, N : see batch_option_price
+    tol : float
+        Price tolerance
+    max_iter : int
+        Maximum number of lattice evaluations
+
+    Returns:
+    sigma : ndarray
+        Implied volatility per contract, NaN where the price lies outside the
+        no-arbitrage bounds or the solver did not converge
+    """
+    # The observed price travels in the sigma slot so it broadcasts with the
+    # contract inputs.
+    shape, (S, K, T, r, price, phi, american) = _contract_columns(
+        S, K, T, r, price, option_type, american
+    )
+    S, K, T, r, price, phi, american = (
+        x[:, 0] for x in (S, K, T, r, price, phi, american)
+    )
+    option_type = np.where(phi > 0, 'call', 'put')
+
+    # No-arbitrage bounds; American options are worth at least intrinsic value
+    discounted_K = K * np.exp(-r * T)
+    lower_bound = np.where(american, np.maximum(phi * (S - K), 0.0),
+                           np.maximum(phi * (S - discounted_K), 0.0))
+    upper_bound = np.where(phi > 0, S, np.where(american, K, discounted_K))
+    valid = (price > lower_bound) & (price < upper_bound) & (T > 0)
+
+    vega = lambda s, idx: black_scholes_vega(S[idx], K[idx], T[idx], r[idx], s)
+    european = lambda s, idx: black_scholes_price(S[idx], K[idx], T[idx], r[idx], s, option_type[idx])
+
+    def lattice(s, idx):
+        S_i, K_i, T_i, r_i, phi_i, american_i = (
+            x[idx, np.newaxis] for x in (S, K, T, r, phi, american)
+        )
+        return _price_columns(S_i, K_i, T_i, r_i, s[:, np.newaxis], phi_i, american_i, N)
+
+    # Closed-form guess, clipped into the search interval. It may not solve
+    # exactly when the early-exercise premium pushes the price past the
+    # European bounds.
+    guess = np.where(valid, 0.3, np.nan)
+    guess, _ = _safeguarded_newton(european, price, guess, vega, tol, max_iter)
+    guess = np.clip(guess, 2 * SIGMA_MIN, 0.5 * SIGMA_MAX)
+
+    sigma, converged = _safeguarded_newton(lattice, price, guess, vega, tol, max_iter)
+    sigma[~converged] = np.nan
+
+    return sigma.reshape(shape)
+
+def quote_prices(chain, price='mid'):
+    """
+    Select one price per row of an option chain.
+
+    Parameters:
+    chain : pandas.DataFrame or OptionChain
+        Option chain with 'bid', 'ask' and 'lastPrice' columns
+    price : str
+        'mid', 'bid', 'ask' or 'lastPrice'. The mid falls back to the last
+        price for rows without a two-sided quote.
+
+    Returns:
+    prices : ndarray
+        Price per row of the chain
+    """
+    if price == 'mid':
+        bid = np.asarray(chain['bid'], dtype=float)
+        ask = np.asarray(chain['ask'], dtype=float)
+        last = np.asarray(chain['lastPrice'], dtype=float)
+        quoted = (bid > 0) & (ask > 0)
+        return np.where(quoted, 0.5 * (bid + ask), last)
+    elif price in ('bid', 'ask', 'lastPrice'):
+        return np.asarray(chain[price], dtype=float)
+    raise ValueError("price must be 'mid', 'bid', 'ask' or 'lastPrice'")
+
+def chain_implied_volatility(chain, S, T, r, option_type, american=True, N=100, price='mid', tol=1e-6):
+    """
+    Recompute implied volatility for every contract in a calls or puts
+    DataFrame from get_option_chain.
+
+    Parameters:
+    chain : pandas.DataFrame or OptionChain
+        Option chain with 'strike', 'bid', 'ask' and 'lastPrice' columns
+    S : float
+        Current stock price
+    T : float or array_like
+        Time to expiration in years, per chain or per row
+    r : float
+        Risk-free interest rate (annual)
+    option_type : str
+        'call' or 'put'
+    american : bool
+        True for American option, False for European
+    N : int
+        Number of time steps
+    price : str
+        'mid', 'bid', 'ask' or 'lastPrice'. The mid falls back to the last
+        price for rows without a two-sided quote.
+    tol : float
+        Price tolerance
+
+    Returns:
+    sigma : ndarray
+        Implied volatility per row of the chain
+    """
+    prices = quote_prices(chain, price)
+    strikes = np.asarray(chain['strike'], dtype=float)
+    return implied_volatility(prices, S, strikes, T, r, option_type, american, N, tol)
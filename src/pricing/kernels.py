@@ -0,0 +1,120 @@
+# src/pricing/kernels.py
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+# Backends accepted through the `backend` argument of the pricing functions
+BACKENDS = ('numpy', 'numba', 'auto')
+
+def _norm_cdf(x):
+    return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+def _rollback_kernel(S, K, phi, u, d, p, disc, american, N, smooth, r, sigma, dt, out):
+    """
+    Scalar-loop backward induction over a batch of contracts.
+
+    Each contract is rolled back in place in a single buffer of N + 1 nodes,
+    mirroring _rollback_layers node for node. All array arguments are 1-D
+    with one entry per contract.
+    """
+    last = N - 1 if smooth else N
+    values = np.empty(last + 1)
+    assets = np.empty(last + 1)
+    for i in range(S.shape[0]):
+        step_up = 1.0 / d[i]
+        p_up = disc[i] * p[i]
+        p_down = disc[i] * (1.0 - p[i])
+
+        for j in range(last + 1):
+            asset = S[i] * u[i]**j * d[i]**(last - j)
+            assets[j] = asset
+            if smooth:
+                # Black-Scholes value one step before expiry
+                sigma_sqrt_dt = sigma[i] * math.sqrt(dt[i])
+                d1 = (math.log(asset / K[i]) + (r[i] + 0.5 * sigma[i]**2) * dt[i]) / sigma_sqrt_dt
+                d2 = d1 - sigma_sqrt_dt
+                value = phi[i] * (asset * _norm_cdf(phi[i] * d1)
+                                  - K[i] * math.exp(-r[i] * dt[i]) * _norm_cdf(phi[i] * d2))
+                if american[i]:
+                    value = max(value, phi[i] * (asset - K[i]))
+            else:
+                value = max(phi[i] * (asset - K[i]), 0.0)
+            values[j] = value
+
+        for step in range(last - 1, -1, -1):
+            for j in range(step + 1):
+                value = p_up * values[j + 1] + p_down * values[j]
+                if american[i]:
+                    assets[j] *= step_up
+                    value = max(value, phi[i] * assets[j] - phi[i] * K[i])
+                values[j] = value
+
+        out[i] = values[0]
+
+if NUMBA_AVAILABLE:
+    _norm_cdf = njit(cache=True)(_norm_cdf)
+    _rollback_kernel = njit(cache=True)(_rollback_kernel)
+
+def resolve_backend(backend):
+    """
+    Map a backend name to 'numpy' or 'numba'.
+    """
+    if backend == 'auto':
+        return 'numba' if NUMBA_AVAILABLE else 'numpy'
+    if backend == 'numba' and not NUMBA_AVAILABLE:
+        raise ImportError("backend='numba' requires numba; install it or use backend='numpy'")
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}")
+    return backend
+
+def rollback_compiled(S, K, phi, u, p, disc, N, american, d=None, smoothing=None):
+    """
+    Compiled counterpart of _rollback with the same broadcasting rules.
+
+    Returns:
+    values : ndarray
+        Option values at the root of the lattice
+    """
+    if d is None:
+        d = 1 / np.asarray(u, dtype=float)
+    r, sigma, dt = smoothing if smoothing is not None else (0.0, 0.0, 0.0)
+
+    # The last input axis lines up with the lattice nodes, exactly as in the
+    # NumPy engine, and is dropped from the result.
+    arrays = np.broadcast_arrays(S, K, phi, u, d, p, disc, r, sigma, dt, american, np.empty(1))
+    shape = arrays[0].shape[:-1]
+    flat = [np.ascontiguousarray(a[..., 0]).ravel() for a in arrays[:-1]]
+    S, K, phi, u, d, p, disc, r, sigma, dt = (a.astype(np.float64) for a in flat[:-1])
+    american = flat[-1].astype(np.bool_)
+
+    out = np.empty(S.size)
+    _rollback_kernel(S, K, phi, u, d, p, disc, american, N, smoothing is not None, r, sigma, dt, out)
+    return out.reshape(shape)
+
+def warm_up():
+    """
+    Compile the lattice kernel ahead of the first pricing request.
+
+    Numba compiles on first call (and reuses its on-disk cache afterwards);
+    calling this at start-up keeps that cost off user requests. Does nothing
+    when numba is not installed.
+
+    Returns:
+    warmed : bool
+        True if a compiled kernel is ready
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+    one = np.ones(1)
+    for smooth in (False, True):
+        _rollback_kernel(one * 100, one * 100, one, one * 1.01, one / 1.01, one * 0.5, one,
+                         np.ones(1, dtype=np.bool_), 2, smooth, one * 0.05, one * 0.2, one * 0.01,
+                         np.empty(1))
+    return True
@@ -0,0 +1,109 @@
+# src/pricing/parallel.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from src.pricing.batch import batch_option_price
+from src.pricing.greeks import batch_greeks
+
+def _run_chunk(batch_fn, arrays, kwargs):
+    """
+    Worker entry point: apply a batch pricing function to one chunk.
+    """
+    return batch_fn(*arrays, **kwargs)
+
+def _concatenate(results):
+    """
+    Join per-chunk results, which are arrays or dicts of arrays.
+    """
+    if isinstance(results[0], dict):
+        return {name: np.concatenate([r[name] for r in results]) for name in results[0]}
+    return np.concatenate(results)
+
+class ParallelPricer:
+    """
+    Spread batch pricing over a pool of worker processes.
+
+    Inputs are broadcast and split into contiguous NumPy chunks, so only
+    compact arrays cross the process boundary, and results come back in
+    input order. The pool is kept alive between calls; use the pricer as a
+    context manager or call shutdown() when done.
+
+    Parameters:
+    max_workers : int, optional
+        Number of worker processes (defaults to the CPU count)
+    chunk_size : int
+        Number of contracts sent to a worker per task
+    """
+
+    def __init__(self, max_workers=None, chunk_size=2048):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def shutdown(self):
+        self._executor.shutdown()
+
+    def map(self, batch_fn, *arrays, **kwargs):
+        """
+        Apply a batch function to broadcast arrays, chunk by chunk.
+
+        Parameters:
+        batch_fn : callable
+            Module-level function taking the arrays positionally, such as
+            batch_option_price or batch_greeks
+        *arrays : array_like
+            Per-contract inputs; they are broadcast together and flattened
+        **kwargs
+            Scalar keyword arguments passed unchanged to every chunk
+
+        Returns:
+        result : ndarray or dict of ndarray
+            Concatenated chunk results in input order
+        """
+        arrays = [np.ascontiguousarray(a).ravel() for a in np.broadcast_arrays(*arrays)]
+        size = arrays[0].size
+        if size == 0:
+            return batch_fn(*arrays, **kwargs)
+
+        futures = [
+            self._executor.submit(
+                _run_chunk, batch_fn,
+                [a[start:start + self.chunk_size] for a in arrays], kwargs,
+            )
+            for start in range(0, size, self.chunk_size)
+        ]
+        return _concatenate([future.result() for future in futures])
+
+    def price(self, S, K, T, r, sigma, option_type='call', american=True, N=100, method='crr'):
+        """
+        Parallel batch_option_price; returns a flat array in input order.
+        """
+        return self.map(batch_option_price, S, K, T, r, sigma, option_type, american, N=N, method=method)
+
+    def greeks(self, S, K, T, r, sigma, option_type='call', american=True, N=100):
+        """
+        Parallel batch_greeks; returns a dict of flat arrays in input order.
+        """
+        return self.map(batch_greeks, S, K, T, r, sigma, option_type, american, N=N)
+
+def parallel_option_price(S, K, T, r, sigma, option_type='call', american=True, N=100, method='crr', max_workers=None, chunk_size=2048):
+    """
+    Price a large set of contracts across worker processes with a one-off
+    pool. Arguments are those of batch_option_price plus the pool settings
+    of ParallelPricer.
+
+    Returns:
+    prices : ndarray
+        Option prices as a flat array in input order
+    """
+    with ParallelPricer(max_workers, chunk_size) as pricer:
+        return pricer.price(S, K, T, r, sigma, option_type, american, N, method)
@@ -0,0 +1,25 @@
+# src/pricing/payoff.py
+
+import numpy as np
+
+def payoff_sign(option_type):
+    """
+    Map an option type to the sign of its payoff: +1 for calls, -1 for puts.
+    """
+    option_type = option_type.lower()
+    if option_type == 'call':
+        return 1.0
+    elif option_type == 'put':
+        return -1.0
+    raise ValueError("option_type must be 'call' or 'put'")
+
+def payoff_signs(option_type):
+    """
+    Convert a single option type or an array of them to payoff signs.
+    """
+    if isinstance(option_type, str):
+        return payoff_sign(option_type)
+    option_type = np.asarray(option_type)
+    types, inverse = np.unique(option_type, return_inverse=True)
+    signs = np.array([payoff_sign(str(t)) for t in types])
+    return signs[inverse].reshape(option_type.shape)
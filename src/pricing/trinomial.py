@@ -0,0 +1,211 @@
+# src/pricing/trinomial.py
+
+import numpy as np
+from src import instrumentation
+from src.pricing.batch import _contract_columns
+from src.pricing.black_scholes import _black_scholes
+
+# Ratio h / (sigma * sqrt(k)) of the log-price step to the time step; sqrt(3)
+# matches the first four moments of the normal distribution
+_LAMBDA = np.sqrt(3.0)
+
+# Each refinement level halves the log-price step and quarters the time
+# step, which keeps the branch probabilities of the coarser level
+_FINE_STEPS = 4
+
+def _centre(S, K, h, align):
+    """
+    Log price of the lattice root per contract.
+
+    With align, the lattice is shifted by at most half a step so the strike
+    falls exactly on a node, which removes the oscillation of the price in
+    N; the price at the spot is then interpolated from the three root nodes.
+    """
+    x0 = np.log(S)
+    if not align:
+        return x0
+    x_K = np.log(K)
+    return x_K + np.round((x0 - x_K) / h) * h
+
+def _probabilities(r, sigma, h, k):
+    """
+    Branch probabilities of a trinomial step in log price (moment matching
+    of the drift r - sigma**2 / 2 and the variance).
+    """
+    nu = r - 0.5 * sigma**2
+    variance = (sigma**2 * k + (nu * k)**2) / h**2
+    drift = nu * k / h
+    return 0.5 * (variance + drift), 1 - variance, 0.5 * (variance - drift)
+
+def _step(values, x, K, phi, probabilities, disc, american):
+    """
+    Roll option values on nodes x back one trinomial step; the result lives
+    on the inner nodes x[..., 1:-1].
+    """
+    pu, pm, pd = probabilities
+    values = disc * (pu * values[..., 2:] + pm * values[..., 1:-1] + pd * values[..., :-2])
+    if np.any(american):
+        exercise = np.where(american, phi * (np.exp(x[..., 1:-1]) - K), 0.0)
+        np.maximum(values, exercise, out=values)
+    return values
+
+def _refined_values(x, K, r, sigma, phi, american, h, k, levels):
+    """
+    Option values one time step k before expiry at the nodes x (spacing h),
+    computed on a mesh with half the log-price step and a quarter of the
+    time step. At each fine step the nodes next to the strike are refined
+    again, `levels` times in all (the adaptive mesh of Figlewski and Gao).
+    """
+    if levels == 0:
+        nodes = np.concatenate([x[..., :1] - h, x, x[..., -1:] + h], axis=-1)
+        values = np.maximum(phi * (np.exp(nodes) - K), 0.0)
+        return _step(values, nodes, K, phi, _probabilities(r, sigma, h, k), np.exp(-r * k), american)
+
+    h, k = h / 2, k / _FINE_STEPS
+    probabilities = _probabilities(r, sigma, h, k)
+    disc = np.exp(-r * k)
+    # Each fine step consumes one node at either end of the mesh
+    offsets = np.arange(-_FINE_STEPS, 2 * (x.shape[-1] - 1) + _FINE_STEPS + 1)
+    nodes = x[..., :1] + offsets * h
+    values = np.maximum(phi * (np.exp(nodes) - K), 0.0)
+    for step in range(_FINE_STEPS):
+        values = _step(values, nodes, K, phi, probabilities, disc, american)
+        nodes = nodes[..., 1:-1]
+        if step == 0 and levels > 1:
+            _patch(values, nodes, K, r, sigma, phi, american, h, k, levels - 1)
+    return values[..., ::2]
+
+def _patch(values, nodes, K, r, sigma, phi, american, h, k, levels):
+    """
+    Replace, in place, the values of the three nodes around the strike with
+    refined values.
+    """
+    centre = np.rint((np.log(K) - nodes[..., :1]) / h).astype(int)
+    first = np.clip(centre - 1, 0, nodes.shape[-1] - 3)
+    columns = first + np.arange(3)
+    near = np.take_along_axis(nodes, columns, axis=-1)
+    np.put_along_axis(values, columns, _refined_values(near, K, r, sigma, phi, american, h, k, levels), axis=-1)
+
+def _trinomial_columns(S, K, T, r, sigma, phi, american, N, levels=0, align=True, smooth=False):
+    """
+    Price contracts laid out as (m, 1) columns on a trinomial lattice in log
+    price, refining the last time step near the strike `levels` times, or
+    with smooth, replacing it with Black-Scholes values.
+    """
+    k = T / N
+    h = _LAMBDA * sigma * np.sqrt(k)
+    centre = _centre(S, K, h, align)
+    probabilities = _probabilities(r, sigma, h, k)
+    disc = np.exp(-r * k)
+
+    # One extra node at either end leaves three root nodes to interpolate from
+    nodes = centre + np.arange(-N - 1, N + 2) * h
+    if smooth:
+        nodes = nodes[..., 1:-1]
+        values = _black_scholes(np.exp(nodes), K, k, r, sigma, phi)
+        if np.any(american):
+            np.maximum(values, np.where(american, phi * (np.exp(nodes) - K), 0.0), out=values)
+    else:
+        values = np.maximum(phi * (np.exp(nodes) - K), 0.0)
+        values = _step(values, nodes, K, phi, probabilities, disc, american)
+        nodes = nodes[..., 1:-1]
+    if levels and N > 1:
+        _patch(values, nodes, K, r, sigma, phi, american, h, k, levels)
+    for _ in range(N - 1):
+        values = _step(values, nodes, K, phi, probabilities, disc, american)
+        nodes = nodes[..., 1:-1]
+
+    # Quadratic through the root nodes, evaluated at the spot. The option
+    # value curves too sharply near the strike for a quadratic over a few
+    # steps, so only the lattice's departure from the European Black-Scholes
+    # value is interpolated, and the Black-Scholes value at the spot added
+    european = _black_scholes(np.exp(nodes), K, T, r, sigma, phi)
+    down, mid, up = (values - european)[..., 0], (values - european)[..., 1], (values - european)[..., 2]
+    t = ((np.log(S) - centre) / h)[..., 0]
+    prices = mid + t * (up - down) / 2 + t**2 * (up - 2 * mid + down) / 2
+    prices += _black_scholes(S, K, T, r, sigma, phi)[..., 0]
+    exercise = np.where(american, phi * (S - K), 0.0)[..., 0]
+    return np.maximum(prices, exercise)
+
+def _price(S, K, T, r, sigma, option_type, american, N, levels, align, smooth=False):
+    shape, (S, K, T, r, sigma, phi, american) = _contract_columns(
+        S, K, T, r, sigma, option_type, american
+    )
+    if N < 1:
+        raise ValueError("N must be at least 1")
+    instrumentation.increment('pricing.lattice_prices', S.shape[0])
+    prices = np.empty(S.shape[0])
+    # Block the contracts so the (m, 2N + 1) working arrays stay small
+    block_size = max(1, (1 << 16) // (2 * N + 1))
+    for start in range(0, prices.size, block_size):
+        rows = slice(start, start + block_size)
+        prices[rows] = _trinomial_columns(
+            S[rows], K[rows], T[rows], r[rows], sigma[rows], phi[rows], american[rows], N, levels, align, smooth,
+        )
+    return prices.reshape(shape)
+
+@instrumentation.timed('pricing.trinomial_option_price')
+def trinomial_option_price(S, K, T, r, sigma, option_type='call', american=True, N=100, align=True,
+                           extrapolate=True):
+    """
+    Price American or European options on a trinomial lattice.
+
+    The lattice is built in log price and shifted so the strike sits on a
+    node, so the price converges smoothly in N instead of oscillating like
+    the CRR tree. A trinomial step costs about twice a CRR step, so the
+    plain lattice is less accurate than CRR for the same time. With
+    extrapolate, the last step uses Black-Scholes values and the prices at
+    N and N / 2 are Richardson-extrapolated (as the 'bbsr' binomial method
+    does). On the benchmark contract (benchmarks/cases.py,
+    CONVERGENCE_CONTRACT) that takes the error at about 2 ms from 2e-3 with
+    CRR to 3e-5 (European) and 1e-4 (American). Inputs broadcast as in
+    batch_option_price.
+
+    Parameters:
+    S, K, T, r, sigma, option_type, american : see batch_option_price
+    N : int
+        Number of time steps (the lattice has 2N + 1 nodes at expiry)
+    align : bool
+        Shift the lattice so the strike sits on a node
+    extrapolate : bool
+        Smooth the last step and extrapolate from N and N / 2 steps
+
+    Returns:
+    price : ndarray
+        Option prices
+    """
+    if not extrapolate:
+        return _price(S, K, T, r, sigma, option_type, american, N, 0, align)
+    fine = _price(S, K, T, r, sigma, option_type, american, N, 0, align, True)
+    coarse = _price(S, K, T, r, sigma, option_type, american, max(N // 2, 1), 0, align, True)
+    return 2 * fine - coarse
+
+@instrumentation.timed('pricing.adaptive_mesh_option_price')
+def adaptive_mesh_option_price(S, K, T, r, sigma, option_type='call', american=True, N=100, levels=2):
+    """
+    Price American or European options with the adaptive mesh model.
+
+    A coarse trinomial lattice covers the whole life of the option. In the
+    last coarse time step, where the kink of the payoff at the strike
+    causes most of the discretization error, the nodes next to the strike
+    are revalued on a finer mesh (half the price step, a quarter of the time
+    step), and that mesh is refined again near the strike, `levels` times.
+    The extra nodes are few and independent of N. The coarse lattice is
+    aligned with the strike as in trinomial_option_price, so the error
+    falls steadily as 1 / N, at about a tenth of the plain lattice's error
+    for the same N.
+
+    Parameters:
+    S, K, T, r, sigma, option_type, american : see batch_option_price
+    N : int
+        Number of coarse time steps
+    levels : int
+        Number of refinement levels
+
+    Returns:
+    price : ndarray
+        Option prices
+    """
+    if levels < 0:
+        raise ValueError("levels must be non-negative")
+    return _price(S, K, T, r, sigma, option_type, american, N, levels, True)
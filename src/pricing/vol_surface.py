@@ -0,0 +1,268 @@
+# src/pricing/vol_surface.py
+
+from dataclasses import dataclass
+from datetime import date
+from dateutil import parser
+import numpy as np
+from scipy.optimize import least_squares
+from src import instrumentation
+
+# Fewest quotes an expiry needs for a full SVI fit; thinner expiries get a
+# flat smile at their mean variance
+MIN_QUOTES = 5
+
+# Parameter bounds (a, b, rho, m, s) of the raw SVI fit
+_LOWER = (-np.inf, 0.0, -0.999, -np.inf, 1e-4)
+_UPPER = (np.inf, np.inf, 0.999, np.inf, np.inf)
+
+@dataclass(frozen=True)
+class SVISlice:
+    """
+    Raw SVI smile of one expiry.
+
+    Total implied variance at log-moneyness k = log(K / F) is
+    w(k) = a + b * (rho * (k - m) + sqrt((k - m)**2 + s**2)).
+
+    Attributes:
+    T : float
+        Time to expiration in years
+    a, b, rho, m, s : float
+        SVI parameters
+    rmse : float
+        Root-mean-square implied volatility error of the fit
+    n_quotes : int
+        Number of quotes fitted
+    """
+    T: float
+    a: float
+    b: float
+    rho: float
+    m: float
+    s: float
+    rmse: float = 0.0
+    n_quotes: int = 0
+
+    @property
+    def params(self):
+        return (self.a, self.b, self.rho, self.m, self.s)
+
+    def total_variance(self, k):
+        return _svi(np.asarray(k, dtype=float), *self.params)
+
+def _svi(k, a, b, rho, m, s):
+    x = k - m
+    return a + b * (rho * x + np.sqrt(x * x + s * s))
+
+def _years_to_expiry(expiration, today):
+    """
+    Convert an expiration key to years, matching calculate_time_to_expiry in
+    the app. Numeric keys are taken to be years already.
+    """
+    if isinstance(expiration, (int, float)):
+        return float(expiration)
+    return (parser.parse(str(expiration)).date() - today).days / 365
+
+def _smile_quotes(calls, puts, F, sigma):
+    """
+    Collect the out-of-the-money quotes of one expiry: puts below the
+    forward and calls at or above it, where quotes are most liquid.
+
+    Returns:
+    strikes, vols : ndarray
+        Strikes and implied volatilities, sorted by strike
+    """
+    strikes, vols = [], []
+    for chain, otm in ((puts, lambda K: K < F), (calls, lambda K: K >= F)):
+        if chain is None:
+            continue
+        K = np.asarray(chain['strike'], dtype=float)
+        iv = np.asarray(chain[sigma], dtype=float)
+        keep = otm(K) & (iv > 0) & np.isfinite(iv)
+        strikes.append(K[keep])
+        vols.append(iv[keep])
+    if not strikes:
+        return np.empty(0), np.empty(0)
+    strikes, vols = np.concatenate(strikes), np.concatenate(vols)
+    order = np.argsort(strikes, kind='stable')
+    return strikes[order], vols[order]
+
+@instrumentation.timed('pricing.fit_svi')
+def fit_svi(k, w, T, guess=None):
+    """
+    Fit a raw SVI smile to total implied variances.
+
+    Parameters:
+    k : array_like
+        Log-moneyness log(K / F) of each quote
+    w : array_like
+        Total implied variance sigma**2 * T of each quote
+    T : float
+        Time to expiration in years
+    guess : sequence of float, optional
+        Starting (a, b, rho, m, s), e.g. the previous fit of the expiry
+
+    Returns:
+    smile : SVISlice
+    """
+    k = np.asarray(k, dtype=float)
+    w = np.asarray(w, dtype=float)
+    if not k.size:
+        raise ValueError("fit_svi needs at least one quote")
+    if k.size < MIN_QUOTES:
+        level = float(w.mean())
+        return SVISlice(T, level, 0.0, 0.0, 0.0, 0.1, 0.0, int(k.size))
+
+    if guess is None:
+        guess = (0.5 * w.min(), 0.1, -0.3, float(k[np.argmin(w)]), 0.1)
+    guess = np.clip(guess, np.add(_LOWER, 1e-6), np.subtract(_UPPER, 1e-6))
+    fit = least_squares(lambda x: _svi(k, *x) - w, guess, bounds=(_LOWER, _UPPER), method='trf')
+    fitted = np.sqrt(np.maximum(_svi(k, *fit.x), 0.0) / T)
+    rmse = float(np.sqrt(np.mean((fitted - np.sqrt(w / T))**2)))
+    return SVISlice(T, *map(float, fit.x), rmse, int(k.size))
+
+class VolatilitySurface:
+    """
+    Implied volatility surface fitted from option chains.
+
+    Each expiry is fitted with a raw SVI smile in log-moneyness against the
+    forward, and expiries are joined by linear interpolation of total
+    variance in time; before the first and after the last expiry the
+    nearest smile's implied volatility is held constant. Fitted parameters
+    are cached per expiry, and update() refits an expiry only when its
+    quotes (or time to expiration) changed, so refreshing a surface after a
+    new fetch costs one fit per changed expiry.
+
+    Parameters:
+    S : float
+        Current stock price; smiles are evaluated against the forward at
+        this price, so moving it shifts the surface with the spot
+    r : float
+        Risk-free interest rate (annual)
+    sigma : str
+        Chain column holding implied volatilities
+    """
+
+    def __init__(self, S, r=0.01, sigma='impliedVolatility'):
+        self.S = S
+        self.r = r
+        self.sigma_column = sigma
+        self.slices = {}
+        self.fits = 0
+        self._fingerprints = {}
+        self._stacked = None
+
+    def __len__(self):
+        return len(self.slices)
+
+    def __contains__(self, expiration):
+        return expiration in self.slices
+
+    def fit_expiry(self, expiration, calls, puts, T):
+        """
+        Fit (or refit) one expiry from its calls and puts. An expiry with
+        no usable quotes (none out of the money with a positive implied
+        volatility) is dropped from the surface rather than fitted.
+
+        Returns:
+        refitted : bool
+            False if the quotes are unchanged since the last fit, or if
+            there are none to fit
+        """
+        F = self.S * np.exp(self.r * T)
+        strikes, vols = _smile_quotes(calls, puts, F, self.sigma_column)
+        if not strikes.size:
+            self.remove(expiration)
+            return False
+        fingerprint = hash((T, strikes.tobytes(), vols.tobytes()))
+        if self._fingerprints.get(expiration) == fingerprint:
+            return False
+
+        previous = self.slices.get(expiration)
+        guess = previous.params if previous is not None and previous.b > 0 else None
+        self.slices[expiration] = fit_svi(np.log(strikes / F), vols**2 * T, T, guess)
+        self._fingerprints[expiration] = fingerprint
+        self._stacked = None
+        self.fits += 1
+        return True
+
+    def update(self, chains, today=None):
+        """
+        Refit the expiries whose quotes changed.
+
+        Parameters:
+        chains : dict
+            expiration -> (calls, puts) as returned by get_option_chain, as
+            DataFrames or OptionChains. Expirations are date strings or
+            times to expiration in years.
+        today : datetime.date, optional
+            Valuation date for date-string expirations
+
+        Returns:
+        refitted : list
+            Expirations that were fitted
+        """
+        today = today or date.today()
+        refitted = []
+        for expiration, (calls, puts) in chains.items():
+            T = _years_to_expiry(expiration, today)
+            if T <= 0 or (calls is None and puts is None):
+                self.remove(expiration)
+                continue
+            if self.fit_expiry(expiration, calls, puts, T):
+                refitted.append(expiration)
+        return refitted
+
+    def remove(self, expiration):
+        """
+        Drop an expiry from the surface, e.g. once it has expired.
+        """
+        if self.slices.pop(expiration, None) is not None:
+            self._fingerprints.pop(expiration, None)
+            self._stacked = None
+
+    def _stack(self):
+        if self._stacked is None:
+            smiles = sorted(self.slices.values(), key=lambda smile: smile.T)
+            times = np.array([smile.T for smile in smiles])
+            params = np.array([smile.params for smile in smiles]).reshape(-1, 5)
+            self._stacked = times, params
+        return self._stacked
+
+    def sigma(self, K, T):
+        """
+        Evaluate implied volatility at arbitrary strikes and expiries.
+
+        Parameters:
+        K : float or array_like
+            Strike prices
+        T : float or array_like
+            Times to expiration in years; broadcast against K
+
+        Returns:
+        sigma : ndarray
+            Implied volatility per (K, T) pair
+        """
+        times, params = self._stack()
+        if not times.size:
+            raise ValueError("surface has no fitted expiries")
+        K, T = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        shape = K.shape
+        K, T = K.ravel(), T.ravel()
+
+        k = np.log(K / (self.S * np.exp(self.r * T)))
+        i = np.searchsorted(times, T)
+        lo = np.clip(i - 1, 0, times.size - 1)
+        hi = np.clip(i, 0, times.size - 1)
+        t_lo, t_hi = times[lo], times[hi]
+        w_lo = np.maximum(_svi(k, *params[lo].T), 0.0)
+        w_hi = np.maximum(_svi(k, *params[hi].T), 0.0)
+
+        # Variance per year: constant outside the fitted expiries, linear
+        # total variance between them
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = (T - t_lo) / (t_hi - t_lo)
+            variance = np.where(
+                T <= t_lo, w_lo / t_lo,
+                np.where(T >= t_hi, w_hi / t_hi, ((1 - x) * w_lo + x * w_hi) / T),
+            )
+        return np.sqrt(variance).reshape(shape)
@@ -0,0 +1,353 @@
+# src/service.py
+
+import argparse
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src import instrumentation
+from src.calculations.pnl import calculate_pnl
+from src.pricing.cache import default_cache
+from src.pricing.engines import PRICING_ENGINES, option_price
+from src.pricing.greeks import batch_greeks
+from src.pricing.implied_vol import implied_volatility
+from src.pricing.payoff import payoff_signs
+
+logger = logging.getLogger(__name__)
+
+# Largest request body accepted, in bytes
+MAX_BODY = 10 * 1024 * 1024
+
+_FLOAT_FIELDS = ('S', 'K', 'T', 'r', 'sigma')
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+class MicroBatcher:
+    """
+    Collect requests that arrive within a short window and serve each group
+    of compatible requests with one vectorized call.
+
+    Requests are submitted with a key (e.g. ('price', engine, N)) and a dict
+    of equal-length 1-D input columns. When the window closes, or max_batch
+    contracts are pending, the columns of requests sharing a key are
+    concatenated, `compute(key, columns)` runs once per key on a worker
+    thread, and each request receives its slice of the result columns. If
+    a batched call raises, each request of the batch is computed on its own,
+    so only the requests that fail by themselves receive the exception.
+
+    Parameters:
+    compute : callable
+        compute(key, columns) -> dict of result arrays aligned with columns
+    window : float
+        Seconds to wait for more requests after the first one arrives
+    max_batch : int
+        Pending contracts that trigger an immediate flush
+    """
+
+    def __init__(self, compute, window=0.002, max_batch=8192):
+        self.compute = compute
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self._pending = []
+        self._size = 0
+        self._timer = None
+        self._tasks = set()
+        # One thread: batches run one after another, off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def submit(self, key, columns):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((key, columns, future))
+        self._size += len(next(iter(columns.values())))
+        if self._size >= self.max_batch:
+            self._flush_now()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush_now)
+        return await future
+
+    def _flush_now(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending, self._size = self._pending, [], 0
+        groups = {}
+        for key, columns, future in pending:
+            groups.setdefault(key, []).append((columns, future))
+        for key, requests in groups.items():
+            task = asyncio.get_running_loop().create_task(self._run(key, requests))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key, requests):
+        sizes = [len(next(iter(columns.values()))) for columns, _ in requests]
+        columns = {name: np.concatenate([c[name] for c, _ in requests]) for name in requests[0][0]}
+        instrumentation.observe('service.batch_size', sum(sizes), instrumentation.SIZE_BUCKETS, unit='')
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self._executor, self.compute, key, columns)
+        except Exception as e:
+            if len(requests) == 1:
+                if not requests[0][1].done():
+                    requests[0][1].set_exception(e)
+                return
+            # Isolate the failing requests instead of failing the whole batch
+            instrumentation.increment('service.batch_retries')
+            for columns, future in requests:
+                try:
+                    result = await loop.run_in_executor(self._executor, self.compute, key, columns)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                    continue
+                if not future.done():
+                    future.set_result(result)
+            return
+        self.batches += 1
+        start = 0
+        for size, (_, future) in zip(sizes, requests):
+            if not future.done():
+                future.set_result({name: values[start:start + size] for name, values in results.items()})
+            start += size
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+def _json_values(values, shape):
+    """
+    Convert a result column to JSON-ready lists (NaN becomes null).
+    """
+    values = np.asarray(values, dtype=float).reshape(shape)
+    if values.ndim == 0:
+        return None if np.isnan(values) else float(values)
+    objects = values.astype(object)
+    objects[np.isnan(values)] = None
+    return objects.tolist()
+
+def _contract_inputs(body, fields=_FLOAT_FIELDS):
+    """
+    Broadcast the contract fields of a request body into flat columns,
+    rejecting inputs no engine can price (sigma <= 0 or T < 0) before the
+    request joins a batch.
+
+    Returns:
+    shape : tuple
+        Broadcast shape of the request, used to shape the response
+    columns : dict of ndarray
+        One flat column per field, plus option_type and american
+    """
+    missing = [name for name in fields if name not in body]
+    if missing:
+        raise ValueError(f"missing fields {missing}")
+    option_type = np.asarray(body.get('option_type', 'call'))
+    payoff_signs(option_type)
+    arrays = np.broadcast_arrays(
+        *(np.asarray(body[name], dtype=float) for name in fields),
+        np.char.lower(option_type.astype(str)),
+        np.asarray(body.get('american', True), dtype=bool),
+    )
+    names = (*fields, 'option_type', 'american')
+    columns = {name: np.ravel(a) for name, a in zip(names, arrays)}
+    if 'sigma' in columns and not np.all(columns['sigma'] > 0):
+        raise ValueError("sigma must be positive")
+    if not np.all(columns['T'] >= 0):
+        raise ValueError("T must be non-negative")
+    return arrays[0].shape, columns
+
+def _steps(body):
+    N = int(body.get('N', 100))
+    if N < 1:
+        raise ValueError("N must be at least 1")
+    return N
+
+class PricingService:
+    """
+    Asynchronous HTTP/JSON pricing service.
+
+    Endpoints (POST, JSON bodies; contract fields are scalars or arrays that
+    broadcast together):
+      /price   S, K, T, r, sigma, option_type, american, N, engine -> price
+      /greeks  S, K, T, r, sigma, option_type, american, N -> price and Greeks
+      /iv      price, S, K, T, r, option_type, american, N -> sigma
+      /pnl     /price fields plus position, entry_price, quantity -> price, pnl
+    and GET /health and /metrics (Prometheus text from src.instrumentation).
+
+    Requests arriving within `window` seconds are micro-batched into one
+    vectorized call per endpoint and engine, and Binomial prices go through
+    the shared pricing cache.
+
+    Parameters:
+    host, port : str, int
+        Address to listen on; port 0 picks a free port
+    window : float
+        Micro-batching window in seconds
+    max_batch : int
+        Contracts per batch that trigger an immediate flush
+    cache : PricingCache, optional
+        Cache for Binomial prices; defaults to the process-wide cache
+    """
+
+    def __init__(self, host='127.0.0.1', port=8000, window=0.002, max_batch=8192, cache=default_cache):
+        self.host = host
+        self.port = port
+        self.cache = cache
+        self.batcher = MicroBatcher(self._compute, window, max_batch)
+        self._server = None
+        self._routes = {
+            '/price': self._price,
+            '/greeks': self._greeks,
+            '/iv': self._iv,
+            '/pnl': self._pnl,
+        }
+
+    def _compute(self, key, c):
+        kind, N = key[0], key[-1]
+        contracts = (c['S'], c['K'], c['T'], c['r'])
+        if kind == 'price':
+            engine = key[1]
+            cache = self.cache if engine == 'binomial' else None
+            return {'price': option_price(*contracts, c['sigma'], c['option_type'], c['american'], N, engine, cache)}
+        if kind == 'greeks':
+            return batch_greeks(*contracts, c['sigma'], c['option_type'], c['american'], N)
+        return {'sigma': implied_volatility(c['price'], *contracts, c['option_type'], c['american'], N)}
+
+    async def _price(self, body):
+        engine = body.get('engine', 'binomial')
+        if engine not in PRICING_ENGINES:
+            raise ValueError(f"engine must be one of {sorted(PRICING_ENGINES)}")
+        shape, columns = _contract_inputs(body)
+        if engine == 'black_scholes' and np.any(columns['american'] & (columns['option_type'] == 'put')):
+            raise ValueError("black_scholes prices European options only; use 'baw' or 'binomial' for American puts")
+        result = await self.batcher.submit(('price', engine, _steps(body)), columns)
+        return shape, result
+
+    async def _greeks(self, body):
+        N = _steps(body)
+        if N < 2:
+            raise ValueError("N must be at least 2 to compute gamma and theta")
+        shape, columns = _contract_inputs(body)
+        return shape, await self.batcher.submit(('greeks', N), columns)
+
+    async def _iv(self, body):
+        shape, columns = _contract_inputs(body, ('price', 'S', 'K', 'T', 'r'))
+        return shape, await self.batcher.submit(('iv', _steps(body)), columns)
+
+    async def _pnl(self, body):
+        shape, result = await self._price(body)
+        price = result['price']
+        pnl = calculate_pnl(body.get('position', 'long'), float(body.get('entry_price', 0.0)),
+                            price, int(body.get('quantity', 1)))
+        return shape, {'price': price, 'pnl': pnl}
+
+    async def handle(self, method, path, body):
+        """
+        Route one request.
+
+        Returns:
+        (status, payload) : int, dict or str
+        """
+        if method == 'GET' and path == '/health':
+            cache = self.cache.stats() if self.cache is not None else None
+            return 200, {'status': 'ok', 'batches': self.batcher.batches, 'cache': cache}
+        if method == 'GET' and path == '/metrics':
+            return 200, instrumentation.registry.to_prometheus()
+        route = self._routes.get(path)
+        if route is None:
+            return 404, {'error': f"unknown path {path}"}
+        if method != 'POST':
+            return 405, {'error': "use POST"}
+        try:
+            body = json.loads(body or b'{}')
+            if not isinstance(body, dict):
+                raise ValueError("request body must be a JSON object")
+            with instrumentation.timer(f"service.{path.strip('/')}"):
+                shape, result = await route(body)
+        except (ValueError, TypeError, KeyError) as e:
+            return 400, {'error': str(e)}
+        except Exception:
+            logger.exception("Error handling %s", path)
+            return 500, {'error': "internal error"}
+        return 200, {name: _json_values(values, shape) for name, values in result.items()}
+
+    async def _connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY:
+                    status, payload = 413, {'error': "request body too large"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b''
+                    status, payload = await self.handle(method, path.split('?')[0], body)
+                    keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+
+                if isinstance(payload, str):
+                    content, content_type = payload.encode(), 'text/plain; version=0.0.4'
+                else:
+                    content, content_type = json.dumps(payload).encode(), 'application/json'
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(content)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + content
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.batcher.shutdown()
+
+    async def serve_forever(self):
+        await self.start()
+        logger.info("Pricing service listening on http://%s:%d", self.host, self.port)
+        async with self._server:
+            await self._server.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve option pricing over HTTP/JSON.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--window', type=float, default=0.002, help="micro-batching window in seconds")
+    parser.add_argument('--max-batch', type=int, default=8192, help="contracts that trigger an immediate batch")
+    parser.add_argument('--metrics', action='store_true', help="collect timings for /metrics")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.metrics:
+        instrumentation.enable()
+    service = PricingService(args.host, args.port, args.window, args.max_batch)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
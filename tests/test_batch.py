@@ -0,0 +1,51 @@
+# tests/test_batch.py
+
+import unittest
+import numpy as np
+import pandas as pd
+from src.pricing.batch import batch_option_price, price_option_chain
+from src.pricing.binomial_model import binomial_option_price
+
+class TestBatchPricing(unittest.TestCase):
+    def test_matches_single_contract_pricer(self):
+        S = 100
+        K = np.array([80, 95, 100, 105, 120])
+        T = np.array([0.25, 0.5, 1.0, 1.0, 2.0])
+        sigma = np.array([0.3, 0.25, 0.2, 0.2, 0.35])
+        option_type = ['call', 'put', 'call', 'put', 'put']
+        prices = batch_option_price(S, K, T, 0.05, sigma, option_type, True, 100)
+        for i in range(len(K)):
+            expected = binomial_option_price(S, K[i], T[i], 0.05, sigma[i], option_type[i], True, 100)
+            self.assertAlmostEqual(prices[i], expected, places=10)
+
+    def test_mixed_exercise_styles(self):
+        prices = batch_option_price(100, 100, 1, 0.05, 0.2, 'put', [True, False], 200)
+        self.assertAlmostEqual(prices[0], binomial_option_price(100, 100, 1, 0.05, 0.2, 'put', True, 200), places=10)
+        self.assertAlmostEqual(prices[1], binomial_option_price(100, 100, 1, 0.05, 0.2, 'put', False, 200), places=10)
+
+    def test_block_size_does_not_change_prices(self):
+        K = np.linspace(50, 150, 37)
+        full = batch_option_price(100, K, 0.5, 0.03, 0.25, 'put', True, 50)
+        blocked = batch_option_price(100, K, 0.5, 0.03, 0.25, 'put', True, 50, block_size=4)
+        np.testing.assert_allclose(full, blocked, rtol=0, atol=1e-12)
+
+    def test_accelerated_methods_match_single_contract_pricer(self):
+        K = np.array([90.0, 100.0, 110.0])
+        for method in ('bbs', 'bbsr', 'leisen_reimer'):
+            prices = batch_option_price(100, K, 0.5, 0.05, 0.3, 'put', True, 60, method=method)
+            for i in range(len(K)):
+                expected = binomial_option_price(100, K[i], 0.5, 0.05, 0.3, 'put', True, 60, method=method)
+                self.assertAlmostEqual(prices[i], expected, places=10)
+
+    def test_price_option_chain(self):
+        chain = pd.DataFrame({'strike': [90.0, 100.0, 110.0], 'impliedVolatility': [0.25, 0.2, 0.22]})
+        prices = price_option_chain(chain, 100, 0.5, 0.05, 'call')
+        self.assertEqual(prices.shape, (3,))
+        self.assertTrue(np.all(np.diff(prices) < 0))
+
+    def test_invalid_option_type(self):
+        with self.assertRaises(ValueError):
+            batch_option_price(100, [100, 110], 1, 0.05, 0.2, ['call', 'invalid'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# tests/test_benchmarks.py
+
+import json
+import os
+import tempfile
+import unittest
+from benchmarks.cases import build_cases
+from benchmarks.fixtures import EXPIRATIONS, load_chains
+from benchmarks.harness import compare, measure
+from benchmarks.run import main
+
+class TestBenchmarks(unittest.TestCase):
+    def test_compare_flags_regressions(self):
+        baseline = {'a': {'best': 1.0}, 'b': {'best': 1.0}, 'c': {'best': 1.0}, 'old': {'best': 1.0}}
+        results = {'a': {'best': 1.5}, 'b': {'best': 1.1}, 'c': {'best': 0.5}, 'new': {'best': 1.0}}
+        rows = compare(results, baseline, threshold=0.25)
+        self.assertEqual([row['name'] for row in rows], ['a', 'b', 'c'])
+        self.assertEqual([row['status'] for row in rows], ['regression', 'ok', 'improvement'])
+        self.assertAlmostEqual(rows[0]['ratio'], 1.5)
+
+    def test_measure(self):
+        timing = measure(lambda: sum(range(100)), repeat=3, min_time=0.001)
+        self.assertGreater(timing['best'], 0)
+        self.assertLessEqual(timing['best'], timing['median'])
+        self.assertEqual(timing['repeat'], 3)
+
+    def test_cases(self):
+        names = [case.name for case in build_cases(['binomial'], quick=True)]
+        self.assertEqual(len(names), 8)
+        self.assertIn('binomial/put/european/N=500', names)
+        self.assertEqual(len(build_cases(pattern='calculator')), 1)
+        with self.assertRaises(ValueError):
+            build_cases(['unknown'])
+
+    def test_convergence_cases_record_error(self):
+        cases = build_cases(['convergence'], quick=True, pattern='european')
+        self.assertEqual(len(cases), 8)
+        for case in cases:
+            case.setup()
+            self.assertLess(case.params['error'], 0.1)
+
+    def test_convergence_plot(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'results.json')
+            argv = ['--group', 'convergence', '--quick', '--filter', 'N=50', '--repeat', '1',
+                    '--min-time', '0.001', '--output', output]
+            self.assertEqual(main(argv), 0)
+            plot = os.path.join(tmp, 'results_convergence.png')
+            with open(plot, 'rb') as f:
+                self.assertEqual(f.read(8), b'\x89PNG\r\n\x1a\n')
+
+    def test_fixtures_replay_offline(self):
+        S, chains = load_chains()
+        self.assertEqual(S, 100.0)
+        self.assertEqual(tuple(chains), EXPIRATIONS)
+        calls, puts = chains[EXPIRATIONS[0]]
+        self.assertEqual(len(calls), len(puts))
+        self.assertTrue((calls['ask'] >= calls['bid']).all())
+
+    def test_run_against_baseline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'results.json')
+            argv = ['--filter', 'calculator', '--repeat', '2', '--min-time', '0.001', '--output', output]
+            self.assertEqual(main(argv), 0)
+            with open(output) as f:
+                saved = json.load(f)
+            self.assertIn('calculator/long_call', saved['results'])
+
+            # A baseline far faster than anything achievable forces a regression
+            saved['results']['calculator/long_call']['best'] = 1e-12
+            baseline = os.path.join(tmp, 'baseline.json')
+            with open(baseline, 'w') as f:
+                json.dump(saved, f)
+            self.assertEqual(main(argv + ['--baseline', baseline]), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -42,5 +42,35 @@ class TestBinomialModel(unittest.TestCase):
         with self.assertRaises(ValueError):
             binomial_option_price(S, K, T, r, sigma, option_type, american, N)
 
+    def test_european_call_matches_black_scholes(self):
+        # Black-Scholes value for S=K=100, T=1, r=5%, sigma=20%
+        price = binomial_option_price(100, 100, 1, 0.05, 0.2, 'call', False, 1000)
+        self.assertAlmostEqual(price, 10.4506, places=2)
+
+    def test_american_put_exceeds_european_put(self):
+        american = binomial_option_price(100, 100, 1, 0.05, 0.2, 'put', True, 500)
+        european = binomial_option_price(100, 100, 1, 0.05, 0.2, 'put', False, 500)
+        self.assertGreater(american, european)
+
+    def test_american_call_equals_european_without_dividends(self):
+        american = binomial_option_price(110, 100, 0.5, 0.03, 0.25, 'call', True, 200)
+        european = binomial_option_price(110, 100, 0.5, 0.03, 0.25, 'call', False, 200)
+        self.assertAlmostEqual(american, european, places=10)
+
+    def test_accelerated_methods_reach_penny_accuracy_at_low_n(self):
+        # Black-Scholes value for S=K=100, T=1, r=5%, sigma=20%
+        for method in ('bbsr', 'leisen_reimer'):
+            price = binomial_option_price(100, 100, 1, 0.05, 0.2, 'call', False, 51, method=method)
+            self.assertAlmostEqual(price, 10.4506, delta=0.01)
+
+    def test_bbsr_american_put_matches_fine_tree(self):
+        reference = binomial_option_price(100, 105, 1, 0.05, 0.3, 'put', True, 5000)
+        price = binomial_option_price(100, 105, 1, 0.05, 0.3, 'put', True, 100, method='bbsr')
+        self.assertAlmostEqual(price, reference, delta=0.01)
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            binomial_option_price(100, 100, 1, 0.05, 0.2, 'call', True, 100, method='invalid')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,27 @@
+# tests/test_black_scholes.py
+
+import unittest
+import numpy as np
+from src.pricing.black_scholes import black_scholes_price, black_scholes_vega
+
+class TestBlackScholes(unittest.TestCase):
+    def test_call_price(self):
+        price = black_scholes_price(100, 100, 1, 0.05, 0.2, 'call')
+        self.assertAlmostEqual(price, 10.4506, places=4)
+
+    def test_put_call_parity(self):
+        K = np.array([80.0, 100.0, 120.0])
+        calls = black_scholes_price(100, K, 0.5, 0.03, 0.25, 'call')
+        puts = black_scholes_price(100, K, 0.5, 0.03, 0.25, 'put')
+        np.testing.assert_allclose(calls - puts, 100 - K * np.exp(-0.03 * 0.5), atol=1e-10)
+
+    def test_vega(self):
+        vega = black_scholes_vega(100, 100, 1, 0.05, 0.2)
+        self.assertAlmostEqual(vega, 37.524, places=3)
+
+    def test_invalid_option_type(self):
+        with self.assertRaises(ValueError):
+            black_scholes_price(100, 100, 1, 0.05, 0.2, 'invalid')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# tests/test_bulk_fetch.py
+
+import json
+import threading
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.data.bulk_fetch import BulkFetcher, RateLimiter
+from src.data.providers import HttpProvider
+
+EXPIRATIONS = ['2024-12-20', '2025-01-17', '2025-02-21']
+
+class StubFeed(BaseHTTPRequestHandler):
+    """
+    Minimal JSON feed: symbols starting with 'BAD' are unknown, every path
+    listed in `flaky` fails with 503 that many times before succeeding, and
+    requests for symbols in `held` wait until `release` is set. The feed
+    records the peak number of requests it served at once.
+    """
+    flaky = {}
+    hits = Counter()
+    lock = threading.Lock()
+    held = set()
+    release = threading.Event()
+    in_flight = 0
+    peak = 0
+
+    def do_GET(self):
+        parts = self.path.strip('/').split('/')
+        cls = type(self)
+        with self.lock:
+            self.hits[self.path] += 1
+            failures_left = self.flaky.get(self.path, 0)
+            if failures_left:
+                self.flaky[self.path] = failures_left - 1
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            if parts[1] in self.held:
+                self.release.wait(timeout=5)
+            self._respond(parts, failures_left)
+        finally:
+            with self.lock:
+                cls.in_flight -= 1
+
+    def _respond(self, parts, failures_left):
+        if failures_left:
+            return self._send(503, {'error': 'unavailable'})
+        if parts[1].startswith('BAD'):
+            return self._send(404, {'error': 'unknown symbol'})
+        if parts[0] == 'expirations':
+            return self._send(200, {'expirations': EXPIRATIONS})
+        row = {'strike': 100.0, 'bid': 5.0, 'ask': 5.2, 'lastPrice': 5.1}
+        return self._send(200, {'calls': [row], 'puts': [row]})
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+class TestBulkFetch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubFeed)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f'http://127.0.0.1:{cls.server.server_address[1]}/'
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubFeed.flaky = {}
+        StubFeed.hits = Counter()
+        StubFeed.held = set()
+        StubFeed.release = threading.Event()
+        StubFeed.in_flight = StubFeed.peak = 0
+        self.provider = HttpProvider(self.url)
+
+    def test_universe_with_partial_failures(self):
+        StubFeed.flaky = {'/chain/AAPL/2025-01-17': 2, '/expirations/MSFT': 1}
+        symbols = ['AAPL', 'MSFT', 'BADX']
+        with BulkFetcher(self.provider, max_workers=4, retries=3, backoff=0.001) as fetcher:
+            report = fetcher.fetch_universe(symbols)
+        self.assertEqual(len(report.chains), 6)
+        self.assertEqual(len(report.failures), 1)
+        failure = report.failures[0]
+        self.assertEqual((failure.symbol, failure.expiration), ('BADX', None))
+        self.assertIsInstance(failure.error, LookupError)
+        # The flaky chain succeeded on its third attempt; unknown symbols are not retried
+        self.assertEqual(StubFeed.hits['/chain/AAPL/2025-01-17'], 3)
+        self.assertEqual(StubFeed.hits['/expirations/BADX'], 1)
+        # Six chains plus two retries; the expiration lookups are not counted
+        self.assertEqual(report.attempts, 8)
+        calls, puts = report.chains[('AAPL', '2025-01-17')]
+        self.assertEqual(calls['strike'].tolist(), [100.0])
+
+    def test_retries_exhausted(self):
+        StubFeed.flaky = {'/chain/AAPL/2024-12-20': 10}
+        with BulkFetcher(self.provider, retries=2, backoff=0.001) as fetcher:
+            results = list(fetcher.stream_chains([('AAPL', '2024-12-20'), ('AAPL', '2025-01-17')]))
+        by_expiration = {result.expiration: result for result in results}
+        self.assertFalse(by_expiration['2024-12-20'].ok)
+        self.assertEqual(by_expiration['2024-12-20'].attempts, 3)
+        self.assertTrue(by_expiration['2025-01-17'].ok)
+
+    def test_results_stream_concurrently(self):
+        StubFeed.held = {f'S{i}' for i in range(4)}
+        pairs = [(f'S{i}', '2024-12-20') for i in range(8)]
+        try:
+            with BulkFetcher(self.provider, max_workers=8) as fetcher:
+                stream = fetcher.stream_chains(pairs)
+                # The first results arrive while the held requests are still open
+                early = [next(stream) for _ in range(4)]
+                self.assertFalse(StubFeed.release.is_set())
+                StubFeed.release.set()
+                late = list(stream)
+        finally:
+            StubFeed.release.set()
+        self.assertEqual(sorted(result.symbol for result in early), ['S4', 'S5', 'S6', 'S7'])
+        self.assertEqual(sorted(result.symbol for result in late), ['S0', 'S1', 'S2', 'S3'])
+        self.assertTrue(all(result.ok for result in early + late))
+        self.assertGreater(StubFeed.peak, 1)
+        self.assertLessEqual(StubFeed.peak, 8)
+
+    def test_max_expirations(self):
+        with BulkFetcher(self.provider) as fetcher:
+            results = list(fetcher.stream_universe(['AAPL'], max_expirations=2))
+        self.assertEqual(sorted(result.expiration for result in results), EXPIRATIONS[:2])
+
+    def test_rate_limiter(self):
+        now = [0.0]
+        sleeps = []
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+        limiter = RateLimiter(rate=10, burst=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(5):
+            limiter.acquire()
+        # Two requests from the burst, then one every 0.1s
+        self.assertAlmostEqual(now[0], 0.3)
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+
+if __name__ == '__main__':
+    unittest.main()
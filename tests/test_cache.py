@@ -0,0 +1,56 @@
+# tests/test_cache.py
+
+import unittest
+import numpy as np
+from src.pricing.binomial_model import binomial_option_price
+from src.pricing.cache import PricingCache
+
+class TestPricingCache(unittest.TestCase):
+    def test_repeated_price_hits_cache(self):
+        cache = PricingCache()
+        first = cache.price(100, 100, 1, 0.05, 0.2, 'call', True, 100)
+        second = cache.price(100, 100, 1, 0.05, 0.2, 'call', True, 100)
+        self.assertEqual(first, second)
+        self.assertAlmostEqual(first, binomial_option_price(100, 100, 1, 0.05, 0.2, 'call', True, 100), places=10)
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['size'], 1)
+
+    def test_lru_eviction(self):
+        cache = PricingCache(maxsize=2)
+        cache.price(100, 90, 1, 0.05, 0.2)
+        cache.price(100, 100, 1, 0.05, 0.2)
+        cache.price(100, 90, 1, 0.05, 0.2)   # refresh K=90
+        cache.price(100, 110, 1, 0.05, 0.2)  # evicts K=100
+        cache.price(100, 90, 1, 0.05, 0.2)
+        self.assertEqual(cache.stats()['hits'], 2)
+        cache.price(100, 100, 1, 0.05, 0.2)
+        self.assertEqual(cache.stats()['misses'], 4)
+
+    def test_quantization_tolerance(self):
+        cache = PricingCache(tolerance={'S': 0.01})
+        first = cache.price(100.001, 100, 1, 0.05, 0.2)
+        second = cache.price(99.999, 100, 1, 0.05, 0.2)
+        self.assertEqual(first, second)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_price_many_only_prices_misses(self):
+        cache = PricingCache()
+        cache.price(100, 100, 0.5, 0.05, 0.25, 'put')
+        K = np.array([95.0, 100.0, 105.0])
+        prices = cache.price_many(100, K, 0.5, 0.05, 0.25, 'put')
+        for i in range(len(K)):
+            self.assertAlmostEqual(prices[i], binomial_option_price(100, K[i], 0.5, 0.05, 0.25, 'put', True, 100), places=10)
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 3)
+
+    def test_clear_resets_stats(self):
+        cache = PricingCache()
+        cache.price(100, 100, 1, 0.05, 0.2)
+        cache.clear()
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'size': 0, 'maxsize': 4096})
+
+if __name__ == '__main__':
+    unittest.main()
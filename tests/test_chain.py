@@ -0,0 +1,84 @@
+# tests/test_chain.py
+
+import unittest
+import numpy as np
+import pandas as pd
+from src.data.chain import OptionChain, from_frames
+from src.pricing.batch import price_option_chain
+from src.pricing.implied_vol import chain_implied_volatility
+
+def make_frame():
+    return pd.DataFrame({
+        'contractSymbol': ['C110', 'C100', 'C105'],
+        'strike': [110.0, 100.0, 105.0],
+        'bid': [1.0, 5.0, 2.5],
+        'ask': [1.2, 5.4, 2.7],
+        'lastPrice': [1.1, 5.2, 2.6],
+        'volume': [10.0, np.nan, 30.0],
+        'openInterest': [100, 200, 300],
+        'impliedVolatility': [0.28, 0.3, 0.29],
+        'inTheMoney': [False, True, False],
+    })
+
+class TestOptionChain(unittest.TestCase):
+    def setUp(self):
+        self.frame = make_frame()
+        self.chain = OptionChain.from_frame(self.frame)
+
+    def test_sorted_contiguous_arrays(self):
+        np.testing.assert_array_equal(self.chain.strike, [100.0, 105.0, 110.0])
+        np.testing.assert_array_equal(self.chain.bid, [5.0, 2.5, 1.0])
+        self.assertEqual(self.chain.volume.dtype, np.int64)
+        np.testing.assert_array_equal(self.chain.volume, [0, 30, 10])
+        for field in ('strike', 'bid', 'ask', 'last', 'iv'):
+            array = getattr(self.chain, field)
+            self.assertEqual(array.dtype, np.float64)
+            self.assertTrue(array.flags['C_CONTIGUOUS'])
+        self.assertEqual(len(self.chain), 3)
+        self.assertEqual(self.chain.nbytes, 7 * 3 * 8)
+
+    def test_lookup(self):
+        self.assertEqual(self.chain.index_of(105.0), 1)
+        self.assertEqual(self.chain.get(110.0, 'lastPrice'), 1.1)
+        self.assertEqual(self.chain.get(110.0, 'last'), 1.1)
+        row = self.chain.row(100.0)
+        self.assertEqual(row['ask'], 5.4)
+        self.assertEqual(row['openInterest'], 200)
+        with self.assertRaises(KeyError):
+            self.chain.index_of(102.5)
+        with self.assertRaises(KeyError):
+            self.chain['contractSymbol']
+
+    def test_values_at(self):
+        np.testing.assert_array_equal(
+            self.chain.values_at([110.0, 102.5, 100.0, 200.0], 'iv'), [0.28, np.nan, 0.3, np.nan]
+        )
+
+    def test_zero_copy_views(self):
+        self.assertIs(self.chain['impliedVolatility'], self.chain.iv)
+        self.assertIs(np.asarray(self.chain['strike'], dtype=float), self.chain.strike)
+
+    def test_round_trip_frame(self):
+        frame = self.chain.to_frame()
+        self.assertEqual(list(frame.columns), ['strike', 'bid', 'ask', 'lastPrice', 'volume', 'openInterest', 'impliedVolatility'])
+        sorted_frame = self.frame.sort_values('strike', ignore_index=True)
+        np.testing.assert_array_equal(frame['lastPrice'], sorted_frame['lastPrice'])
+
+    def test_pricing_accepts_chain(self):
+        sorted_frame = self.frame.sort_values('strike', ignore_index=True)
+        np.testing.assert_allclose(
+            price_option_chain(self.chain, 104.0, 0.25, 0.01, 'call'),
+            price_option_chain(sorted_frame, 104.0, 0.25, 0.01, 'call'),
+        )
+        np.testing.assert_allclose(
+            chain_implied_volatility(self.chain, 104.0, 0.25, 0.01, 'call'),
+            chain_implied_volatility(sorted_frame, 104.0, 0.25, 0.01, 'call'),
+        )
+
+    def test_from_frames(self):
+        calls, puts = from_frames(self.frame, None)
+        self.assertIsInstance(calls, OptionChain)
+        self.assertIsNone(puts)
+
+if __name__ == '__main__':
+    unittest.main()
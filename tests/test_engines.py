@@ -0,0 +1,56 @@
+# tests/test_engines.py
+
+import unittest
+import numpy as np
+from src.pricing.barone_adesi_whaley import barone_adesi_whaley_price, _critical_put_price
+from src.pricing.binomial_model import binomial_option_price
+from src.pricing.black_scholes import black_scholes_price
+from src.pricing.engines import option_price
+
+class TestPricingEngines(unittest.TestCase):
+    def test_baw_put_close_to_binomial(self):
+        # BAW is typically within a few cents of the converged tree
+        for K in (90, 100, 110):
+            approx = barone_adesi_whaley_price(100, K, 1, 0.05, 0.2, 'put')
+            tree = binomial_option_price(100, K, 1, 0.05, 0.2, 'put', True, 1000)
+            self.assertAlmostEqual(float(approx), tree, delta=0.1)
+
+    def test_baw_put_below_critical_price_is_intrinsic(self):
+        price = barone_adesi_whaley_price(50, 100, 1, 0.05, 0.2, 'put')
+        self.assertAlmostEqual(float(price), 50.0, places=10)
+
+    def test_baw_critical_price_converges_from_seed(self):
+        T = np.array([0.02, 0.25, 1.0, 5.0])
+        sigma = np.array([[0.1], [0.25], [0.8]])
+        M = 2 * 0.05 / sigma**2
+        q1 = (-(M - 1) - np.sqrt((M - 1)**2 + 4 * M / (1 - np.exp(-0.05 * T)))) / 2
+        S_star = _critical_put_price(100.0, T, 0.05, sigma, q1)
+        self.assertTrue(np.all((S_star > 0) & (S_star < 100)))
+        # The seed already sits between the perpetual boundary and the
+        # strike, so a few Newton steps reach the tolerance
+        np.testing.assert_allclose(_critical_put_price(100.0, T, 0.05, sigma, q1, max_iter=4), S_star, rtol=1e-6)
+
+    def test_baw_call_equals_black_scholes(self):
+        baw = barone_adesi_whaley_price(100, 100, 1, 0.05, 0.2, 'call')
+        bs = black_scholes_price(100, 100, 1, 0.05, 0.2, 'call')
+        self.assertAlmostEqual(float(baw), float(bs), places=12)
+
+    def test_engines_share_signature(self):
+        S = np.linspace(80, 120, 5)
+        for engine in ('binomial', 'baw', 'black_scholes'):
+            prices = option_price(S, 100, 0.5, 0.05, 0.25, 'call', True, 200, engine=engine)
+            self.assertEqual(prices.shape, S.shape)
+            self.assertTrue(np.all(np.diff(prices) > 0))
+
+    def test_black_scholes_engine_rejects_american_puts(self):
+        with self.assertRaises(ValueError):
+            option_price(100, 100, 1, 0.05, 0.2, 'put', True, engine='black_scholes')
+        european = option_price(100, 100, 1, 0.05, 0.2, 'put', False, engine='black_scholes')
+        self.assertAlmostEqual(float(european), 5.5735, places=4)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            option_price(100, 100, 1, 0.05, 0.2, engine='invalid')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# tests/test_finite_difference.py
+
+import unittest
+import numpy as np
+from src import instrumentation
+from src.pricing.batch import batch_option_price
+from src.pricing.binomial_model import binomial_option_price
+from src.pricing.black_scholes import black_scholes_price
+from src.pricing.engines import option_price
+from src.pricing.finite_difference import (
+    MAX_SOLVES, finite_difference_greeks, finite_difference_grid, finite_difference_option_price,
+)
+from src.pricing.greeks import batch_greeks
+
+class TestFiniteDifference(unittest.TestCase):
+    def test_european_matches_black_scholes(self):
+        S = np.linspace(60, 140, 41)
+        for option_type in ('call', 'put'):
+            prices = finite_difference_option_price(S, 100, 0.5, 0.03, 0.25, option_type, False, 200)
+            np.testing.assert_allclose(prices, black_scholes_price(S, 100, 0.5, 0.03, 0.25, option_type), atol=1e-3)
+
+    def test_american_put_matches_reference(self):
+        K = np.array([90.0, 100.0, 120.0])
+        prices = finite_difference_option_price(100, K, 1.0, 0.05, 0.3, 'put', True, 200)
+        for i, strike in enumerate(K):
+            expected = binomial_option_price(100, strike, 1.0, 0.05, 0.3, 'put', True, 5000, method='bbsr')
+            self.assertAlmostEqual(prices[i], expected, delta=2e-3)
+        # Deep in the money the put is worth exactly its exercise value
+        self.assertAlmostEqual(float(finite_difference_option_price(50, 100, 1.0, 0.05, 0.3, 'put')), 50.0, places=4)
+
+    def test_greeks_match_lattice(self):
+        K = np.array([90.0, 100.0, 110.0])
+        greeks = finite_difference_greeks(100, K, 0.5, 0.02, 0.25, 'put', True, 200)
+        expected = batch_greeks(100, K, 0.5, 0.02, 0.25, 'put', True, 1000)
+        np.testing.assert_allclose(greeks['delta'], expected['delta'], atol=1e-3)
+        np.testing.assert_allclose(greeks['gamma'], expected['gamma'], atol=1e-4)
+
+    def test_grid(self):
+        grid = finite_difference_grid(100, 0.5, 0.01, 0.25, 'call', False, 100)
+        self.assertEqual(set(grid), {'S', 'price', 'delta', 'gamma'})
+        self.assertTrue(np.all(np.diff(grid['S']) > 0))
+        self.assertEqual(grid['S'][grid['S'].size // 2], 100)
+        inside = (grid['S'] > 50) & (grid['S'] < 200)
+        expected = black_scholes_price(grid['S'][inside], 100, 0.5, 0.01, 0.25, 'call')
+        np.testing.assert_allclose(grid['price'][inside], expected, atol=5e-3)
+        self.assertTrue(np.all(grid['gamma'][inside] > 0))
+
+    def test_one_solve_per_distinct_contract(self):
+        instrumentation.enable()
+        instrumentation.registry.reset()
+        try:
+            # A spot range and a strip of strikes share one moneyness grid
+            option_price(np.linspace(50, 150, 100), 100, 0.5, 0.01, 0.25, 'call', True, 100, 'finite_difference')
+            finite_difference_greeks(100, [90, 100, 110], 0.5, 0.01, [0.25, 0.25, 0.3], 'put')
+            counters = instrumentation.registry.snapshot()['counters']
+        finally:
+            instrumentation.registry.reset()
+            instrumentation.disable()
+        self.assertEqual(counters['pricing.finite_difference_solves'], 3)
+        self.assertNotIn('pricing.closed_form_prices', counters)
+
+    def test_mixed_volatilities_use_lattice(self):
+        # Per-contract volatilities would need one solve per contract
+        K = np.linspace(80, 120, 200)
+        sigma = np.linspace(0.15, 0.45, K.size)
+        instrumentation.enable()
+        instrumentation.registry.reset()
+        try:
+            prices = option_price(100, K, 0.5, 0.01, sigma, 'put', True, 100, 'finite_difference')
+            counters = instrumentation.registry.snapshot()['counters']
+        finally:
+            instrumentation.registry.reset()
+            instrumentation.disable()
+        np.testing.assert_allclose(prices, batch_option_price(100, K, 0.5, 0.01, sigma, 'put', True, 100))
+        self.assertNotIn('pricing.finite_difference_solves', counters)
+        self.assertEqual(counters['pricing.finite_difference_fallbacks'], K.size)
+        with self.assertRaises(ValueError):
+            finite_difference_greeks(100, K, 0.5, 0.01, sigma, 'put')
+        # Up to MAX_SOLVES distinct volatilities are still solved on the grid
+        sigma = np.repeat(np.linspace(0.15, 0.45, MAX_SOLVES), 25)
+        greeks = finite_difference_greeks(100, K, 0.5, 0.01, sigma, 'put')
+        np.testing.assert_allclose(greeks['price'], batch_option_price(100, K, 0.5, 0.01, sigma, 'put', True, 400),
+                                   atol=2e-2)
+
+    def test_broadcasting(self):
+        prices = finite_difference_option_price([[90.0], [110.0]], 100, 0.5, 0.01, 0.25, ['call', 'put'], False, 50)
+        self.assertEqual(prices.shape, (2, 2))
+        self.assertAlmostEqual(prices[1, 0], float(finite_difference_option_price(110, 100, 0.5, 0.01, 0.25, 'call', False, 50)), places=10)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            finite_difference_option_price(100, 100, 0.5, 0.01, 0.25, N=0)
+        with self.assertRaises(ValueError):
+            finite_difference_grid(100, 0.5, 0.01, 0.25, M=2)
+        with self.assertRaises(ValueError):
+            finite_difference_grid(100, 0.5, 0.01, 0.25, 'straddle')
+
+if __name__ == '__main__':
+    unittest.main()
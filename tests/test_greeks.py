@@ -0,0 +1,43 @@
+# tests/test_greeks.py
+
+import unittest
+import numpy as np
+from src.pricing.greeks import batch_greeks, binomial_greeks
+from src.pricing.binomial_model import binomial_option_price
+
+class TestGreeks(unittest.TestCase):
+    def test_european_call_greeks_match_black_scholes(self):
+        # Black-Scholes Greeks for S=K=100, T=1, r=5%, sigma=20%
+        greeks = binomial_greeks(100, 100, 1, 0.05, 0.2, 'call', False, 500)
+        self.assertAlmostEqual(greeks['delta'], 0.6368, places=2)
+        self.assertAlmostEqual(greeks['gamma'], 0.01876, places=3)
+        self.assertAlmostEqual(greeks['theta'], -6.414, delta=0.05)
+        self.assertAlmostEqual(greeks['vega'], 37.52, delta=0.2)
+        self.assertAlmostEqual(greeks['rho'], 53.23, delta=0.2)
+
+    def test_price_matches_binomial_option_price(self):
+        greeks = binomial_greeks(95, 100, 0.5, 0.03, 0.3, 'put', True, 200)
+        expected = binomial_option_price(95, 100, 0.5, 0.03, 0.3, 'put', True, 200)
+        self.assertAlmostEqual(greeks['price'], expected, places=10)
+
+    def test_put_delta_sign(self):
+        greeks = binomial_greeks(100, 100, 1, 0.05, 0.2, 'put', True, 200)
+        self.assertLess(greeks['delta'], 0)
+        self.assertGreater(greeks['gamma'], 0)
+        self.assertLess(greeks['rho'], 0)
+
+    def test_batch_matches_single(self):
+        K = np.array([90.0, 100.0, 110.0])
+        sigma = np.array([0.25, 0.2, 0.3])
+        batch = batch_greeks(100, K, 0.75, 0.04, sigma, ['call', 'put', 'put'], True, 100, block_size=2)
+        for i, option_type in enumerate(['call', 'put', 'put']):
+            single = binomial_greeks(100, K[i], 0.75, 0.04, sigma[i], option_type, True, 100)
+            for name, value in single.items():
+                self.assertAlmostEqual(batch[name][i], value, places=8)
+
+    def test_requires_two_steps(self):
+        with self.assertRaises(ValueError):
+            binomial_greeks(100, 100, 1, 0.05, 0.2, 'call', True, 1)
+
+if __name__ == '__main__':
+    unittest.main()
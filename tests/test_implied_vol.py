@@ -0,0 +1,44 @@
+# tests/test_implied_vol.py
+
+import unittest
+import numpy as np
+import pandas as pd
+from src.pricing.batch import batch_option_price
+from src.pricing.implied_vol import implied_volatility, chain_implied_volatility
+
+class TestImpliedVolatility(unittest.TestCase):
+    def test_recovers_american_put_volatility(self):
+        price = batch_option_price(100, 100, 1, 0.05, 0.2, 'put', True, 100)
+        sigma = implied_volatility(price, 100, 100, 1, 0.05, 'put', True, 100)
+        self.assertAlmostEqual(float(sigma), 0.2, places=6)
+
+    def test_recovers_chain_volatilities(self):
+        K = np.linspace(60, 160, 21)
+        sigma = np.linspace(0.4, 0.2, 21)
+        option_type = np.where(K < 100, 'put', 'call')
+        prices = batch_option_price(100, K, 0.5, 0.03, sigma, option_type, True, 100)
+        solved = implied_volatility(prices, 100, K, 0.5, 0.03, option_type, True, 100, tol=1e-8)
+        np.testing.assert_allclose(solved, sigma, atol=1e-4)
+
+    def test_deep_in_the_money_put_converges(self):
+        price = batch_option_price(100, 135, 1, 0.05, 0.4, 'put', True, 100)
+        sigma = implied_volatility(price, 100, 135, 1, 0.05, 'put', True, 100, tol=1e-8)
+        self.assertAlmostEqual(float(sigma), 0.4, places=4)
+
+    def test_price_below_intrinsic_is_nan(self):
+        sigma = implied_volatility(5.0, 100, 90, 1, 0.05, 'call', True, 100)
+        self.assertTrue(np.isnan(sigma))
+
+    def test_chain_mid_price(self):
+        model = batch_option_price(100, [95.0, 105.0], 0.25, 0.05, 0.25, 'call', True, 100)
+        chain = pd.DataFrame({
+            'strike': [95.0, 105.0],
+            'bid': model - 0.05,
+            'ask': model + 0.05,
+            'lastPrice': [0.0, 0.0],
+        })
+        sigma = chain_implied_volatility(chain, 100, 0.25, 0.05, 'call', tol=1e-8)
+        np.testing.assert_allclose(sigma, 0.25, atol=1e-4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# tests/test_instrumentation.py
+
+import json
+import unittest
+from src import instrumentation
+from src.instrumentation import Histogram, MetricsRegistry, SIZE_BUCKETS
+from src.pricing.batch import batch_option_price
+from src.pricing.cache import PricingCache
+from src.pricing.engines import option_price
+
+class TestHistogram(unittest.TestCase):
+    def test_summary(self):
+        histogram = Histogram(bounds=(1, 2, 5), unit='')
+        for value in (0.5, 1.5, 1.5, 4.0, 10.0):
+            histogram.observe(value)
+        summary = histogram.to_dict()
+        self.assertEqual(summary['count'], 5)
+        self.assertAlmostEqual(summary['sum'], 17.5)
+        self.assertEqual(summary['buckets'], {'1': 1, '2': 2, '5': 1, '+Inf': 1})
+        self.assertEqual(summary['last'], 10.0)
+        self.assertTrue(1 <= histogram.quantile(0.5) <= 2)
+        self.assertEqual(histogram.quantile(1.0), 10.0)
+
+class TestRegistry(unittest.TestCase):
+    def test_exports(self):
+        registry = MetricsRegistry()
+        registry.increment('pricing.cache_hits', 3)
+        registry.observe('pricing.batch_option_price', 0.002)
+        registry.observe('pricing.batch_size', 250, SIZE_BUCKETS, unit='')
+
+        snapshot = json.loads(registry.to_json())
+        self.assertEqual(snapshot['counters'], {'pricing.cache_hits': 3})
+        self.assertEqual(snapshot['histograms']['pricing.batch_option_price']['count'], 1)
+
+        text = registry.to_prometheus()
+        self.assertIn('# TYPE options_pricing_cache_hits_total counter\noptions_pricing_cache_hits_total 3', text)
+        self.assertIn('options_pricing_batch_option_price_seconds_bucket{le="0.005"} 1', text)
+        self.assertIn('options_pricing_batch_option_price_seconds_bucket{le="0.001"} 0', text)
+        self.assertIn('options_pricing_batch_size_bucket{le="+Inf"} 1', text)
+        self.assertIn('options_pricing_batch_size_count 1', text)
+
+        registry.reset()
+        self.assertEqual(registry.snapshot(), {'counters': {}, 'histograms': {}})
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.registry.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.registry.reset()
+
+    def test_disabled_records_nothing(self):
+        instrumentation.disable()
+        batch_option_price(100, [90, 100, 110], 0.5, 0.01, 0.2, N=20)
+        with instrumentation.timer('app.block'):
+            pass
+        instrumentation.increment('data.fetches')
+        self.assertEqual(instrumentation.registry.snapshot(), {'counters': {}, 'histograms': {}})
+
+    def test_pricing_is_instrumented(self):
+        instrumentation.enable()
+        batch_option_price(100, [90, 100, 110], 0.5, 0.01, 0.2, N=20)
+        option_price(100, [90, 100], 0.5, 0.01, 0.2, engine='baw')
+        cache = PricingCache()
+        cache.price_many(100, [90, 100], 0.5, 0.01, 0.2, N=20)
+        cache.price_many(100, [90, 100, 110], 0.5, 0.01, 0.2, N=20)
+
+        snapshot = instrumentation.registry.snapshot()
+        self.assertEqual(snapshot['histograms']['pricing.batch_option_price']['count'], 3)
+        self.assertEqual(snapshot['histograms']['pricing.option_price']['count'], 1)
+        self.assertEqual(snapshot['counters']['pricing.lattice_prices'], 6)
+        self.assertEqual(snapshot['counters']['pricing.closed_form_prices'], 2)
+        self.assertEqual(snapshot['counters']['pricing.cache_hits'], 2)
+        self.assertEqual(snapshot['counters']['pricing.cache_misses'], 3)
+
+    def test_timer_and_decorator(self):
+        instrumentation.enable()
+
+        @instrumentation.timed('calculations.example')
+        def example(x):
+            """Docstring kept."""
+            return 2 * x
+
+        self.assertEqual(example(3), 6)
+        self.assertEqual(example.__doc__, "Docstring kept.")
+        with self.assertRaises(ZeroDivisionError):
+            with instrumentation.timer('app.block'):
+                1 / 0
+        histograms = instrumentation.registry.snapshot()['histograms']
+        self.assertEqual(histograms['calculations.example']['count'], 1)
+        self.assertEqual(histograms['app.block']['count'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
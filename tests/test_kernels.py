@@ -0,0 +1,46 @@
+# tests/test_kernels.py
+
+import unittest
+import numpy as np
+from src.pricing import kernels
+from src.pricing.batch import batch_option_price
+from src.pricing.binomial_model import binomial_option_price
+
+class TestBackendSelection(unittest.TestCase):
+    def test_auto_backend(self):
+        expected = 'numba' if kernels.NUMBA_AVAILABLE else 'numpy'
+        self.assertEqual(kernels.resolve_backend('auto'), expected)
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            binomial_option_price(100, 100, 1, 0.05, 0.2, backend='invalid')
+
+    @unittest.skipIf(kernels.NUMBA_AVAILABLE, "numba is installed")
+    def test_numba_backend_requires_numba(self):
+        with self.assertRaises(ImportError):
+            binomial_option_price(100, 100, 1, 0.05, 0.2, backend='numba')
+        self.assertFalse(kernels.warm_up())
+
+@unittest.skipUnless(kernels.NUMBA_AVAILABLE, "numba is not installed")
+class TestCompiledKernel(unittest.TestCase):
+    def setUp(self):
+        self.assertTrue(kernels.warm_up())
+
+    def test_matches_numpy_backend(self):
+        for method in ('crr', 'bbs', 'bbsr', 'leisen_reimer'):
+            for option_type in ('call', 'put'):
+                for american in (True, False):
+                    expected = binomial_option_price(95, 100, 0.75, 0.04, 0.3, option_type, american, 101, method)
+                    price = binomial_option_price(95, 100, 0.75, 0.04, 0.3, option_type, american, 101, method, backend='numba')
+                    self.assertAlmostEqual(price, expected, places=10)
+
+    def test_batch_with_mixed_contracts(self):
+        K = np.linspace(80, 120, 9)
+        option_type = np.where(K < 100, 'put', 'call')
+        american = K > 90
+        expected = batch_option_price(100, K, 0.5, 0.05, 0.25, option_type, american, 80)
+        prices = batch_option_price(100, K, 0.5, 0.05, 0.25, option_type, american, 80, backend='numba')
+        np.testing.assert_allclose(prices, expected, rtol=0, atol=1e-10)
+
+if __name__ == '__main__':
+    unittest.main()
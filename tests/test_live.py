@@ -0,0 +1,112 @@
+# tests/test_live.py
+
+import asyncio
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.calculations.live import LiveBook, LivePosition, stream_updates
+from src.data.ticks import Tick, read_ticks, replay_ticks, write_ticks
+from src.pricing.greeks import batch_greeks
+
+START = 1_700_000_000.0  # 2023-11-14
+
+def make_book(**kwargs):
+    positions = [
+        LivePosition('AAPL_C150', 'AAPL', 'call', 150, '2024-01-19', quantity=2, entry_price=5.0, implied_volatility=0.25),
+        LivePosition('AAPL_P140', 'AAPL', 'put', 140, '2024-01-19', side='short', entry_price=2.0, implied_volatility=0.3),
+        LivePosition('MSFT_C350', 'MSFT', 'call', 350, '2024-01-19', entry_price=8.0, implied_volatility=0.22),
+    ]
+    return LiveBook(positions, **kwargs)
+
+async def collect(updates):
+    return [update async for update in updates]
+
+class TestLiveBook(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'ticks.jsonl')
+        self.ticks = [
+            Tick(START, 'spot', 'AAPL', price=150.0),
+            Tick(START + 1, 'spot', 'MSFT', price=350.0),
+            Tick(START + 2, 'spot', 'AAPL', price=150.05),  # below threshold
+            Tick(START + 3, 'quote', 'AAPL', contract='AAPL_P140', bid=1.9, ask=2.1, iv=0.32),
+            Tick(START + 4, 'spot', 'AAPL', price=152.0),
+        ]
+        write_ticks(self.path, self.ticks)
+
+    def tearDown(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+    def test_replay_file_round_trip(self):
+        self.assertEqual(list(read_ticks(self.path)), self.ticks)
+        with self.assertRaises(ValueError):
+            Tick(START, 'trade', 'AAPL')
+
+    def test_reprices_only_moved_positions(self):
+        updates = asyncio.run(collect(stream_updates(make_book(), replay_ticks(self.path))))
+        changed = [sorted(update.changes) for update in updates]
+        self.assertEqual(changed, [
+            ['AAPL_C150', 'AAPL_P140'],
+            ['MSFT_C350'],
+            ['AAPL_P140'],
+            ['AAPL_C150', 'AAPL_P140'],
+        ])
+
+    def test_values_match_batch_greeks(self):
+        book = make_book()
+        for tick in self.ticks:
+            book.apply(tick)
+        changes = book.reprice()
+        T = (1705622400.0 - (START + 4)) / (365 * 24 * 3600)
+        reference = batch_greeks(152.0, 150, T, 0.01, 0.25, 'call', True, 50)
+        call = changes['AAPL_C150']
+        self.assertAlmostEqual(call['value'], float(reference['price']))
+        self.assertAlmostEqual(call['pnl'], 200 * (float(reference['price']) - 5.0))
+        self.assertAlmostEqual(call['delta'], 200 * float(reference['delta']))
+        totals = book.totals()
+        self.assertAlmostEqual(totals['pnl'], sum(change['pnl'] for change in changes.values()))
+
+    def test_pnl_change_sums_to_pnl(self):
+        updates = asyncio.run(collect(stream_updates(make_book(), replay_ticks(self.path))))
+        put_changes = [update.changes['AAPL_P140']['pnl_change'] for update in updates if 'AAPL_P140' in update.changes]
+        self.assertAlmostEqual(sum(put_changes), updates[-1].changes['AAPL_P140']['pnl'])
+
+    def test_time_decay_triggers_repricing(self):
+        book = make_book(time_threshold=3600)
+        book.apply(Tick(START, 'spot', 'AAPL', price=150.0))
+        self.assertEqual(len(book.reprice()), 2)
+        book.apply(Tick(START + 60, 'spot', 'AAPL', price=150.0))
+        self.assertEqual(book.reprice(), {})
+        book.apply(Tick(START + 7200, 'spot', 'AAPL', price=150.0))
+        self.assertEqual(len(book.reprice()), 2)
+
+    def test_bursts_are_coalesced_and_latency_recorded(self):
+        ticks = [Tick(START + i, 'spot', 'AAPL', price=150.0 + i) for i in range(200)]
+
+        async def burst():
+            for tick in ticks:
+                yield tick
+
+        async def slow_consumer():
+            updates = []
+            async for update in stream_updates(make_book(), burst()):
+                updates.append(update)
+                await asyncio.sleep(0.001)
+            return updates
+
+        book_updates = asyncio.run(slow_consumer())
+        self.assertLess(len(book_updates), len(ticks))
+        self.assertEqual(sum(update.ticks for update in book_updates), len(ticks))
+        self.assertTrue(np.all([update.latency >= 0 for update in book_updates]))
+
+        book = make_book()
+        asyncio.run(collect(stream_updates(book, replay_ticks(self.path))))
+        summary = book.latency.summary()
+        self.assertEqual(summary['count'], 5)
+        self.assertLessEqual(summary['p50'], summary['max'])
+
+if __name__ == '__main__':
+    unittest.main()
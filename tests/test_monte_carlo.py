@@ -0,0 +1,76 @@
+# tests/test_monte_carlo.py
+
+import unittest
+import numpy as np
+from scipy.stats import norm
+from src.calculations.monte_carlo import _Histogram, simulate_pnl
+from src.calculations.strategy import OptionLeg, Strategy, iron_condor
+from src.pricing.black_scholes import black_scholes_price
+
+class TestMonteCarlo(unittest.TestCase):
+    def setUp(self):
+        self.call = Strategy([OptionLeg('call', 100, 0.25, premium=5.0, implied_volatility=0.25)])
+
+    def test_long_call_matches_lognormal(self):
+        result = simulate_pnl(self.call, 100, n_paths=200_000, seed=7)
+        # Probability of finishing above the breakeven, as in long_call_calculator
+        d2 = (np.log(100 / 105) + (0.01 - 0.5 * 0.25**2) * 0.25) / (0.25 * np.sqrt(0.25))
+        self.assertAlmostEqual(result['pop'], norm.cdf(d2), delta=0.005)
+        # Expected payoff is the undiscounted Black-Scholes value
+        expected = (black_scholes_price(100, 100, 0.25, 0.01, 0.25) * np.exp(0.01 * 0.25) - 5.0) * 100
+        self.assertAlmostEqual(result['expected_pnl'], expected, delta=4 * result['stderr'])
+        self.assertAlmostEqual(result['var'], 500.0, places=3)
+        self.assertAlmostEqual(result['cvar'], 500.0, places=3)
+
+    def test_reproducible_with_seed(self):
+        first = simulate_pnl(self.call, 100, n_paths=10_000, seed=3)
+        second = simulate_pnl(self.call, 100, n_paths=10_000, seed=3)
+        self.assertEqual(first, second)
+
+    def test_control_variate_reduces_error(self):
+        plain = simulate_pnl(self.call, 100, n_paths=50_000, seed=1, antithetic=False, control_variate=False)
+        controlled = simulate_pnl(self.call, 100, n_paths=50_000, seed=1, antithetic=False)
+        self.assertLess(controlled['stderr'], plain['stderr'] / 2)
+
+    def test_chunking_covers_all_paths(self):
+        result = simulate_pnl(self.call, 100, n_paths=10_001, chunk_size=1_000, seed=2)
+        self.assertEqual(result['n_paths'], 10_002)
+        percentiles = list(result['percentiles'].values())
+        self.assertTrue(np.all(np.diff(percentiles) >= 0))
+
+    def test_exit_rules_bound_pnl(self):
+        result = simulate_pnl(self.call, 100, n_paths=20_000, seed=4, profit_target=300, stop_loss=250, steps=20)
+        self.assertGreater(result['target_hit_rate'], 0)
+        self.assertGreater(result['stop_hit_rate'], 0)
+        self.assertLessEqual(result['target_hit_rate'] + result['stop_hit_rate'], 1)
+        # Exits are checked at discrete dates, so the P&L overshoots a little
+        self.assertGreater(result['percentiles'][1], -500)
+        self.assertLess(result['percentiles'][99], 1000)
+
+    def test_condor_before_expiry(self):
+        condor = iron_condor(85, 90, 110, 115, 0.25, premiums=(0.5, 1.5, 1.5, 0.5), implied_volatility=0.25)
+        result = simulate_pnl(condor, 100, n_paths=20_000, horizon=0.1, seed=5)
+        self.assertLess(result['var'], 300)
+        self.assertTrue(0 < result['pop'] < 1)
+
+    def test_histogram_matches_exact_quantiles(self):
+        rng = np.random.default_rng(0)
+        # A point mass at the lowest P&L, as for a long option expiring worthless
+        values = np.concatenate([np.full(5_000, -500.0), -500 + rng.lognormal(5, 1, 95_000)])
+        histogram = _Histogram(-500.0, 3_000.0)
+        for chunk in np.array_split(rng.permutation(values), 7):
+            histogram.add(chunk)
+        for q in (0.01, 0.05, 0.1, 0.5, 0.9, 0.99):
+            self.assertAlmostEqual(histogram.quantile(q), np.quantile(values, q), delta=0.5)
+        self.assertEqual(histogram.quantile(0.04), -500.0)
+        threshold = np.quantile(values, 0.2)
+        self.assertAlmostEqual(histogram.tail_mean(threshold), values[values <= threshold].mean(), delta=0.5)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            simulate_pnl(self.call, 100, horizon=0)
+        with self.assertRaises(ValueError):
+            simulate_pnl(self.call, 100, confidence=1.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+# tests/test_parallel.py
+
+import unittest
+import numpy as np
+from src.pricing.batch import batch_option_price
+from src.pricing.greeks import batch_greeks
+from src.pricing.parallel import ParallelPricer, parallel_option_price
+
+class TestParallelPricing(unittest.TestCase):
+    def setUp(self):
+        self.K = np.linspace(80, 120, 25)
+        self.sigma = np.linspace(0.15, 0.45, 25)
+        self.option_type = np.where(self.K < 100, 'put', 'call')
+
+    def test_prices_match_serial_in_input_order(self):
+        expected = batch_option_price(100, self.K, 0.5, 0.05, self.sigma, self.option_type, True, 50)
+        prices = parallel_option_price(100, self.K, 0.5, 0.05, self.sigma, self.option_type, True, 50,
+                                       max_workers=2, chunk_size=7)
+        np.testing.assert_allclose(prices, expected, rtol=0, atol=1e-12)
+
+    def test_greeks_are_reassembled(self):
+        expected = batch_greeks(100, self.K, 0.5, 0.05, self.sigma, self.option_type, True, 50)
+        with ParallelPricer(max_workers=2, chunk_size=10) as pricer:
+            greeks = pricer.greeks(100, self.K, 0.5, 0.05, self.sigma, self.option_type, True, 50)
+        for name, values in expected.items():
+            np.testing.assert_allclose(greeks[name], values, rtol=0, atol=1e-10)
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            ParallelPricer(chunk_size=0)
+
+if __name__ == '__main__':
+    unittest.main()
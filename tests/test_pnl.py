@@ -1,7 +1,9 @@
 # tests/test_pnl.py
 
 import unittest
-from src.calculations.pnl import calculate_pnl
+import numpy as np
+from src.calculations.pnl import calculate_pnl, long_call_calculator, pnl_surface
+from src.pricing.black_scholes import black_scholes_price
 
 class TestPNL(unittest.TestCase):
     def test_long_position_profit(self):
@@ -48,5 +50,23 @@ class TestPNL(unittest.TestCase):
         with self.assertRaises(ValueError):
             calculate_pnl(position, initial_premium, current_premium, quantity)
 
+    def test_pnl_surface_at_expiry_matches_long_call_calculator(self):
+        prices = np.linspace(80, 120, 9)
+        surface = pnl_surface(prices, [0], 100, 3.4, 2)
+        self.assertEqual(surface.shape, (1, 9))
+        for price, pnl in zip(prices, surface[0]):
+            expected = long_call_calculator(3.4, 2, 100, price, 0.2)['pnl']
+            self.assertAlmostEqual(pnl, expected, places=8)
+
+    def test_pnl_surface_before_expiry_uses_model_value(self):
+        surface = pnl_surface([90.0, 110.0], [73, 0], 100, 2.0, 1, 0.25, 0.03, 'call', 'short', american=False, engine='black_scholes')
+        value = black_scholes_price(np.array([90.0, 110.0]), 100, 0.2, 0.03, 0.25, 'call')
+        np.testing.assert_allclose(surface[0], (2.0 - value) * 100)
+        np.testing.assert_allclose(surface[1], [200.0, -800.0])
+
+    def test_pnl_surface_invalid_position(self):
+        with self.assertRaises(ValueError):
+            pnl_surface([100.0], [0], 100, 2.0, position='invalid')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,87 @@
+# tests/test_providers.py
+
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from src.data.providers import MarketDataProvider, ReplayProvider, YFinanceProvider, get_provider
+from src.data.store import MarketDataStore
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+class TestProviders(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        recorder = MarketDataStore(self.root, offline=True)
+        self.start = 1_700_000_000.0
+        for minute, price in enumerate([100.0, 101.0, 99.5]):
+            recorder.save('spot', 'AAPL', price, fetched_at=self.start + 60 * minute)
+        recorder.save('expirations', 'AAPL', ('2024-12-20',), fetched_at=self.start)
+        chain = pd.DataFrame({'strike': [100.0], 'bid': [5.0], 'ask': [5.2], 'lastPrice': [5.1]})
+        recorder.save('chain', 'AAPL', (chain, chain), expiration='2024-12-20', fetched_at=self.start)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_incomplete_provider_fails_on_creation(self):
+        class SpotOnly(MarketDataProvider):
+            def get_spot(self, symbol):
+                return 100.0
+
+        with self.assertRaises(TypeError):
+            SpotOnly()
+
+    def test_replay_frozen_clock(self):
+        provider = ReplayProvider(self.root, speed=0)
+        self.assertEqual(provider.now(), self.start)
+        self.assertEqual(provider.get_spot('AAPL'), 100.0)
+        provider.advance(90)
+        self.assertEqual(provider.get_spot('AAPL'), 101.0)
+        provider.seek(self.start + 600)
+        self.assertEqual(provider.get_spot('AAPL'), 99.5)
+        calls, puts = provider.get_option_chain('AAPL', '2024-12-20')
+        self.assertEqual(calls['strike'].tolist(), [100.0])
+
+    def test_replay_speed(self):
+        clock = FakeClock()
+        provider = ReplayProvider(self.root, speed=60, clock=clock)
+        self.assertEqual(provider.get_spot('AAPL'), 100.0)
+        clock.now += 1.5  # 90 replay seconds
+        self.assertEqual(provider.get_spot('AAPL'), 101.0)
+
+    def test_replay_missing_data(self):
+        provider = ReplayProvider(self.root, speed=0, start=self.start - 1)
+        with self.assertRaises(LookupError):
+            provider.get_spot('AAPL')
+        with self.assertRaises(LookupError):
+            provider.get_expirations('MSFT')
+        with self.assertRaises(ValueError):
+            ReplayProvider(self.root, speed=-1)
+
+    def test_store_in_front_of_replay(self):
+        provider = ReplayProvider(self.root, speed=0)
+        cache_root = tempfile.mkdtemp()
+        try:
+            store = MarketDataStore(cache_root, provider=provider)
+            self.assertEqual(store.get_expirations('AAPL'), ('2024-12-20',))
+            self.assertEqual(store.get_spot('MSFT'), None)
+        finally:
+            shutil.rmtree(cache_root)
+
+    @patch('src.data.data_fetch.yf.Ticker')
+    def test_yfinance_provider(self, mock_ticker):
+        mock_ticker.return_value.options = ('2024-12-20', '2025-01-17')
+        provider = get_provider('yfinance')
+        self.assertIsInstance(provider, YFinanceProvider)
+        self.assertEqual(provider.get_expirations('AAPL'), ('2024-12-20', '2025-01-17'))
+        with self.assertRaises(ValueError):
+            get_provider('bloomberg')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# tests/test_revalue.py
+
+import os
+import tempfile
+import unittest
+from datetime import date
+import numpy as np
+import pandas as pd
+from benchmarks.fixtures import FIXTURE_DIR, VALUATION_DATE
+from src.calculations.revalue import FileMarket, MarketSnapshot, StoreMarket, main, revalue_chunk, revalue_file
+from src.data.store import MarketDataStore
+from src.pricing.binomial_model import binomial_option_price
+
+TODAY = date(2024, 1, 2)
+
+def make_positions():
+    return pd.DataFrame({
+        'symbol': ['abc', 'ABC', 'ABC', 'XYZ', 'ABC'],
+        'option_type': ['call', 'put', 'call', 'call', 'put'],
+        'strike': [100.0, 95.0, 105.0, 50.0, 110.0],
+        'expiration': ['2024-07-01', '2024-07-01', '2024-07-01', '2024-07-01', '2023-12-15'],
+        'quantity': [2, 1, 3, 1, 1],
+        'side': ['long', 'short', 'long', 'long', 'long'],
+        'entry_price': [5.0, 3.0, 2.0, 1.0, 4.0],
+        'implied_volatility': [np.nan, np.nan, 0.3, np.nan, np.nan],
+    })
+
+def write_snapshot(path):
+    pd.DataFrame({
+        'symbol': ['ABC', 'ABC', 'ABC'],
+        'spot': [102.0, np.nan, np.nan],
+        'expiration': [np.nan, '2024-07-01', '2024-07-01'],
+        'option_type': [np.nan, 'call', 'put'],
+        'strike': [np.nan, 100.0, 95.0],
+        'implied_volatility': [np.nan, 0.25, 0.28],
+    }).to_csv(path, index=False)
+
+class TestRevalue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.snapshot = os.path.join(self.tmp.name, 'snapshot.csv')
+        write_snapshot(self.snapshot)
+        self.market = FileMarket(self.snapshot)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_revalue_chunk(self):
+        results = revalue_chunk(make_positions(), self.market, TODAY, N=50)
+        np.testing.assert_allclose(results['sigma'], [0.25, 0.28, 0.3, np.nan, np.nan])
+        np.testing.assert_allclose(results['spot'], [102.0, 102.0, 102.0, np.nan, 102.0])
+
+        T = (date(2024, 7, 1) - TODAY).days / 365
+        call = binomial_option_price(102.0, 100.0, T, 0.01, 0.25, 'call', True, 50)
+        self.assertAlmostEqual(results['price'][0], call)
+        self.assertAlmostEqual(results['pnl'][0], 200 * (call - 5.0))
+        put = results['price'][1]
+        self.assertAlmostEqual(results['market_value'][1], -100 * put)
+        # No spot for XYZ; the expired put is worth its intrinsic value
+        self.assertTrue(np.isnan(results['price'][3]))
+        self.assertAlmostEqual(results['price'][4], 8.0)
+
+    def test_greeks(self):
+        results = revalue_chunk(make_positions(), self.market, TODAY, N=50, greeks=True)
+        self.assertGreater(results['delta'][0], 0)
+        self.assertGreater(results['delta'][1], 0)  # short put
+        self.assertEqual(results['gamma'][4], 0.0)
+
+    def test_streams_chunks(self):
+        positions = os.path.join(self.tmp.name, 'positions.parquet')
+        pd.concat([make_positions()] * 4, ignore_index=True).to_parquet(positions, index=False)
+        for output in ('out.csv', 'out.parquet'):
+            output = os.path.join(self.tmp.name, output)
+            report = revalue_file(positions, output, self.market, TODAY, chunk_size=3, N=50)
+            self.assertEqual((report.rows, report.chunks, report.priced, report.missing_market), (20, 7, 16, 4))
+            results = pd.read_csv(output) if output.endswith('.csv') else pd.read_parquet(output)
+            self.assertEqual(len(results), 20)
+            self.assertAlmostEqual(results['pnl'].sum(), report.pnl, places=6)
+            self.assertGreater(report.rows_per_second, 0)
+
+    def test_store_market_and_cli(self):
+        market = StoreMarket(MarketDataStore(FIXTURE_DIR, offline=True))
+        positions = pd.DataFrame({
+            'symbol': ['BENCH', 'BENCH'], 'option_type': ['call', 'put'], 'strike': [100.0, 90.0],
+            'expiration': ['2024-12-20', '2025-01-17'], 'quantity': [1, 1],
+        })
+        results = revalue_chunk(positions, market, VALUATION_DATE, engine='baw')
+        self.assertTrue(np.all(results['sigma'] > 0))
+        self.assertTrue(np.all(results['price'] > 0))
+
+        path = os.path.join(self.tmp.name, 'positions.csv')
+        positions.to_csv(path, index=False)
+        output = os.path.join(self.tmp.name, 'results.csv')
+        argv = [path, output, '--store', FIXTURE_DIR, '--date', VALUATION_DATE.isoformat(), '--engine', 'baw']
+        self.assertEqual(main(argv), 0)
+        np.testing.assert_allclose(pd.read_csv(output)['price'], results['price'])
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            revalue_chunk(make_positions().drop(columns='strike'), self.market, TODAY)
+        with self.assertRaises(ValueError):
+            revalue_file('positions.txt', 'out.csv', self.market)
+        with self.assertRaises(ValueError):
+            revalue_file('positions.csv', 'out.csv', self.market, engine='baw', greeks=True)
+        with self.assertRaises(TypeError):
+            MarketSnapshot()
+
+if __name__ == '__main__':
+    unittest.main()
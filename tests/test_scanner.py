@@ -0,0 +1,107 @@
+# tests/test_scanner.py
+
+import unittest
+from datetime import date
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+from src.calculations.scanner import scan_strategies, _pareto_mask, _undominated_verticals
+from src.pricing.black_scholes import black_scholes_price
+
+def make_chain(S, T, sigma, strikes, option_type, r=0.01):
+    prices = black_scholes_price(S, strikes, T, r, sigma, option_type)
+    return pd.DataFrame({
+        'strike': strikes,
+        'bid': prices * 0.98,
+        'ask': prices * 1.02,
+        'lastPrice': prices,
+        'impliedVolatility': sigma,
+        'openInterest': 100,
+    })
+
+class TestScanner(unittest.TestCase):
+    def setUp(self):
+        self.S = 100.0
+        strikes = np.arange(80.0, 121.0, 5.0)
+        self.chains = {
+            T: (make_chain(self.S, T, 0.25, strikes, 'call'), make_chain(self.S, T, 0.25, strikes, 'put'))
+            for T in (0.1, 0.25, 0.5)
+        }
+
+    def test_candidate_counts_without_pruning(self):
+        result = scan_strategies(self.chains, self.S, prune=False)
+        counts = result.groupby('strategy').size()
+        # 9 strikes give 36 pairs per direction and expiry
+        self.assertEqual(counts['bull_call'], 3 * 36)
+        self.assertEqual(counts['bear_put'], 3 * 36)
+        # 4 strikes below and 4 above the stock price, one-strike wings
+        self.assertEqual(counts['iron_condor'], 3 * 3 * 3)
+        # Every strike for each of the 3 expiry pairs
+        self.assertEqual(counts['call_calendar'], 3 * 9)
+        self.assertTrue(np.all(result['max_loss'] < 0))
+        self.assertTrue(np.all((result['pop'] >= 0) & (result['pop'] <= 1)))
+
+    def test_vertical_pop_matches_d2(self):
+        result = scan_strategies(self.chains, self.S, structures=('vertical',), prune=False)
+        row = result[(result['strategy'] == 'bull_call') & (result['expiration'] == 0.25)
+                     & (result['strikes'] == (95.0, 105.0))].iloc[0]
+        breakeven = 95.0 + row['net_premium'] / 100
+        d2 = (np.log(self.S / breakeven) + (0.01 - 0.5 * 0.25**2) * 0.25) / (0.25 * np.sqrt(0.25))
+        self.assertAlmostEqual(row['pop'], norm.cdf(d2))
+        self.assertAlmostEqual(row['max_loss'], -row['net_premium'])
+        self.assertAlmostEqual(row['max_profit'], 1000 - row['net_premium'])
+
+    def test_pruning_keeps_frontier(self):
+        full = scan_strategies(self.chains, self.S, prune=False)
+        pruned = scan_strategies(self.chains, self.S)
+        self.assertLess(len(pruned), len(full))
+        keys = ['strategy', 'expiration', 'far_expiration']
+        for key, group in pruned.groupby(keys, dropna=False):
+            candidates = full[(full[keys].fillna(-1) == pd.Series(key, index=keys).fillna(-1)).all(axis=1)]
+            for _, row in group.iterrows():
+                dominating = (candidates['pop'] > row['pop']) & (candidates['return_on_risk'] > row['return_on_risk'])
+                self.assertFalse(dominating.any())
+
+    def test_dominated_verticals_dropped_before_scoring(self):
+        # (105, 110) costs 4.0 and (100, 105) costs 3.0: the cheaper bull
+        # call pays at least as much at every price, and so does the bear
+        # call further out that collects the larger credit
+        K = np.array([[100.0, 105.0], [105.0, 110.0], [100.0, 110.0]])
+        weight = np.array([[1.0, -1.0]] * 3)
+        premium = np.array([[10.0, 7.0], [8.0, 4.0], [10.0, 4.0]])
+        np.testing.assert_array_equal(_undominated_verticals('bull_call', K, weight, premium), [True, False, True])
+        np.testing.assert_array_equal(_undominated_verticals('bear_call', K, -weight, premium), [False, True, True])
+
+        # A stale 105 call makes the spreads above it dominated; the frontier
+        # must be the same as pruning after scoring
+        for T, (calls, puts) in self.chains.items():
+            calls.loc[calls['strike'] == 105.0, ['bid', 'ask']] += 0.5
+        full = scan_strategies(self.chains, self.S, structures=('vertical',), prune=False)
+        pruned = scan_strategies(self.chains, self.S, structures=('vertical',))
+        keys = ['strategy', 'expiration']
+        expected = pd.concat([group[_pareto_mask(group['pop'].to_numpy(), group['return_on_risk'].to_numpy())]
+                              for _, group in full.groupby(keys)])
+        self.assertEqual(set(zip(pruned['strategy'], pruned['expiration'], pruned['strikes'])),
+                         set(zip(expected['strategy'], expected['expiration'], expected['strikes'])))
+
+    def test_sorting_and_top(self):
+        result = scan_strategies(self.chains, self.S, sort_by='pop', top=5)
+        self.assertEqual(len(result), 5)
+        self.assertTrue(np.all(np.diff(result['pop']) <= 0))
+
+    def test_date_expirations(self):
+        today = date(2024, 1, 1)
+        chains = {'2024-03-31': self.chains[0.25]}
+        result = scan_strategies(chains, self.S, structures=('vertical',), today=today, prune=False)
+        self.assertEqual(set(result['expiration']), {'2024-03-31'})
+        expired = scan_strategies(chains, self.S, today=date(2024, 6, 1))
+        self.assertTrue(expired.empty)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            scan_strategies(self.chains, self.S, structures=('butterfly',))
+        with self.assertRaises(ValueError):
+            scan_strategies(self.chains, self.S, sort_by='delta')
+
+if __name__ == '__main__':
+    unittest.main()
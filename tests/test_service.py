@@ -0,0 +1,120 @@
+# tests/test_service.py
+
+import asyncio
+import json
+import unittest
+import numpy as np
+from benchmarks.load_test import Connection, run_load
+from src.pricing.batch import batch_option_price
+from src.pricing.cache import PricingCache
+from src.pricing.greeks import batch_greeks
+from src.service import MicroBatcher, PricingService
+
+class TestPricingService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.cache = PricingCache()
+        self.service = await PricingService(port=0, window=0.01, cache=self.cache).start()
+        self.connection = Connection('127.0.0.1', self.service.port)
+
+    async def asyncTearDown(self):
+        await self.connection.close()
+        await self.service.stop()
+
+    async def post(self, path, payload, connection=None):
+        status, content = await (connection or self.connection).request('POST', path, payload)
+        return status, json.loads(content)
+
+    async def test_price_shapes_and_cache(self):
+        status, result = await self.post('/price', {'S': 100, 'K': [[90, 100], [110, 120]], 'T': 0.5,
+                                                    'r': 0.01, 'sigma': 0.2, 'option_type': 'put', 'N': 50})
+        self.assertEqual(status, 200)
+        expected = batch_option_price(100, [[90, 100], [110, 120]], 0.5, 0.01, 0.2, 'put', True, 50)
+        np.testing.assert_allclose(result['price'], expected)
+        self.assertEqual(self.cache.stats()['misses'], 4)
+
+        status, result = await self.post('/price', {'S': 100, 'K': 100, 'T': 0.5, 'r': 0.01, 'sigma': 0.2,
+                                                    'engine': 'baw'})
+        self.assertIsInstance(result['price'], float)
+
+    async def test_concurrent_requests_are_batched(self):
+        strikes = np.linspace(80, 120, 20)
+        connections = [Connection('127.0.0.1', self.service.port) for _ in strikes]
+        payloads = [{'S': 100, 'K': float(K), 'T': 0.5, 'r': 0.01, 'sigma': 0.25, 'N': 50} for K in strikes]
+        try:
+            responses = await asyncio.gather(*(self.post('/greeks', p, c) for p, c in zip(payloads, connections)))
+        finally:
+            await asyncio.gather(*(c.close() for c in connections))
+        self.assertLess(self.service.batcher.batches, len(strikes))
+        expected = batch_greeks(100, strikes, 0.5, 0.01, 0.25, 'call', True, 50)
+        np.testing.assert_allclose([r['delta'] for _, r in responses], expected['delta'])
+        np.testing.assert_allclose([r['price'] for _, r in responses], expected['price'])
+
+    async def test_iv_and_pnl(self):
+        price = float(batch_option_price(100, 105, 0.5, 0.01, 0.3, 'call', True, 100))
+        status, result = await self.post('/iv', {'price': [price, 200.0], 'S': 100, 'K': 105, 'T': 0.5, 'r': 0.01})
+        self.assertEqual(status, 200)
+        self.assertAlmostEqual(result['sigma'][0], 0.3, places=4)
+        self.assertIsNone(result['sigma'][1])
+
+        status, result = await self.post('/pnl', {'S': [95, 105], 'K': 100, 'T': 0.25, 'r': 0.01, 'sigma': 0.2,
+                                                  'engine': 'baw', 'position': 'short', 'entry_price': 3.0,
+                                                  'quantity': 2})
+        np.testing.assert_allclose(result['pnl'], (3.0 - np.array(result['price'])) * 200)
+
+    async def test_errors(self):
+        status, result = await self.post('/price', {'S': 100})
+        self.assertEqual(status, 400)
+        self.assertIn('missing fields', result['error'])
+        status, _ = await self.post('/price', {'S': 100, 'K': 100, 'T': 1, 'r': 0, 'sigma': 0.2, 'option_type': 'x'})
+        self.assertEqual(status, 400)
+        status, _ = await self.post('/unknown', {})
+        self.assertEqual(status, 404)
+        status, _ = await self.connection.request('GET', '/price')
+        self.assertEqual(status, 405)
+        status, content = await self.connection.request('GET', '/health')
+        self.assertEqual(json.loads(content)['status'], 'ok')
+
+    async def test_bad_request_does_not_fail_its_batch(self):
+        good = {'S': 100, 'K': 100, 'T': 0.5, 'r': 0.01, 'sigma': 0.2, 'engine': 'black_scholes'}
+        bad = {**good, 'option_type': 'put'}
+        connection = Connection('127.0.0.1', self.service.port)
+        try:
+            (good_status, result), (bad_status, error) = await asyncio.gather(
+                self.post('/price', good), self.post('/price', bad, connection))
+        finally:
+            await connection.close()
+        self.assertEqual(good_status, 200)
+        self.assertIsInstance(result['price'], float)
+        self.assertEqual(bad_status, 400)
+        self.assertIn('American puts', error['error'])
+        for field, value in (('sigma', -1), ('sigma', 0), ('T', -0.5)):
+            status, error = await self.post('/price', {**good, field: value})
+            self.assertEqual(status, 400)
+            self.assertIn(field, error['error'])
+
+    async def test_batch_failure_is_isolated(self):
+        def compute(key, columns):
+            if np.any(columns['x'] < 0):
+                raise ValueError("x must be non-negative")
+            return {'y': 2 * columns['x']}
+
+        batcher = MicroBatcher(compute, window=0.01)
+        try:
+            good, bad = await asyncio.gather(
+                batcher.submit('key', {'x': np.array([1.0, 2.0])}),
+                batcher.submit('key', {'x': np.array([-1.0])}),
+                return_exceptions=True,
+            )
+        finally:
+            batcher.shutdown()
+        np.testing.assert_allclose(good['y'], [2.0, 4.0])
+        self.assertIsInstance(bad, ValueError)
+
+    async def test_load_test(self):
+        report = await run_load('127.0.0.1', self.service.port, concurrency=4, requests=40, N=20)
+        self.assertEqual((report['requests'], report['errors']), (40, 0))
+        self.assertLessEqual(report['p50_ms'], report['p99_ms'])
+        self.assertGreater(report['requests_per_second'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# tests/test_store.py
+
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from src.data.providers import MarketDataProvider
+from src.data.store import MarketDataStore
+
+class FakeProvider(MarketDataProvider):
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def _count(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("network down")
+
+    def get_spot(self, symbol):
+        self._count()
+        return 150.0 + self.calls
+
+    def get_expirations(self, symbol):
+        self._count()
+        return ('2024-12-20', '2025-01-17')
+
+    def get_option_chain(self, symbol, expiration):
+        self._count()
+        calls = pd.DataFrame({'strike': [100.0, 105.0], 'bid': [5.0, 2.0], 'ask': [5.2, 2.2],
+                              'lastPrice': [5.1, 2.1], 'impliedVolatility': [0.3, 0.28]})
+        return calls, calls.assign(bid=[1.0, 3.0])
+
+class FakeClock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+class TestMarketDataStore(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.fetcher = FakeProvider()
+        self.clock = FakeClock()
+        self.store = MarketDataStore(self.root, provider=self.fetcher, clock=self.clock)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_memory_then_refetch_after_ttl(self):
+        self.assertEqual(self.store.get_spot('aapl'), 151.0)
+        self.assertEqual(self.store.get_spot('AAPL'), 151.0)
+        self.assertEqual(self.fetcher.calls, 1)
+        self.clock.now += 61
+        self.assertEqual(self.store.get_spot('AAPL'), 152.0)
+        self.assertEqual(self.store.reads, {'memory': 1, 'disk': 0, 'fetch': 2})
+        self.assertEqual(len(self.store.snapshots('spot', 'AAPL')), 2)
+
+    def test_disk_round_trip(self):
+        calls, puts = self.store.get_option_chain('AAPL', '2024-12-20')
+        fresh = MarketDataStore(self.root, provider=self.fetcher, clock=self.clock)
+        loaded_calls, loaded_puts = fresh.get_option_chain('AAPL', '2024-12-20')
+        pd.testing.assert_frame_equal(loaded_calls, calls)
+        pd.testing.assert_frame_equal(loaded_puts, puts)
+        self.assertEqual(fresh.reads['disk'], 1)
+        self.assertEqual(self.fetcher.calls, 1)
+
+    def test_offline_replays_snapshots(self):
+        self.store.get_expirations('AAPL')
+        self.clock.now += 10 * 24 * 3600
+        offline = MarketDataStore(self.root, offline=True, provider=self.fetcher, clock=self.clock)
+        self.assertEqual(offline.get_expirations('AAPL'), ('2024-12-20', '2025-01-17'))
+        self.assertIsNone(offline.get_spot('AAPL'))
+        self.assertEqual(offline.get_option_chain('AAPL', '2024-12-20'), (None, None))
+        self.assertEqual(self.fetcher.calls, 1)
+
+    def test_stale_snapshot_served_when_fetch_fails(self):
+        self.store.get_spot('AAPL')
+        self.clock.now += 3600
+        self.fetcher.fail = True
+        self.store.clear_memory()
+        with self.assertLogs('src.data.store', 'WARNING') as logs:
+            self.assertEqual(self.store.get_spot('AAPL'), 151.0)
+            self.assertIsNone(self.store.get_spot('MSFT'))
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn('network down', logs.output[0])
+
+    def test_old_snapshots_pruned(self):
+        # Every snapshot is kept unless pruning is asked for
+        for _ in range(5):
+            self.store.get_spot('MSFT')
+            self.clock.now += 61
+        self.assertEqual(len(self.store.snapshots('spot', 'MSFT')), 5)
+
+        store = MarketDataStore(self.root, keep=3, provider=self.fetcher, clock=self.clock)
+        for _ in range(5):
+            store.get_spot('AAPL')
+            self.clock.now += 61
+        times = store.snapshots('spot', 'AAPL')
+        self.assertEqual(len(times), 3)
+        self.assertEqual(store.load('spot', 'AAPL'), (times[-1], 150.0 + self.fetcher.calls))
+        with self.assertRaises(ValueError):
+            MarketDataStore(self.root, keep=0)
+
+    def test_load_at_time(self):
+        self.store.get_spot('AAPL')
+        first = self.clock.now
+        self.clock.now += 120
+        self.store.get_spot('AAPL')
+        self.assertEqual(self.store.load('spot', 'AAPL', at=first + 60), (first, 151.0))
+        self.assertIsNone(self.store.load('spot', 'AAPL', at=first - 1))
+
+    def test_invalid_ttl(self):
+        with self.assertRaises(ValueError):
+            MarketDataStore(self.root, ttl={'quotes': 5})
+
+if __name__ == '__main__':
+    unittest.main()
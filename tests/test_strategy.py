@@ -0,0 +1,94 @@
+# tests/test_strategy.py
+
+import unittest
+import numpy as np
+from src.calculations.strategy import (
+    OptionLeg, Strategy, vertical_spread, straddle, iron_condor, calendar_spread
+)
+from src.pricing.greeks import batch_greeks
+
+class TestStrategy(unittest.TestCase):
+    def test_invalid_leg(self):
+        with self.assertRaises(ValueError):
+            OptionLeg('call', 100, 0.5, side='sideways')
+        with self.assertRaises(ValueError):
+            OptionLeg('straddle', 100, 0.5)
+        with self.assertRaises(ValueError):
+            Strategy([])
+
+    def test_bull_call_spread_at_expiry(self):
+        spread = vertical_spread('call', 100, 110, 0.5, premiums=(6.0, 2.0))
+        self.assertAlmostEqual(spread.entry_cost, 400.0)
+        pnl = spread.pnl([90, 104, 120])
+        np.testing.assert_allclose(pnl, [-400.0, 0.0, 600.0])
+        np.testing.assert_allclose(spread.breakevens(), [104.0])
+        extremes = spread.extremes()
+        self.assertAlmostEqual(extremes['max_profit'], 600.0)
+        self.assertAlmostEqual(extremes['max_loss'], -400.0)
+
+    def test_straddle_breakevens_and_unbounded_profit(self):
+        position = straddle(100, 0.25, premiums=(4.0, 3.0))
+        np.testing.assert_allclose(position.breakevens(), [93.0, 107.0])
+        extremes = position.extremes()
+        self.assertEqual(extremes['max_profit'], np.inf)
+        self.assertAlmostEqual(extremes['max_loss'], -700.0)
+
+    def test_short_call_unbounded_loss(self):
+        position = Strategy([OptionLeg('call', 100, 0.25, side='short', premium=5.0)])
+        self.assertEqual(position.extremes()['max_loss'], -np.inf)
+        self.assertAlmostEqual(position.extremes()['max_profit'], 500.0)
+
+    def test_iron_condor(self):
+        condor = iron_condor(85, 90, 110, 115, 0.1, premiums=(0.5, 1.5, 1.5, 0.5), quantity=2)
+        self.assertAlmostEqual(condor.entry_cost, -400.0)
+        np.testing.assert_allclose(condor.breakevens(), [88.0, 112.0])
+        extremes = condor.extremes()
+        self.assertAlmostEqual(extremes['max_profit'], 400.0)
+        self.assertAlmostEqual(extremes['max_loss'], -600.0)
+
+    def test_pnl_surface_matches_single_horizon(self):
+        condor = iron_condor(85, 90, 110, 115, 0.25, implied_volatility=0.3)
+        prices = np.linspace(70, 130, 61)
+        horizons = [0.0, 0.1, 0.25]
+        surface = condor.pnl_surface(prices, horizons)
+        self.assertEqual(surface.shape, (3, 61))
+        for row, horizon in zip(surface, horizons):
+            np.testing.assert_allclose(row, condor.pnl(prices, horizon))
+
+    def test_breakevens_before_expiry_are_roots(self):
+        position = straddle(100, 0.5, premiums=(6.0, 5.0), implied_volatility=0.25, engine='black_scholes', american=False)
+        roots = position.breakevens(horizon=0.25)
+        self.assertEqual(len(roots), 2)
+        np.testing.assert_allclose(position.pnl(roots, 0.25), 0.0, atol=1e-6)
+
+    def test_breakevens_converge_superlinearly(self):
+        position = straddle(100, 0.5, premiums=(6.0, 5.0), implied_volatility=0.25, engine='black_scholes', american=False)
+        pnl = position.pnl
+        calls = []
+        def counted(prices, horizon=None):
+            calls.append(prices)
+            return pnl(prices, horizon)
+        position.pnl = counted
+        roots = position.breakevens(horizon=0.25, pnl_tol=1e-9)
+        np.testing.assert_allclose(pnl(roots, 0.25), 0.0, atol=1e-9)
+        # Plain false position keeps one end fixed on the convex P&L and
+        # needs about 50 evaluations; the Illinois step needs a dozen
+        self.assertLessEqual(len(calls), 15)
+
+    def test_calendar_spread_extremes_use_grid(self):
+        calendar = calendar_spread('call', 100, 0.1, 0.35, premiums=(2.0, 4.5), implied_volatility=0.25)
+        extremes = calendar.extremes()
+        # Maximum profit is reached near the strike at the near expiry
+        self.assertGreater(extremes['max_profit'], 0)
+        self.assertAlmostEqual(extremes['max_loss'], -250.0, delta=1.0)
+
+    def test_aggregate_greeks(self):
+        spread = vertical_spread('put', 105, 95, 0.5, implied_volatility=(0.3, 0.35))
+        greeks = spread.greeks(100, N=100)
+        legs = batch_greeks(100, [105, 95], 0.5, 0.01, [0.3, 0.35], 'put', True, 100)
+        for name in ('delta', 'gamma', 'theta', 'vega', 'rho'):
+            self.assertAlmostEqual(greeks[name], 100 * (legs[name][0] - legs[name][1]))
+        self.assertAlmostEqual(greeks['value'], 100 * (legs['price'][0] - legs['price'][1]))
+
+if __name__ == '__main__':
+    unittest.main()
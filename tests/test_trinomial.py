@@ -0,0 +1,87 @@
+# tests/test_trinomial.py
+
+import unittest
+import numpy as np
+from src.pricing.binomial_model import binomial_option_price
+from src.pricing.black_scholes import black_scholes_price
+from src.pricing.engines import option_price
+from src.pricing.trinomial import adaptive_mesh_option_price, trinomial_option_price
+
+class TestTrinomial(unittest.TestCase):
+    def test_european_matches_black_scholes(self):
+        K = np.array([80.0, 95.0, 100.0, 105.0, 130.0])
+        for option_type in ('call', 'put'):
+            expected = black_scholes_price(100, K, 0.5, 0.03, 0.25, option_type)
+            np.testing.assert_allclose(trinomial_option_price(100, K, 0.5, 0.03, 0.25, option_type, False, 400),
+                                       expected, atol=1e-2)
+            np.testing.assert_allclose(adaptive_mesh_option_price(100, K, 0.5, 0.03, 0.25, option_type, False, 100),
+                                       expected, atol=5e-3)
+
+    def test_american_put_matches_reference(self):
+        reference = binomial_option_price(100, 105, 0.5, 0.01, 0.25, 'put', True, 5000, method='bbsr')
+        self.assertAlmostEqual(float(trinomial_option_price(100, 105, 0.5, 0.01, 0.25, 'put', True, 400)),
+                               reference, delta=1e-2)
+        self.assertAlmostEqual(float(adaptive_mesh_option_price(100, 105, 0.5, 0.01, 0.25, 'put', True, 200)),
+                               reference, delta=3e-3)
+        # Early exercise is worth something for a deep in-the-money put
+        self.assertGreater(float(trinomial_option_price(100, 150, 1, 0.05, 0.25, 'put', True)),
+                           float(trinomial_option_price(100, 150, 1, 0.05, 0.25, 'put', False)))
+
+    def test_aligned_lattice_converges_monotonically(self):
+        # With the strike on a node the error shrinks steadily in N
+        expected = black_scholes_price(100, 105, 0.5, 0.01, 0.25, 'put')
+        errors = [abs(float(trinomial_option_price(100, 105, 0.5, 0.01, 0.25, 'put', False, N, extrapolate=False))
+                      - expected) for N in (25, 50, 100, 200, 400)]
+        self.assertEqual(errors, sorted(errors, reverse=True))
+
+    def test_extrapolation_beats_crr(self):
+        # At the same N, the extrapolated lattice is far closer than CRR
+        reference = binomial_option_price(100, 105, 0.5, 0.01, 0.25, 'put', True, 5000, method='bbsr')
+        for N in (50, 100, 200):
+            crr = binomial_option_price(100, 105, 0.5, 0.01, 0.25, 'put', True, N)
+            trinomial = float(trinomial_option_price(100, 105, 0.5, 0.01, 0.25, 'put', True, N))
+            plain = float(trinomial_option_price(100, 105, 0.5, 0.01, 0.25, 'put', True, N, extrapolate=False))
+            self.assertLess(abs(trinomial - reference), abs(crr - reference) / 2)
+            self.assertLess(abs(trinomial - reference), abs(plain - reference))
+
+    def test_adaptive_mesh_converges_monotonically(self):
+        # The error shrinks steadily in N, without jumps as the spot moves
+        # between lattice nodes
+        for american in (False, True):
+            reference = binomial_option_price(100, 105, 0.5, 0.01, 0.25, 'put', american, 5000, method='bbsr')
+            errors = [abs(float(adaptive_mesh_option_price(100, 105, 0.5, 0.01, 0.25, 'put', american, N)) - reference)
+                      for N in range(25, 225, 25)]
+            self.assertEqual(errors, sorted(errors, reverse=True))
+
+    def test_refinement_reduces_error(self):
+        expected = black_scholes_price(100, 100, 0.5, 0.01, 0.25, 'put')
+        errors = [abs(float(adaptive_mesh_option_price(100, 100, 0.5, 0.01, 0.25, 'put', False, 50, levels)) - expected)
+                  for levels in range(4)]
+        self.assertEqual(errors, sorted(errors, reverse=True))
+        self.assertLess(errors[-1], errors[0] / 10)
+
+    def test_broadcasting_matches_single_contracts(self):
+        K = np.array([90.0, 100.0, 110.0])
+        prices = adaptive_mesh_option_price(100, K[:, None], [0.25, 1.0], 0.02, 0.3, 'put', [True, False], 40)
+        self.assertEqual(prices.shape, (3, 2))
+        for i in range(3):
+            for j, (T, american) in enumerate(((0.25, True), (1.0, False))):
+                expected = adaptive_mesh_option_price(100, K[i], T, 0.02, 0.3, 'put', american, 40)
+                self.assertAlmostEqual(prices[i, j], float(expected), places=10)
+
+    def test_engines(self):
+        for engine in ('trinomial', 'adaptive_mesh'):
+            prices = option_price(100, [95, 105], 0.5, 0.01, 0.25, 'call', True, 100, engine)
+            np.testing.assert_allclose(prices, black_scholes_price(100, np.array([95, 105]), 0.5, 0.01, 0.25, 'call'),
+                                       atol=2e-2)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            trinomial_option_price(100, 100, 0.5, 0.01, 0.25, N=0)
+        with self.assertRaises(ValueError):
+            adaptive_mesh_option_price(100, 100, 0.5, 0.01, 0.25, levels=-1)
+        with self.assertRaises(ValueError):
+            trinomial_option_price(100, 100, 0.5, 0.01, 0.25, 'straddle')
+
+if __name__ == '__main__':
+    unittest.main()
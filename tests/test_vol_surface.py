@@ -0,0 +1,104 @@
+# tests/test_vol_surface.py
+
+import unittest
+import numpy as np
+import pandas as pd
+from src.calculations.pnl import pnl_surface
+from src.data.chain import OptionChain
+from src.pricing.vol_surface import VolatilitySurface, fit_svi, _svi
+
+S = 100.0
+R = 0.01
+PARAMS = {0.25: (0.004, 0.08, -0.4, 0.02, 0.15), 1.0: (0.02, 0.12, -0.3, 0.05, 0.25)}
+
+def smile_chain(T, params, strikes=np.arange(60.0, 145.0, 2.5)):
+    k = np.log(strikes / (S * np.exp(R * T)))
+    iv = np.sqrt(_svi(k, *params) / T)
+    frame = pd.DataFrame({'strike': strikes, 'bid': 1.0, 'ask': 1.1, 'lastPrice': 1.05,
+                          'volume': 10, 'openInterest': 100, 'impliedVolatility': iv})
+    return frame, frame.copy()
+
+class TestVolatilitySurface(unittest.TestCase):
+    def setUp(self):
+        self.chains = {T: smile_chain(T, params) for T, params in PARAMS.items()}
+        self.surface = VolatilitySurface(S, R)
+        self.surface.update(self.chains)
+
+    def test_fit_recovers_smile(self):
+        for T, params in PARAMS.items():
+            smile = self.surface.slices[T]
+            self.assertLess(smile.rmse, 1e-6)
+            K = np.array([70.0, 100.0, 130.0])
+            k = np.log(K / (S * np.exp(R * T)))
+            expected = np.sqrt(_svi(k, *params) / T)
+            np.testing.assert_allclose(self.surface.sigma(K, T), expected, rtol=1e-5)
+
+    def test_interpolates_total_variance(self):
+        K, T = 100.0, 0.5
+        sigma = self.surface.sigma(K, T)
+        w_short = self.surface.sigma(K, 0.25)**2 * 0.25
+        w_long = self.surface.sigma(K, 1.0)**2
+        self.assertGreater(sigma**2 * T, min(w_short, w_long) * 0.9)
+        self.assertLess(sigma**2 * T, max(w_short, w_long) * 1.1)
+        # Flat extrapolation in implied volatility outside the fitted expiries
+        smile = self.surface.slices[1.0]
+        k = np.log(K / (S * np.exp(R * 2.0)))
+        self.assertAlmostEqual(float(self.surface.sigma(K, 2.0)), np.sqrt(smile.total_variance(k) / 1.0))
+
+    def test_vectorized_grid(self):
+        K = np.linspace(70, 130, 200)[np.newaxis, :]
+        T = np.linspace(0.1, 1.5, 50)[:, np.newaxis]
+        grid = self.surface.sigma(K, T)
+        self.assertEqual(grid.shape, (50, 200))
+        self.assertTrue(np.all(np.isfinite(grid)) and np.all(grid > 0))
+        self.assertAlmostEqual(grid[10, 50], float(self.surface.sigma(K[0, 50], T[10, 0])))
+
+    def test_incremental_refit(self):
+        fits = self.surface.fits
+        self.assertEqual(self.surface.update(self.chains), [])
+        self.assertEqual(self.surface.fits, fits)
+
+        calls, puts = smile_chain(1.0, (0.03, 0.12, -0.3, 0.05, 0.25))
+        changed = {**self.chains, 1.0: (OptionChain.from_frame(calls), OptionChain.from_frame(puts))}
+        self.assertEqual(self.surface.update(changed), [1.0])
+        self.assertLess(self.surface.slices[1.0].rmse, 1e-6)
+
+    def test_thin_expiry_is_flat_and_expired_removed(self):
+        calls, puts = smile_chain(0.1, PARAMS[0.25], strikes=np.array([95.0, 105.0]))
+        self.surface.update({0.1: (calls, puts), 0.25: (None, None)})
+        np.testing.assert_allclose(self.surface.sigma([80.0, 120.0], 0.1), self.surface.sigma(100.0, 0.1))
+        self.assertNotIn(0.25, self.surface)
+        self.assertEqual(len(self.surface), 2)
+
+    def test_expiry_without_quotes_skipped(self):
+        calls, puts = smile_chain(0.5, PARAMS[0.25])
+        calls['impliedVolatility'] = puts['impliedVolatility'] = 0.0
+        self.assertEqual(self.surface.update({**self.chains, 0.5: (calls, puts)}), [])
+        self.assertNotIn(0.5, self.surface)
+        self.assertTrue(np.all(self.surface.sigma([80.0, 100.0, 120.0], 0.5) > 0))
+        # An expiry whose quotes all vanish is dropped
+        self.surface.update({1.0: (calls, puts)})
+        self.assertNotIn(1.0, self.surface)
+        with self.assertRaises(ValueError):
+            fit_svi([], [], 0.5)
+
+    def test_empty_surface(self):
+        with self.assertRaises(ValueError):
+            VolatilitySurface(S).sigma(100.0, 0.5)
+
+    def test_fit_svi_direct(self):
+        k = np.linspace(-0.4, 0.3, 30)
+        smile = fit_svi(k, _svi(k, *PARAMS[1.0]), 1.0)
+        np.testing.assert_allclose(smile.total_variance(k), _svi(k, *PARAMS[1.0]), atol=1e-8)
+
+    def test_pnl_surface_uses_surface(self):
+        days = np.array([0.0, 90.0, 365.0])
+        prices = np.linspace(80, 120, 5)
+        surface_pnl = pnl_surface(prices, days, 110.0, 2.0, volatility_surface=self.surface)
+        sigma = self.surface.sigma(110.0, 90 / 365)
+        flat_pnl = pnl_surface(prices, [90.0], 110.0, 2.0, implied_volatility=float(sigma))
+        np.testing.assert_allclose(surface_pnl[1], flat_pnl[0])
+        np.testing.assert_allclose(surface_pnl[0], pnl_surface(prices, [0], 110.0, 2.0)[0])
+
+if __name__ == '__main__':
+    unittest.main()